@@ -16,3 +16,5 @@ from .celery import app as celery_app
 
 
 __all__ = (celery_app)
+
+default_app_config = "app.apps.SilverbackConfig"
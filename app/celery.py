@@ -19,6 +19,8 @@ from importlib import import_module
 # Third Party Library
 from celery import Celery
 from celery.signals import task_success
+from celery.signals import worker_shutdown
+from celery.signals import worker_process_shutdown
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "app.settings.basic")
 
@@ -34,25 +36,19 @@ app.autodiscover_tasks()
 
 @task_success.connect
 def after_task(sender=None, result=None, **kwargs):
-    if sender.request.id and "status" in result and "result" in result:
+    if not getattr(sender, "tracked", True):
+        # Fire-and-forget tasks have no task row to update
+        return
+
+    if sender.request.id and isinstance(result, dict) and "status" in result and "result" in result:
         task_module = import_module("app.modules.core.task")
         task_class = getattr(task_module, "Task")
 
-        notification_module = import_module("app.modules.core.notification")
-        notification_class = getattr(notification_module, "Notification")
-
-        task_class().update_task_with_uuid(
-            sender.request.id,
-            {
-                "status": result["status"],
-                "result": result["result"]
-            }
-        )
+        task_class().buffer_result(sender.request.id, result)
 
-        task = task_class().get_task_with_uuid(sender.request.id)
 
-        if task and "notify_type" in result:
-            notification_class().update_task_notification(
-                task.id,
-                result["notify_type"]
-            )
+@worker_shutdown.connect
+@worker_process_shutdown.connect
+def flush_task_results(**kwargs):
+    task_module = import_module("app.modules.core.task")
+    getattr(task_module, "Task")().flush_results()
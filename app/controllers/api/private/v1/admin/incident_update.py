@@ -24,6 +24,7 @@ from django.utils.translation import gettext as _
 from app.modules.util.helpers import Helpers
 from app.modules.core.request import Request
 from app.modules.core.response import Response
+from app.modules.core.outbox import Outbox
 from app.modules.core.task import Task as Task_Module
 from app.modules.validation.extension import ExtraRules
 from app.modules.core.decorators import allow_if_authenticated
@@ -32,7 +33,6 @@ from app.modules.core.subscriber import Subscriber as SubscriberModule
 from app.modules.core.notification import Notification as NotificationModule
 from app.modules.core.incident_update import IncidentUpdate as IncidentUpdateModule
 from app.modules.core.incident_update_component import IncidentUpdateComponent as IncidentUpdateComponentModule
-from app.modules.core.incident_update_notification import IncidentUpdateNotification as IncidentUpdateNotificationModule
 
 
 class IncidentUpdates(View):
@@ -48,7 +48,6 @@ class IncidentUpdates(View):
         self.__task = Task_Module()
         self.__notification = NotificationModule()
         self.__subscriber = SubscriberModule()
-        self.__incident_update_notification = IncidentUpdateNotificationModule()
         self.__logger = self.__helpers.get_logger(__name__)
         self.__user_id = None
         self.__correlation_id = ""
@@ -178,11 +177,9 @@ class IncidentUpdates(View):
 
         for update in updates:
 
-            notified_subscribers = self.__incident_update_notification.count_by_update_status(
-                update.id,
-                IncidentUpdateNotificationModule.SUCCESS
-            )
-            progress = int(notified_subscribers/update.total_suscribers) * 100 if update.total_suscribers > 0 else 0
+            # Coalesced subscribers got this update within the message of a later one
+            delivered = update.sent_notifications + update.coalesced_notifications
+            progress = int(delivered * 100 / update.total_suscribers) if update.total_suscribers > 0 else 0
 
             updates_list.append({
                 "id": update.id,
@@ -321,7 +318,7 @@ class IncidentUpdatesNotify(View):
         self.__helpers = Helpers()
         self.__form = Form()
         self.__incident_update = IncidentUpdateModule()
-        self.__task = Task_Module()
+        self.__outbox = Outbox()
         self.__notification = NotificationModule()
         self.__subscriber = SubscriberModule()
         self.__logger = self.__helpers.get_logger(__name__)
@@ -335,25 +332,20 @@ class IncidentUpdatesNotify(View):
         self.__correlation_id = request.META["X-Correlation-ID"] if "X-Correlation-ID" in request.META else ""
         self.__user_id = request.user.id
 
-        task = self.__task.delay("incident_update", {
+        # The relay publishes the task once this request committed
+        task = self.__outbox.enqueue("incident_update", {
             "incident_update_id": update_id,
             "user_id": self.__user_id
-        }, self.__user_id)
-
-        result = False
+        }, self.__user_id, "incident_update:%d" % update_id, {
+            "highlight": "Incident Update",
+            "notification": "notifying subscribers with the incident update",
+            "url": "#",
+            "type": NotificationModule.PENDING,
+            "delivered": False,
+            "user_id": self.__user_id
+        })
 
         if task:
-            result = self.__notification.create_notification({
-                "highlight": "Incident Update",
-                "notification": "notifying subscribers with the incident update",
-                "url": "#",
-                "type": NotificationModule.PENDING,
-                "delivered": False,
-                "user_id": self.__user_id,
-                "task_id": task.id
-            })
-
-        if task and result:
             return JsonResponse(self.__response.send_private_success([{
                 "type": "success",
                 "message": _("Notification delivery started successfully.")
@@ -365,6 +357,48 @@ class IncidentUpdatesNotify(View):
             }], {}, self.__correlation_id))
 
 
+class IncidentUpdatesRedrive(View):
+    """Re-drive Dead-Lettered Notifications of Incident Update Private Endpoint Controller"""
+
+    def __init__(self):
+        self.__response = Response()
+        self.__helpers = Helpers()
+        self.__outbox = Outbox()
+        self.__logger = self.__helpers.get_logger(__name__)
+        self.__user_id = None
+        self.__correlation_id = ""
+
+    @allow_if_authenticated
+    def post(self, request, incident_id, update_id):
+
+        self.__correlation_id = request.META["X-Correlation-ID"] if "X-Correlation-ID" in request.META else ""
+        self.__user_id = request.user.id
+
+        # The relay publishes the task once this request committed
+        task = self.__outbox.enqueue("redrive_notifications", {
+            "incident_update_id": update_id,
+            "user_id": self.__user_id
+        }, self.__user_id, "redrive_notifications:%d" % update_id, {
+            "highlight": "Incident Update",
+            "notification": "re-driving dead-lettered notifications of the incident update",
+            "url": "#",
+            "type": NotificationModule.PENDING,
+            "delivered": False,
+            "user_id": self.__user_id
+        })
+
+        if task:
+            return JsonResponse(self.__response.send_private_success([{
+                "type": "success",
+                "message": _("Dead-lettered notifications re-drive started successfully.")
+            }], {}, self.__correlation_id))
+        else:
+            return JsonResponse(self.__response.send_private_failure([{
+                "type": "error",
+                "message": _("Error! Something goes wrong while starting re-drive.")
+            }], {}, self.__correlation_id))
+
+
 class IncidentUpdatesComponents(View):
     """Link Component to Incident Update Private Endpoint Controller"""
 
@@ -0,0 +1,61 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third Party Library
+from django.views import View
+from django.http import HttpResponse
+from django.utils.http import parse_etags
+from django.http import HttpResponseNotModified
+
+# Local Library
+from app.modules.core.public_status import PublicStatus
+from app.modules.core.decorators import redirect_if_not_installed
+
+
+class StatusDocument(View):
+    """Public Status Document Endpoint Controller"""
+
+    document = None
+
+    @redirect_if_not_installed
+    def get(self, request):
+        document = PublicStatus().get_document(self.document)
+        etags = parse_etags(request.META.get("HTTP_IF_NONE_MATCH", ""))
+
+        if "*" in etags or document["etag"] in etags:
+            response = HttpResponseNotModified()
+        else:
+            response = HttpResponse(document["body"], content_type="application/json")
+
+        response["ETag"] = document["etag"]
+        response["Cache-Control"] = "no-cache"
+        return response
+
+
+class Summary(StatusDocument):
+    """Status Summary Public Endpoint Controller"""
+
+    document = "summary"
+
+
+class Components(StatusDocument):
+    """Components Status Public Endpoint Controller"""
+
+    document = "components"
+
+
+class Incidents(StatusDocument):
+    """Recent Incidents Public Endpoint Controller"""
+
+    document = "incidents"
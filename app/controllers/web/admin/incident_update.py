@@ -30,7 +30,6 @@ from app.modules.core.component import Component as ComponentModule
 from app.modules.core.component_group import ComponentGroup as ComponentGroupModule
 from app.modules.core.incident_update import IncidentUpdate as IncidentUpdateModule
 from app.modules.core.incident_update_component import IncidentUpdateComponent as IncidentUpdateComponentModule
-from app.modules.core.incident_update_notification import IncidentUpdateNotification as IncidentUpdateNotificationModule
 
 
 class IncidentUpdateAdd(View):
@@ -75,7 +74,6 @@ class IncidentUpdateView(View):
         self.__incident_update_component = IncidentUpdateComponentModule()
         self.__component = ComponentModule()
         self.__component_group = ComponentGroupModule()
-        self.__incident_update_notification = IncidentUpdateNotificationModule()
         self.__correlation_id = request.META["X-Correlation-ID"] if "X-Correlation-ID" in request.META else ""
         incident = self.__incident.get_one_by_id(incident_id)
 
@@ -89,14 +87,10 @@ class IncidentUpdateView(View):
 
         update["datetime"] = update["datetime"].strftime("%b %d %Y %H:%M:%S")
         update["message"] = markdown2.markdown(update["message"])
-        update["notified_subscribers"] = self.__incident_update_notification.count_by_update_status(
-            update["id"],
-            IncidentUpdateNotificationModule.SUCCESS
-        )
-        update["failed_subscribers"] = self.__incident_update_notification.count_by_update_status(
-            update["id"],
-            IncidentUpdateNotificationModule.FAILED
-        )
+        update["notified_subscribers"] = update["sent_notifications"]
+        update["failed_subscribers"] = update["failed_notifications"]
+        update["dead_subscribers"] = update["dead_notifications"]
+        update["coalesced_subscribers"] = update["coalesced_notifications"]
 
         components = self.__format_components(self.__component.get_all())
         affected_components = self.__format_affected_components(self.__incident_update_component.get_all(update_id))
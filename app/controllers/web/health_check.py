@@ -55,5 +55,7 @@ class HealthCheck(View):
             })
 
         return JsonResponse(self.__response.send({
-            "status": status
+            "status": status,
+            "rate_limits": self.__health.get_rate_limits(),
+            "outbox": self.__health.get_outbox_stats()
         }, self.__correlation_id), status=200 if status == Health.OK else 503)
@@ -23,6 +23,8 @@ from django.shortcuts import render
 # Local Library
 from app.modules.core.context import Context
 from app.modules.entity.option_entity import OptionEntity
+from app.modules.core.page_cache import PageCache
+from app.modules.core.decorators import serve_from_page_cache
 from app.modules.core.decorators import redirect_if_not_installed
 from app.modules.core.status_page import StatusPage as StatusPageModule
 
@@ -31,8 +33,10 @@ class StatusPageIndex(View):
     """Status Page Index Page Controller"""
 
     template_name = 'templates/status_page_index.html'
+    page_cache_scopes = [PageCache.METRICS]
 
     @redirect_if_not_installed
+    @serve_from_page_cache
     def get(self, request):
 
         self.__correlation_id = request.META["X-Correlation-ID"] if "X-Correlation-ID" in request.META else ""
@@ -62,6 +66,7 @@ class StatusPageHistory(View):
     template_name = 'templates/status_page_history.html'
 
     @redirect_if_not_installed
+    @serve_from_page_cache
     def get(self, request, period):
 
         self.__correlation_id = request.META["X-Correlation-ID"] if "X-Correlation-ID" in request.META else ""
@@ -100,6 +105,7 @@ class StatusPageSingle(View):
     template_name = 'templates/status_page_single.html'
 
     @redirect_if_not_installed
+    @serve_from_page_cache
     def get(self, request, uri):
 
         self.__correlation_id = request.META["X-Correlation-ID"] if "X-Correlation-ID" in request.META else ""
@@ -0,0 +1,103 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import time
+
+# Third Party Library
+from django.core.management.base import BaseCommand, CommandError
+
+# Local Library
+from app.tasks.notify_subscriber import notify_subscribers
+from app.tasks.retry_notifications import retry_notifications
+from app.tasks.retry_notifications import redrive_notifications
+from app.modules.core.incident_update import IncidentUpdate as IncidentUpdateModule
+from app.modules.core.incident_update_notification import IncidentUpdateNotification as IncidentUpdateNotificationModule
+
+
+class Command(BaseCommand):
+
+    help = "Maintain Silverback Subscribers Notifications!"
+
+    available = [
+        "retry",
+        "redrive",
+        "reconcile",
+        "work",
+        "depth"
+    ]
+
+    def add_arguments(self, parser):
+        """Config Command Args"""
+        parser.add_argument('command', type=str, nargs='+', help='Available commands are %s' % ", ".join(self.available))
+        parser.add_argument('--update', type=int, help='Incident update ID to re-drive or reconcile, reconcile defaults to all updates')
+        parser.add_argument('--once', action='store_true', help='Stop working once no notification is left to claim')
+
+    def handle(self, *args, **options):
+        """Command Handle"""
+        if len(options['command']) == 0 or options['command'][0] not in self.available:
+            raise CommandError('Command Does not exist! Please use one of the following: python manage.py notifications [%s]' % ", ".join(self.available))
+
+        command = options['command'][0]
+
+        if command == "retry":
+            result = retry_notifications()
+            self.stdout.write(self.style.SUCCESS('Queued due retries: %s' % result["result"]))
+
+        elif command == "redrive":
+            if options['update'] is None:
+                raise CommandError('Please provide the incident update: python manage.py notifications redrive --update=<id>')
+            result = redrive_notifications(options['update'])
+            self.stdout.write(self.style.SUCCESS('Re-drove dead-lettered notifications: %s' % result["result"]))
+
+        elif command == "reconcile":
+            incident_update_notification_module = IncidentUpdateNotificationModule()
+
+            if options['update'] is not None:
+                counts = incident_update_notification_module.reconcile_counters(options['update'])
+                self.stdout.write(self.style.SUCCESS('Reconciled incident update %d counters: %s' % (options['update'], counts)))
+                return
+
+            incident_update_module = IncidentUpdateModule()
+            reconciled = 0
+            after_id = 0
+            while True:
+                update_ids = incident_update_module.get_ids(after_id)
+                if len(update_ids) == 0:
+                    break
+                for update_id in update_ids:
+                    incident_update_notification_module.reconcile_counters(update_id)
+                reconciled += len(update_ids)
+                after_id = update_ids[-1]
+
+            self.stdout.write(self.style.SUCCESS('Reconciled counters of %d incident updates' % reconciled))
+
+        elif command == "work":
+            incident_update_notification_module = IncidentUpdateNotificationModule()
+            batch_size = int(os.getenv("NOTIFICATION_BATCH_SIZE", 50))
+            interval = float(os.getenv("NOTIFICATION_POLL_INTERVAL", 1))
+
+            while True:
+                notification_ids = incident_update_notification_module.claim_ids(batch_size)
+                if len(notification_ids) > 0:
+                    result = notify_subscribers(notification_ids)
+                    self.stdout.write('Delivered claimed notifications: %s' % result["result"])
+                elif options['once']:
+                    break
+                else:
+                    time.sleep(interval)
+
+        elif command == "depth":
+            self.stdout.write('Notifications waiting for delivery: %d' % IncidentUpdateNotificationModule().count_claimable())
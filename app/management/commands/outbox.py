@@ -0,0 +1,62 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import time
+
+# Third Party Library
+from django.core.management.base import BaseCommand, CommandError
+
+# Local Library
+from app.modules.core.outbox import Outbox
+
+
+class Command(BaseCommand):
+
+    help = "Relay Silverback Outbox Messages to the Broker!"
+
+    available = [
+        "relay",
+        "stats"
+    ]
+
+    def add_arguments(self, parser):
+        """Config Command Args"""
+        parser.add_argument('command', type=str, nargs='+', help='Available commands are %s' % ", ".join(self.available))
+        parser.add_argument('--once', action='store_true', help='Relay pending messages once and exit')
+
+    def handle(self, *args, **options):
+        """Command Handle"""
+        if len(options['command']) == 0 or options['command'][0] not in self.available:
+            raise CommandError('Command Does not exist! Please use one of the following: python manage.py outbox [%s]' % ", ".join(self.available))
+
+        command = options['command'][0]
+        outbox = Outbox()
+
+        if command == "relay":
+            interval = float(os.getenv("OUTBOX_RELAY_INTERVAL", 1))
+            while True:
+                published = outbox.relay()
+                if published > 0:
+                    self.stdout.write('Published %d outbox messages' % published)
+                elif options['once']:
+                    break
+                else:
+                    outbox.delete_published()
+                    time.sleep(interval)
+
+        elif command == "stats":
+            stats = outbox.get_stats()
+            self.stdout.write('Pending: %d, failed: %d, lag: %ss' % (stats["pending"], stats["failed"], stats["lag"]))
@@ -0,0 +1,40 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third Party Library
+from django.core.management.base import BaseCommand
+
+# Local Library
+from app.modules.util.rate_limiter import RateLimiter
+
+
+class Command(BaseCommand):
+
+    help = "Show Silverback Notifications Rate Limiters Fill Levels!"
+
+    def handle(self, *args, **options):
+        """Command Handle"""
+        levels = RateLimiter.get_levels()
+
+        if len(levels) == 0:
+            self.stdout.write("No rate limiter used yet")
+
+        for name, level in levels.items():
+            self.stdout.write("%s: %s/%s tokens (%d%%) refilled at %s/s" % (
+                name,
+                level["tokens"],
+                level["burst"],
+                level["fill"] * 100,
+                level["rate"]
+            ))
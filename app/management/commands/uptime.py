@@ -0,0 +1,57 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+from datetime import timedelta
+
+# Third Party Library
+from django.utils import timezone
+from django.core.management.base import BaseCommand, CommandError
+
+# Local Library
+from app.modules.core.uptime import Uptime
+from app.modules.util.helpers import Helpers
+
+
+class Command(BaseCommand):
+
+    help = "Maintain Silverback Uptime Rollup!"
+
+    available = [
+        "rollup",
+        "rebuild"
+    ]
+
+    def add_arguments(self, parser):
+        """Config Command Args"""
+        parser.add_argument('command', type=str, nargs='+', help='Available commands are %s' % ", ".join(self.available))
+        parser.add_argument('--days', type=int, default=90, help='Number of days to rebuild')
+
+    def handle(self, *args, **options):
+        """Command Handle"""
+        if len(options['command']) == 0 or options['command'][0] not in self.available:
+            raise CommandError('Command Does not exist! Please use one of the following: python manage.py uptime [%s]' % ", ".join(self.available))
+
+        command = options['command'][0]
+        uptime = Uptime()
+
+        if command == "rollup":
+            result = uptime.rollup()
+            self.stdout.write(self.style.SUCCESS('Uptime rolled up from %s to %s' % (result["from"], result["to"])))
+
+        elif command == "rebuild":
+            today = Helpers().local_date(timezone.now())
+            uptime.mark_dirty(Helpers().day_start(today - timedelta(days=options['days'] - 1)))
+            result = uptime.rollup()
+            self.stdout.write(self.style.SUCCESS('Uptime rebuilt from %s to %s' % (result["from"], result["to"])))
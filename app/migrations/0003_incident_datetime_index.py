@@ -0,0 +1,18 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0002_status_snapshot'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='incident',
+            name='datetime',
+            field=models.DateTimeField(db_index=True, verbose_name='Datetime'),
+        ),
+    ]
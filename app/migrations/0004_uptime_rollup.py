@@ -0,0 +1,37 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:04
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0003_incident_datetime_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UptimeRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(db_index=True, verbose_name='Day')),
+                ('major_outage', models.PositiveIntegerField(default=0, verbose_name='Major Outage Minutes')),
+                ('partial_outage', models.PositiveIntegerField(default=0, verbose_name='Partial Outage Minutes')),
+                ('degraded_performance', models.PositiveIntegerField(default=0, verbose_name='Degraded Performance Minutes')),
+                ('maintenance', models.PositiveIntegerField(default=0, verbose_name='Maintenance Minutes')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+                ('component', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='app.Component', verbose_name='Related Component')),
+                ('group', models.ForeignKey(
+                    null=True,
+                    on_delete=django.db.models.deletion.CASCADE,
+                    to='app.ComponentGroup',
+                    verbose_name='Related Component Group'
+                )),
+            ],
+            options={
+                'db_table': 'app_uptime_rollup',
+            },
+        ),
+    ]
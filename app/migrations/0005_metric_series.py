@@ -0,0 +1,29 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:09
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0004_uptime_rollup'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MetricSeries',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('day', 'DAY'), ('week', 'WEEK'), ('month', 'MONTH')], max_length=10, verbose_name='Period')),
+                ('points', models.TextField(verbose_name='Points')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+                ('metric', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='app.Metric', verbose_name='Related Metric')),
+            ],
+            options={
+                'db_table': 'app_metric_series',
+                'unique_together': {('metric', 'period')},
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0005_metric_series'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='metricseries',
+            name='points',
+        ),
+        migrations.AddField(
+            model_name='metricseries',
+            name='timestamps',
+            field=models.BinaryField(default=b'', verbose_name='Timestamps'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='metricseries',
+            name='values',
+            field=models.BinaryField(default=b'', verbose_name='Values'),
+            preserve_default=False,
+        ),
+    ]
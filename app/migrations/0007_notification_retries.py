@@ -0,0 +1,38 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_metric_series_arrays'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentupdatenotification',
+            name='attempts',
+            field=models.PositiveIntegerField(default=0, verbose_name='Attempts'),
+        ),
+        migrations.AddField(
+            model_name='incidentupdatenotification',
+            name='last_error',
+            field=models.TextField(blank=True, default='', verbose_name='Last Error'),
+        ),
+        migrations.AddField(
+            model_name='incidentupdatenotification',
+            name='next_attempt_at',
+            field=models.DateTimeField(db_index=True, null=True, verbose_name='Next Attempt at'),
+        ),
+        migrations.AlterField(
+            model_name='incidentupdatenotification',
+            name='status',
+            field=models.CharField(
+                choices=[('pending', 'PENDING'), ('failed', 'FAILED'), ('success', 'SUCCESS'), ('dead', 'DEAD')],
+                default='pending',
+                max_length=50,
+                verbose_name='Status'
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:29
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def fill_counters(apps, schema_editor):
+    IncidentUpdate = apps.get_model('app', 'IncidentUpdate')
+    IncidentUpdateNotification = apps.get_model('app', 'IncidentUpdateNotification')
+    fields = {
+        'pending': 'pending_notifications',
+        'success': 'sent_notifications',
+        'failed': 'failed_notifications',
+        'dead': 'dead_notifications',
+    }
+    counts = {}
+
+    rows = IncidentUpdateNotification.objects.values('incident_update_id', 'status').annotate(count=Count('id')).order_by()
+    for row in rows:
+        if row['incident_update_id'] is not None and row['status'] in fields:
+            counts.setdefault(row['incident_update_id'], {})[fields[row['status']]] = row['count']
+
+    for update_id, update_counts in counts.items():
+        IncidentUpdate.objects.filter(id=update_id).update(**update_counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_notification_retries'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentupdate',
+            name='dead_notifications',
+            field=models.IntegerField(default=0, verbose_name='Dead-Lettered Notifications'),
+        ),
+        migrations.AddField(
+            model_name='incidentupdate',
+            name='failed_notifications',
+            field=models.IntegerField(default=0, verbose_name='Failed Notifications'),
+        ),
+        migrations.AddField(
+            model_name='incidentupdate',
+            name='pending_notifications',
+            field=models.IntegerField(default=0, verbose_name='Pending Notifications'),
+        ),
+        migrations.AddField(
+            model_name='incidentupdate',
+            name='sent_notifications',
+            field=models.IntegerField(default=0, verbose_name='Sent Notifications'),
+        ),
+        migrations.RunPython(fill_counters, migrations.RunPython.noop),
+    ]
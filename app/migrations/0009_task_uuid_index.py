@@ -0,0 +1,18 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0008_incident_update_counters'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='task',
+            name='uuid',
+            field=models.CharField(db_index=True, max_length=200, verbose_name='UUID'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0009_task_uuid_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutboxMessage',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('uuid', models.CharField(max_length=200, unique=True, verbose_name='UUID')),
+                ('task', models.CharField(max_length=200, verbose_name='Task')),
+                ('parameters', models.TextField(verbose_name='Parameters')),
+                ('dedup_key', models.CharField(blank=True, db_index=True, default='', max_length=200, verbose_name='Deduplication Key')),
+                ('status', models.CharField(
+                    choices=[('pending', 'PENDING'), ('published', 'PUBLISHED')],
+                    db_index=True,
+                    default='pending',
+                    max_length=50,
+                    verbose_name='Status'
+                )),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Attempts')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='Last Error')),
+                ('published_at', models.DateTimeField(null=True, verbose_name='Published at')),
+                ('created_at', models.DateTimeField(auto_now_add=True, verbose_name='Created at')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated at')),
+            ],
+            options={
+                'db_table': 'app_outbox_message',
+            },
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0010_outbox_message'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='incidentupdatenotification',
+            index=models.Index(fields=['status', 'next_attempt_at'], name='app_iun_status_next_idx'),
+        ),
+    ]
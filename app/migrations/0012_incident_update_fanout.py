@@ -0,0 +1,33 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:36
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0011_notification_claim_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentupdate',
+            name='fanout_finished_at',
+            field=models.DateTimeField(null=True, verbose_name='Fan-out Finished at'),
+        ),
+        migrations.AddField(
+            model_name='incidentupdate',
+            name='fanout_partitions',
+            field=models.IntegerField(default=0, verbose_name='Fan-out Partitions'),
+        ),
+        migrations.AddField(
+            model_name='incidentupdate',
+            name='fanout_partitions_done',
+            field=models.IntegerField(default=0, verbose_name='Fan-out Partitions Done'),
+        ),
+        migrations.AddField(
+            model_name='incidentupdate',
+            name='fanout_started_at',
+            field=models.DateTimeField(null=True, verbose_name='Fan-out Started at'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 2.2.9 on 2026-10-18 03:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0012_incident_update_fanout'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incidentupdate',
+            name='coalesced_notifications',
+            field=models.IntegerField(default=0, verbose_name='Coalesced Notifications'),
+        ),
+        migrations.AlterField(
+            model_name='incidentupdatenotification',
+            name='status',
+            field=models.CharField(
+                choices=[('pending', 'PENDING'), ('failed', 'FAILED'), ('success', 'SUCCESS'), ('dead', 'DEAD'), ('coalesced', 'COALESCED')],
+                default='pending',
+                max_length=50,
+                verbose_name='Status'
+            ),
+        ),
+    ]
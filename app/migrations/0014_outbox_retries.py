@@ -0,0 +1,29 @@
+# Generated by Django 2.2.9 on 2026-10-18 04:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0013_notification_coalescing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='outboxmessage',
+            name='next_attempt_at',
+            field=models.DateTimeField(null=True, verbose_name='Next Attempt at'),
+        ),
+        migrations.AlterField(
+            model_name='outboxmessage',
+            name='status',
+            field=models.CharField(
+                choices=[('pending', 'PENDING'), ('published', 'PUBLISHED'), ('failed', 'FAILED')],
+                db_index=True,
+                default='pending',
+                max_length=50,
+                verbose_name='Status'
+            ),
+        ),
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 2.2.9 on 2026-10-18 04:05
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def delete_duplicates(apps, schema_editor):
+    IncidentUpdate = apps.get_model('app', 'IncidentUpdate')
+    IncidentUpdateNotification = apps.get_model('app', 'IncidentUpdateNotification')
+    fields = {
+        'pending': 'pending_notifications',
+        'success': 'sent_notifications',
+        'failed': 'failed_notifications',
+        'dead': 'dead_notifications',
+        'coalesced': 'coalesced_notifications',
+    }
+    # Keep the most advanced notification of a subscriber
+    priority = ['success', 'coalesced', 'dead', 'failed', 'pending']
+
+    duplicates = IncidentUpdateNotification.objects.exclude(incident_update_id=None).exclude(subscriber_id=None).values(
+        'incident_update_id',
+        'subscriber_id'
+    ).annotate(count=Count('id')).order_by().filter(count__gt=1)
+
+    update_ids = set()
+    for duplicate in duplicates:
+        notifications = sorted(IncidentUpdateNotification.objects.filter(
+            incident_update_id=duplicate['incident_update_id'],
+            subscriber_id=duplicate['subscriber_id']
+        ), key=lambda item: (priority.index(item.status) if item.status in priority else len(priority), item.id))
+        IncidentUpdateNotification.objects.filter(id__in=[item.id for item in notifications[1:]]).delete()
+        update_ids.add(duplicate['incident_update_id'])
+
+    for update_id in update_ids:
+        counts = dict.fromkeys(fields.values(), 0)
+        rows = IncidentUpdateNotification.objects.filter(incident_update_id=update_id).values('status').annotate(count=Count('id')).order_by()
+        for row in rows:
+            if row['status'] in fields:
+                counts[fields[row['status']]] = row['count']
+        IncidentUpdate.objects.filter(id=update_id).update(**counts)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0014_outbox_retries'),
+    ]
+
+    operations = [
+        migrations.RunPython(delete_duplicates, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name='incidentupdatenotification',
+            constraint=models.UniqueConstraint(fields=('incident_update', 'subscriber'), name='app_iun_update_subscriber_uniq'),
+        ),
+    ]
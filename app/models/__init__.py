@@ -17,8 +17,12 @@ from .incident_update import IncidentUpdate
 from .incident_update_notification import IncidentUpdateNotification              # noqa: F401
 from .incident_update_component import IncidentUpdateComponent                    # noqa: F401
 from .metric import Metric                                                        # noqa: F401
+from .metric_series import MetricSeries                                           # noqa: F401
 from .component import Component                                                  # noqa: F401
 from .component_group import ComponentGroup                                       # noqa: F401
+from .status_snapshot import StatusSnapshot                                       # noqa: F401
+from .uptime_rollup import UptimeRollup                                           # noqa: F401
+from .outbox_message import OutboxMessage                                         # noqa: F401
 from .custom_lookup import DateEqLookup                                           # noqa: F401
 from .custom_lookup import DateLtLookup                                           # noqa: F401
 from .custom_lookup import DateGtLookup                                           # noqa: F401
@@ -26,7 +26,7 @@ class Incident(models.Model):
     name = models.CharField(max_length=200, verbose_name="Name")
     uri = models.CharField(max_length=50, verbose_name="URI", unique=True)
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="open", verbose_name="Status")
-    datetime = models.DateTimeField(verbose_name="Datetime")
+    datetime = models.DateTimeField(db_index=True, verbose_name="Datetime")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created at")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated at")
 
@@ -45,6 +45,15 @@ class IncidentUpdate(models.Model):
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="update", verbose_name="Status")
     notify_subscribers = models.CharField(max_length=50, choices=NOTIFY_CHOICES, default="on", verbose_name="Notify Subscribers")
     total_suscribers = models.IntegerField(default=0, verbose_name="Total Subscribers")
+    pending_notifications = models.IntegerField(default=0, verbose_name="Pending Notifications")
+    sent_notifications = models.IntegerField(default=0, verbose_name="Sent Notifications")
+    failed_notifications = models.IntegerField(default=0, verbose_name="Failed Notifications")
+    dead_notifications = models.IntegerField(default=0, verbose_name="Dead-Lettered Notifications")
+    coalesced_notifications = models.IntegerField(default=0, verbose_name="Coalesced Notifications")
+    fanout_partitions = models.IntegerField(default=0, verbose_name="Fan-out Partitions")
+    fanout_partitions_done = models.IntegerField(default=0, verbose_name="Fan-out Partitions Done")
+    fanout_started_at = models.DateTimeField(null=True, verbose_name="Fan-out Started at")
+    fanout_finished_at = models.DateTimeField(null=True, verbose_name="Fan-out Finished at")
     datetime = models.DateTimeField(verbose_name="Datetime")
     message = models.TextField(verbose_name="Message")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created at")
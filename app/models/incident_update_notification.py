@@ -25,7 +25,9 @@ class IncidentUpdateNotification(models.Model):
     STATUS_CHOICES = (
         ('pending', 'PENDING'),
         ('failed', 'FAILED'),
-        ('success', 'SUCCESS')
+        ('success', 'SUCCESS'),
+        ('dead', 'DEAD'),
+        ('coalesced', 'COALESCED')
     )
 
     incident_update = models.ForeignKey(
@@ -45,8 +47,17 @@ class IncidentUpdateNotification(models.Model):
     )
 
     status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="pending", verbose_name="Status")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Attempts")
+    last_error = models.TextField(default="", blank=True, verbose_name="Last Error")
+    next_attempt_at = models.DateTimeField(null=True, db_index=True, verbose_name="Next Attempt at")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created at")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated at")
 
     class Meta:
         db_table = "app_incident_update_notification"
+        indexes = [
+            models.Index(fields=["status", "next_attempt_at"], name="app_iun_status_next_idx")
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["incident_update", "subscriber"], name="app_iun_update_subscriber_uniq")
+        ]
@@ -0,0 +1,44 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third Party Library
+from django.db import models
+
+# Local Library
+from .metric import Metric
+
+
+class MetricSeries(models.Model):
+
+    PERIOD_CHOICES = (
+        ('day', 'DAY'),
+        ('week', 'WEEK'),
+        ('month', 'MONTH')
+    )
+
+    metric = models.ForeignKey(
+        Metric,
+        on_delete=models.CASCADE,
+        db_index=True,
+        verbose_name="Related Metric"
+    )
+    period = models.CharField(max_length=10, choices=PERIOD_CHOICES, verbose_name="Period")
+    timestamps = models.BinaryField(verbose_name="Timestamps")
+    values = models.BinaryField(verbose_name="Values")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created at")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated at")
+
+    class Meta:
+        db_table = "app_metric_series"
+        unique_together = ("metric", "period")
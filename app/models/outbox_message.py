@@ -0,0 +1,40 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third Party Library
+from django.db import models
+
+
+class OutboxMessage(models.Model):
+
+    STATUS_CHOICES = (
+        ('pending', 'PENDING'),
+        ('published', 'PUBLISHED'),
+        ('failed', 'FAILED')
+    )
+
+    uuid = models.CharField(max_length=200, unique=True, verbose_name="UUID")
+    task = models.CharField(max_length=200, verbose_name="Task")
+    parameters = models.TextField(verbose_name="Parameters")
+    dedup_key = models.CharField(max_length=200, db_index=True, default="", blank=True, verbose_name="Deduplication Key")
+    status = models.CharField(max_length=50, choices=STATUS_CHOICES, default="pending", db_index=True, verbose_name="Status")
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Attempts")
+    last_error = models.TextField(default="", blank=True, verbose_name="Last Error")
+    next_attempt_at = models.DateTimeField(null=True, verbose_name="Next Attempt at")
+    published_at = models.DateTimeField(null=True, verbose_name="Published at")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created at")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated at")
+
+    class Meta:
+        db_table = "app_outbox_message"
@@ -34,7 +34,7 @@ class Task(models.Model):
         null=True
     )
 
-    uuid = models.CharField(max_length=200, verbose_name="UUID")
+    uuid = models.CharField(max_length=200, db_index=True, verbose_name="UUID")
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="pending", verbose_name="Status")
     executor = models.CharField(max_length=200, verbose_name="Executor")
     parameters = models.TextField(verbose_name="Parameters")
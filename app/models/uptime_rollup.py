@@ -0,0 +1,50 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third Party Library
+from django.db import models
+
+# Local Library
+from .component import Component
+from .component_group import ComponentGroup
+
+
+class UptimeRollup(models.Model):
+
+    component = models.ForeignKey(
+        Component,
+        on_delete=models.CASCADE,
+        db_index=True,
+        verbose_name="Related Component",
+        null=True
+    )
+
+    group = models.ForeignKey(
+        ComponentGroup,
+        on_delete=models.CASCADE,
+        db_index=True,
+        verbose_name="Related Component Group",
+        null=True
+    )
+
+    day = models.DateField(db_index=True, verbose_name="Day")
+    major_outage = models.PositiveIntegerField(default=0, verbose_name="Major Outage Minutes")
+    partial_outage = models.PositiveIntegerField(default=0, verbose_name="Partial Outage Minutes")
+    degraded_performance = models.PositiveIntegerField(default=0, verbose_name="Degraded Performance Minutes")
+    maintenance = models.PositiveIntegerField(default=0, verbose_name="Maintenance Minutes")
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Created at")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Updated at")
+
+    class Meta:
+        db_table = "app_uptime_rollup"
@@ -22,6 +22,7 @@ from django.http import Http404
 from app.modules.core.acl import ACL
 from app.modules.util.helpers import Helpers
 from app.modules.core.response import Response
+from app.modules.core.page_cache import PageCache
 from app.modules.entity.option_entity import OptionEntity
 
 
@@ -115,6 +116,24 @@ def redirect_if_not_installed(function):
     return wrap
 
 
+def serve_from_page_cache(function):
+    def wrap(controller, request, *args, **kwargs):
+        page_cache = PageCache()
+        if not page_cache.enabled():
+            return function(controller, request, *args, **kwargs)
+
+        key = page_cache.get_key(request, getattr(controller, "page_cache_scopes", []))
+        response = page_cache.get(key)
+        if response is not None:
+            return response
+
+        response = function(controller, request, *args, **kwargs)
+        if response.status_code == 200:
+            page_cache.set(key, response)
+        return response
+    return wrap
+
+
 def protect_metric_with_auth_key(function):
     def wrap(controller, request, *args, **kwargs):
         if kwargs["type"] == "prometheus":
@@ -24,7 +24,9 @@ from django.utils.translation import gettext as _
 
 # Local Library
 from app.settings.info import APP_ROOT
+from app.modules.core.outbox import Outbox
 from app.modules.core.task import Task as TaskCore
+from app.modules.util.rate_limiter import RateLimiter
 from app.modules.entity.option_entity import OptionEntity
 
 
@@ -99,3 +101,11 @@ class Health():
             errors.append(_("Error: celery workers not connected"))
 
         return errors
+
+    def get_rate_limits(self):
+        """Get the fill level of the notification channels rate limiters"""
+        return {name: level for name, level in RateLimiter.get_levels().items() if ":" not in name}
+
+    def get_outbox_stats(self):
+        """Get the messages waiting for the outbox relay and the age of the oldest one"""
+        return Outbox().get_stats()
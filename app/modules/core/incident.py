@@ -66,6 +66,3 @@ class Incident():
 
     def delete_one_by_id(self, id):
         return self.__incident_entity.delete_one_by_id(id)
-
-    def get_incident_from_days(self, days=7):
-        return self.__incident_entity.get_incident_from_days(days)
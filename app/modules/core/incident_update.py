@@ -35,6 +35,14 @@ class IncidentUpdate():
             "message": update.message,
             "notify_subscribers": update.notify_subscribers,
             "total_suscribers": update.total_suscribers,
+            "pending_notifications": update.pending_notifications,
+            "sent_notifications": update.sent_notifications,
+            "failed_notifications": update.failed_notifications,
+            "dead_notifications": update.dead_notifications,
+            "coalesced_notifications": update.coalesced_notifications,
+            "fanout_partitions": update.fanout_partitions,
+            "fanout_partitions_done": update.fanout_partitions_done,
+            "fanout_finished_at": update.fanout_finished_at,
             "status": update.status
         }
 
@@ -47,6 +55,18 @@ class IncidentUpdate():
     def count_all(self, incident_id):
         return self.__incident_update_entity.count_all(incident_id)
 
+    def start_fanout(self, id, partitions):
+        return self.__incident_update_entity.start_fanout(id, partitions)
+
+    def complete_fanout_partition(self, id):
+        return self.__incident_update_entity.complete_fanout_partition(id)
+
+    def finish_fanout(self, id):
+        return self.__incident_update_entity.finish_fanout(id)
+
+    def get_ids(self, after_id=0, limit=500):
+        return self.__incident_update_entity.get_ids(after_id, limit)
+
     def get_all(self, incident_id, offset=None, limit=None):
         return self.__incident_update_entity.get_all(incident_id, offset, limit)
 
@@ -12,7 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Standard Library
+import os
+import random
+from datetime import timedelta
+
+# Third Party Library
+from django.utils import timezone
+
 # Local Library
+from app.modules.entity.subscriber_entity import SubscriberEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
 from app.modules.entity.incident_update_notification_entity import IncidentUpdateNotificationEntity
 
 
@@ -21,9 +31,178 @@ class IncidentUpdateNotification():
     PENDING = "pending"
     FAILED = "failed"
     SUCCESS = "success"
+    DEAD = "dead"
+    COALESCED = "coalesced"
 
     def __init__(self):
         self.__incident_update_notification_entity = IncidentUpdateNotificationEntity()
+        self.__incident_update_entity = IncidentUpdateEntity()
+        self.__subscriber_entity = SubscriberEntity()
+        self.__max_attempts = int(os.getenv("NOTIFICATION_MAX_ATTEMPTS", 5))
+        self.__retry_delay = int(os.getenv("NOTIFICATION_RETRY_DELAY", 60))
+        self.__retry_max_delay = int(os.getenv("NOTIFICATION_RETRY_MAX_DELAY", 3600))
+        self.__retry_lease = int(os.getenv("NOTIFICATION_RETRY_LEASE", 600))
+
+    def get_retry_delay(self, attempts):
+        """Get seconds to wait before the next attempt, doubled every attempt with jitter"""
+        delay = min(self.__retry_max_delay, self.__retry_delay * 2 ** (max(attempts, 1) - 1))
+        # Spread retries of failures that happened together
+        return random.uniform(delay / 2, delay)
+
+    def record_attempt(self, notification, error=None):
+        """Apply a delivery attempt result, failures are retried until they run out of attempts"""
+        notification.attempts += 1
+
+        if error is None:
+            notification.status = IncidentUpdateNotification.SUCCESS
+            notification.last_error = ""
+            notification.next_attempt_at = None
+        elif notification.attempts >= self.__max_attempts:
+            notification.status = IncidentUpdateNotification.DEAD
+            notification.last_error = error
+            notification.next_attempt_at = None
+        else:
+            notification.status = IncidentUpdateNotification.FAILED
+            notification.last_error = error
+            notification.next_attempt_at = timezone.now() + timedelta(seconds=self.get_retry_delay(notification.attempts))
+
+        return notification
+
+    def record_attempts(self, attempts):
+        """Save many (notification, error) delivery attempts and move the incident updates counters"""
+        notifications = self.__update_many(attempts, self.record_attempt)
+
+        for notification in notifications:
+            if notification.status == IncidentUpdateNotification.DEAD:
+                self.reopen_coalesced(notification)
+
+        return notifications
+
+    def reopen_coalesced(self, notification):
+        """Retry the earlier updates coalesced into a notification that will not be delivered"""
+        count = 0
+        rows = self.__incident_update_notification_entity.get_coalesced_before(
+            notification.subscriber_id,
+            notification.incident_update.incident_id,
+            notification.incident_update_id
+        )
+
+        ids = {}
+        for row in rows:
+            ids.setdefault(row["incident_update_id"], []).append(row["id"])
+
+        # Failed rows due now are picked up by the retry task or the delivery workers
+        for update_id, update_ids in ids.items():
+            reopened = self.__incident_update_notification_entity.reset_many_by_ids(
+                update_ids,
+                IncidentUpdateNotification.COALESCED,
+                IncidentUpdateNotification.FAILED,
+                timezone.now()
+            )
+            if reopened == 0:
+                continue
+            self.__incident_update_entity.update_counters(update_id, {
+                IncidentUpdateNotification.COALESCED: -reopened,
+                IncidentUpdateNotification.FAILED: reopened
+            })
+            count += reopened
+
+        return count
+
+    def coalesce_many(self, notifications):
+        """Close notifications superseded by a later update of the same incident without delivering them"""
+        return self.__update_many([(notification,) for notification in notifications], self.__coalesce)
+
+    def get_coalesce_window(self, subscriber_type):
+        """Get seconds to hold new notifications of a channel so that later updates can absorb them"""
+        return int(os.getenv("NOTIFICATION_COALESCE_WINDOW_%s" % subscriber_type.upper(), 0))
+
+    def get_changes(self, notifications):
+        """Split notifications of coalescing channels into superseded ones and earlier undelivered updates of the rest"""
+        notifications = [notification for notification in notifications if self.get_coalesce_window(notification.subscriber.type) > 0]
+        superseded = []
+        changes = {}
+
+        if len(notifications) == 0:
+            return superseded, changes
+
+        history = {}
+        for row in self.__incident_update_notification_entity.get_history(
+            {notification.subscriber_id for notification in notifications},
+            {notification.incident_update.incident_id for notification in notifications}
+        ):
+            history.setdefault((row["subscriber_id"], row["incident_update__incident_id"]), []).append(row)
+
+        for notification in notifications:
+            rows = history.get((notification.subscriber_id, notification.incident_update.incident_id), [])
+
+            # The subscriber got or is about to get a later update of the incident, rows are re-opened if it is dead-lettered
+            if any(row["incident_update_id"] > notification.incident_update_id and row["status"] in [
+                IncidentUpdateNotification.PENDING,
+                IncidentUpdateNotification.SUCCESS
+            ] for row in rows):
+                superseded.append(notification)
+                continue
+
+            # Mention earlier updates the subscriber missed since the last delivered one
+            earlier = []
+            for row in reversed(rows):
+                if row["incident_update_id"] >= notification.incident_update_id:
+                    continue
+                if row["status"] == IncidentUpdateNotification.SUCCESS:
+                    break
+                earlier.insert(0, {
+                    "id": row["incident_update_id"],
+                    "status": row["incident_update__status"],
+                    "datetime": row["incident_update__datetime"]
+                })
+
+            if len(earlier) > 0:
+                changes[notification.id] = earlier
+
+        return superseded, changes
+
+    def claim_due_ids(self, limit=500):
+        """Get failed notifications due for a retry and hold them while they are queued"""
+        ids = self.__incident_update_notification_entity.get_due_ids(IncidentUpdateNotification.FAILED, limit)
+        self.__incident_update_notification_entity.update_many_next_attempt_by_ids(
+            ids,
+            timezone.now() + timedelta(seconds=self.__retry_lease)
+        )
+        return ids
+
+    def claim_ids(self, limit=50):
+        """Lease pending and due failed notifications to this worker, expired leases are claimable again"""
+        # A random offset keeps the lease unique to this worker when claiming without SKIP LOCKED
+        lease_until = timezone.now() + timedelta(seconds=self.__retry_lease, microseconds=random.randint(0, 999999))
+        return self.__incident_update_notification_entity.claim_ids(
+            [IncidentUpdateNotification.PENDING, IncidentUpdateNotification.FAILED],
+            lease_until,
+            limit
+        )
+
+    def count_claimable(self):
+        return self.__incident_update_notification_entity.count_claimable([
+            IncidentUpdateNotification.PENDING,
+            IncidentUpdateNotification.FAILED
+        ])
+
+    def is_database_queue(self):
+        """Whether delivery workers claim notifications from the database instead of the broker"""
+        return os.getenv("NOTIFICATION_DELIVERY_MODE", "broker") == "database"
+
+    def redrive_many_by_ids(self, incident_update_id, ids):
+        """Give dead notifications of an incident update a new set of attempts"""
+        count = self.__incident_update_notification_entity.reset_many_by_ids(
+            ids,
+            IncidentUpdateNotification.DEAD,
+            IncidentUpdateNotification.PENDING
+        )
+        self.__incident_update_entity.update_counters(incident_update_id, {
+            IncidentUpdateNotification.DEAD: -count,
+            IncidentUpdateNotification.PENDING: count
+        })
+        return count
 
     def get_one_by_id(self, id):
         item = self.__incident_update_notification_entity.get_one_by_id(id)
@@ -35,20 +214,95 @@ class IncidentUpdateNotification():
             "id": item.id,
             "incident_update": item.incident_update,
             "subscriber": item.subscriber,
-            "status": item.status
+            "status": item.status,
+            "attempts": item.attempts,
+            "last_error": item.last_error,
+            "next_attempt_at": item.next_attempt_at
         }
 
+    def get_subscriber_types_by_ids(self, ids):
+        return self.__incident_update_notification_entity.get_subscriber_types_by_ids(ids)
+
+    def claim_many(self, notifications):
+        """Take pending and failed notifications for delivery, a copy of the same batch delivered elsewhere gets none"""
+        claimed = self.__incident_update_notification_entity.claim_many(notifications, [
+            IncidentUpdateNotification.PENDING,
+            IncidentUpdateNotification.FAILED
+        ])
+        return [notification for notification in notifications if notification.id in claimed]
+
+    def get_many_by_ids(self, ids):
+        return self.__incident_update_notification_entity.get_many_by_ids(ids)
+
     def count_by_update_status(self, update_id, status):
         return self.__incident_update_notification_entity.count_by_update_status(update_id, status)
 
     def insert_one(self, item):
-        return self.__incident_update_notification_entity.insert_one(item)
+        notification = self.__incident_update_notification_entity.insert_one(item)
+        if notification and notification.incident_update_id:
+            self.__incident_update_entity.update_counters(notification.incident_update_id, {notification.status: 1})
+        return notification
+
+    def insert_many(self, incident_update_id, subscriber_ids, status="pending"):
+        next_attempts = {}
+
+        if status == IncidentUpdateNotification.PENDING:
+            # Hold notifications of coalescing channels until their window ends
+            now = timezone.now()
+            for subscriber_id, subscriber_type in self.__subscriber_entity.get_types_by_ids(subscriber_ids).items():
+                window = self.get_coalesce_window(subscriber_type)
+                if window > 0:
+                    next_attempts[subscriber_id] = now + timedelta(seconds=window)
+
+        count = self.__incident_update_notification_entity.insert_many(incident_update_id, subscriber_ids, status, next_attempts)
+        self.__incident_update_entity.update_counters(incident_update_id, {status: count})
+        return count
+
+    def reconcile_counters(self, incident_update_id):
+        return self.__incident_update_entity.reconcile_counters(incident_update_id)
+
+    def get_ids_by_update_status(self, incident_update_id, statuses, after_id=0, limit=500, subscriber_range=None):
+        return self.__incident_update_notification_entity.get_ids_by_update_status(incident_update_id, statuses, after_id, limit, subscriber_range)
 
     def update_one_by_id(self, id, data):
-        return self.__incident_update_notification_entity.update_one_by_id(id, data)
+        item = self.__incident_update_notification_entity.get_one_by_id(id)
+        result = self.__incident_update_notification_entity.update_one_by_id(id, data)
+        if item and result and "status" in data and item.incident_update_id:
+            self.__incident_update_entity.update_counters(item.incident_update_id, {item.status: -1})
+            self.__incident_update_entity.update_counters(item.incident_update_id, {data["status"]: 1})
+        return result
 
     def is_subscriber_notified(self, incident_update_id, subscriber_id):
         return self.__incident_update_notification_entity.is_subscriber_notified(incident_update_id, subscriber_id)
 
     def delete_one_by_id(self, id):
-        return self.__incident_update_notification_entity.delete_one_by_id(id)
+        item = self.__incident_update_notification_entity.get_one_by_id(id)
+        result = self.__incident_update_notification_entity.delete_one_by_id(id)
+        if item and result and item.incident_update_id:
+            self.__incident_update_entity.update_counters(item.incident_update_id, {item.status: -1})
+        return result
+
+    def __coalesce(self, notification):
+        notification.status = IncidentUpdateNotification.COALESCED
+        notification.last_error = ""
+        notification.next_attempt_at = None
+        return notification
+
+    def __update_many(self, items, change):
+        """Apply a change to many notifications given with its arguments and save them with their counters"""
+        deltas = {}
+        notifications = []
+
+        for item in items:
+            notification = item[0]
+            update_deltas = deltas.setdefault(notification.incident_update_id, {})
+            update_deltas[notification.status] = update_deltas.get(notification.status, 0) - 1
+            notifications.append(change(*item))
+            update_deltas[notification.status] = update_deltas.get(notification.status, 0) + 1
+
+        self.__incident_update_notification_entity.update_many_attempts(notifications)
+
+        for update_id, update_deltas in deltas.items():
+            self.__incident_update_entity.update_counters(update_id, update_deltas)
+
+        return notifications
@@ -13,21 +13,41 @@
 # limitations under the License.
 
 # Standard Library
+import os
 import json
+from datetime import datetime
 
 # Third Party Library
+from dateutil.parser import parse
+from pyumetric import Datetime_Utils
 from pyumetric import NewRelic_Provider
+from django.utils.translation import gettext as _
 
 # Local Library
+from app.modules.util.helpers import Helpers
+from app.modules.util.series import Series
+from app.modules.core.page_cache import PageCache
 from app.modules.entity.metric_entity import MetricEntity
 from app.modules.entity.option_entity import OptionEntity
+from app.modules.entity.metric_series_entity import MetricSeriesEntity
 
 
 class Metric():
 
+    # Stored series and how many days back each one reaches
+    PERIODS = {
+        "day": -1,
+        "week": -7,
+        "month": -30
+    }
+
     def __init__(self):
         self.__option_entity = OptionEntity()
         self.__metric_entity = MetricEntity()
+        self.__metric_series_entity = MetricSeriesEntity()
+        self.__logger = Helpers().get_logger(__name__)
+        self.__series = Series()
+        self.__chart_points = int(os.getenv("METRICS_CHART_POINTS", 120))
         new_relic_api = self.__option_entity.get_one_by_key("newrelic_api_key")
         self.__newrelic = None
         if new_relic_api:
@@ -90,3 +110,95 @@ class Metric():
         for app in apps["applications"]:
             result.append({"key": app["id"], "value": app["name"]})
         return result
+
+    def collect(self):
+        """Pull every metric from its source into the local series store"""
+        result = {"collected": 0, "failed": 0}
+
+        for metric in self.__metric_entity.get_all():
+            for period, days in Metric.PERIODS.items():
+                try:
+                    points = self.get_metric_points(metric, days)
+                except Exception as e:
+                    self.__logger.error(_("Error while collecting metric %(id)d for period %(period)s: %(error)s") % {
+                        "id": metric.id,
+                        "period": period,
+                        "error": str(e)
+                    })
+                    result["failed"] += 1
+                    continue
+
+                points = [point for point in points if point["value"] is not None]
+                timestamps, values = self.__series.downsample(
+                    [point["timestamp"] for point in points],
+                    [point["value"] for point in points],
+                    self.__chart_points
+                )
+                self.__metric_series_entity.update_one_by_metric(
+                    metric.id,
+                    period,
+                    self.__series.pack(timestamps),
+                    self.__series.pack(values)
+                )
+                result["collected"] += 1
+
+        # Only the pages showing metrics are rendered again
+        if result["collected"] > 0:
+            PageCache().invalidate(PageCache.METRICS)
+
+        return result
+
+    def get_metric_points(self, metric, period):
+        metric_values = []
+
+        if self.__newrelic is None:
+            raise Exception("Unable to find option with key newrelic_api_key")
+
+        if metric.source == "newrelic":
+            data = json.loads(metric.data)
+
+            if data["metric"] == "response_time":
+                response = self.__newrelic.get_metric(
+                    data["application"],
+                    ["WebTransaction"],
+                    ["average_response_time"],
+                    Datetime_Utils("UTC", period).iso(),
+                    Datetime_Utils("UTC").iso(),
+                    False
+                )
+                if len(response) > 0:
+                    response = json.loads(response)
+
+                    if "metric_data" not in response:
+                        raise Exception(_("Error: Unable to find metric_data on NewRelic response!"))
+
+                    if "WebTransaction" not in response["metric_data"]["metrics_found"]:
+                        raise Exception(_("Error: Unable to find metric WebTransaction on NewRelic response!"))
+
+                    if "metrics" not in response["metric_data"] or len(response["metric_data"]["metrics"]) < 1:
+                        raise Exception(_("Error: Unable to find metric metrics on NewRelic response!"))
+
+                    for item in response["metric_data"]["metrics"][0]["timeslices"]:
+                        metric_values.append({
+                            "timestamp": datetime.timestamp(parse(item["from"])),
+                            "value": item["values"]["average_response_time"]
+                        })
+            elif data["metric"] == "apdex":
+                raise Exception(_("Error: NewRelic apdex metric not implemented yet!"))
+
+            elif data["metric"] == "error_rate":
+                raise Exception(_("Error: NewRelic error_rate metric not implemented yet!"))
+
+            elif data["metric"] == "throughput":
+                raise Exception(_("Error: NewRelic throughput metric not implemented yet!"))
+
+            elif data["metric"] == "errors":
+                raise Exception(_("Error: NewRelic errors metric not implemented yet!"))
+
+            elif data["metric"] == "real_user_response_time":
+                raise Exception(_("Error: NewRelic real_user_response_time metric not implemented yet!"))
+
+            elif data["metric"] == "real_user_apdex":
+                raise Exception(_("Error: NewRelic real_user_apdex metric not implemented yet!"))
+
+        return metric_values
@@ -0,0 +1,147 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import json
+import uuid
+import importlib
+from datetime import timedelta
+
+# Third Party Library
+from celery import current_app
+from django.db import transaction
+from django.utils import timezone
+from kombu.exceptions import OperationalError
+
+# Local Library
+from app.modules.util.helpers import Helpers
+from app.modules.entity.task_entity import TaskEntity
+from app.modules.entity.notification_entity import NotificationEntity
+from app.modules.entity.outbox_message_entity import OutboxMessageEntity
+
+
+class Outbox():
+    """Store tasks with the data that triggers them and publish them to the broker later"""
+
+    PENDING = "pending"
+    PUBLISHED = "published"
+    FAILED = "failed"
+
+    def __init__(self):
+        self.__outbox_message_entity = OutboxMessageEntity()
+        self.__task_entity = TaskEntity()
+        self.__notification_entity = NotificationEntity()
+        self.__batch_size = int(os.getenv("OUTBOX_BATCH_SIZE", 100))
+        self.__retention = int(os.getenv("OUTBOX_RETENTION_HOURS", 24))
+        self.__max_attempts = int(os.getenv("OUTBOX_MAX_ATTEMPTS", 10))
+        self.__retry_delay = int(os.getenv("OUTBOX_RETRY_DELAY", 5))
+        self.__retry_max_delay = int(os.getenv("OUTBOX_RETRY_MAX_DELAY", 300))
+        self.__logger = Helpers().get_logger(__name__)
+
+    def enqueue(self, task_name, parameters, user_id, dedup_key="", notification=None):
+        """Store the task row, its notification and the outbox message in one transaction"""
+        task_object = getattr(importlib.import_module("app.tasks"), task_name)
+
+        with transaction.atomic():
+            # A message still waiting for the relay with the same key is reused
+            if dedup_key:
+                message = self.__outbox_message_entity.get_one_pending_by_dedup_key(dedup_key)
+                if message:
+                    return self.__task_entity.get_one_by_uuid(message.uuid)
+
+            task_uuid = str(uuid.uuid4())
+            task = self.__task_entity.insert_one({
+                "uuid": task_uuid,
+                "status": "pending",
+                "executor": task_object.name,
+                "parameters": json.dumps(parameters),
+                "result": '{}',
+                "user_id": user_id
+            })
+
+            if notification is not None:
+                notification["task_id"] = task.id
+                self.__notification_entity.insert_one(notification)
+
+            self.__outbox_message_entity.insert_one({
+                "uuid": task_uuid,
+                "task": task_name,
+                "parameters": json.dumps(parameters),
+                "dedup_key": dedup_key
+            })
+
+        return task
+
+    def relay(self):
+        """Publish a batch of pending messages, at least once, with their task ID as Celery task ID"""
+        tasks_module = importlib.import_module("app.tasks")
+        published = []
+
+        with transaction.atomic():
+            messages = self.__outbox_message_entity.get_many_pending_for_update(self.__batch_size)
+            if len(messages) == 0:
+                return 0
+
+            # One broker connection for the whole batch
+            with current_app.producer_or_acquire() as producer:
+                for message in messages:
+                    try:
+                        getattr(tasks_module, message.task).apply_async(
+                            kwargs=json.loads(message.parameters),
+                            task_id=message.uuid,
+                            producer=producer
+                        )
+                        published.append(message.id)
+                    except OperationalError as e:
+                        # Broker unavailable, the rest of the batch waits for the next run and is never given up
+                        self.__logger.error("Error while publishing outbox message %s: %s" % (message.uuid, str(e)))
+                        self.__outbox_message_entity.record_failure(message.id, str(e))
+                        break
+                    except Exception as e:
+                        self.__logger.error("Error while publishing outbox message %s: %s" % (message.uuid, str(e)))
+                        self.__record_failure(message, str(e))
+
+            self.__outbox_message_entity.mark_many_published(published)
+
+        return len(published)
+
+    def get_retry_delay(self, attempts):
+        """Get seconds to wait before publishing a failed message again, doubled every attempt"""
+        return min(self.__retry_max_delay, self.__retry_delay * 2 ** (max(attempts, 1) - 1))
+
+    def delete_published(self):
+        return self.__outbox_message_entity.delete_published_before(timezone.now() - timedelta(hours=self.__retention))
+
+    def get_stats(self):
+        oldest = self.__outbox_message_entity.get_oldest_pending()
+        return {
+            "pending": self.__outbox_message_entity.count_by_status(Outbox.PENDING),
+            "failed": self.__outbox_message_entity.count_by_status(Outbox.FAILED),
+            "lag": round((timezone.now() - oldest.created_at).total_seconds(), 2) if oldest else 0
+        }
+
+    def __record_failure(self, message, error):
+        """Back off a message that failed to publish, give up once it ran out of attempts"""
+        attempts = message.attempts + 1
+
+        if attempts >= self.__max_attempts:
+            return self.__outbox_message_entity.record_failure(message.id, error, Outbox.FAILED)
+
+        return self.__outbox_message_entity.record_failure(
+            message.id,
+            error,
+            Outbox.PENDING,
+            timezone.now() + timedelta(seconds=self.get_retry_delay(attempts))
+        )
@@ -0,0 +1,68 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import time
+import hashlib
+
+# Third Party Library
+from django.conf import settings
+from django.core.cache import cache
+
+
+class PageCache():
+    """Versioned Full Page Cache for Public Pages"""
+
+    VERSION_KEY = "page_cache_version"
+    METRICS = "metrics"
+
+    def __init__(self):
+        self.__timeout = int(os.getenv("PAGE_CACHE_TIMEOUT", 300))
+
+    def enabled(self):
+        # Invalidations from other workers and Celery only reach this process through a shared cache
+        return self.__timeout > 0 and settings.CACHE_SHARED
+
+    def get_version(self, scope=None):
+        """Get the version of all pages or of the pages depending on a scope"""
+        key = PageCache.VERSION_KEY if scope is None else "%s:%s" % (PageCache.VERSION_KEY, scope)
+        version = cache.get(key)
+        if version is None:
+            # Seed with the current time so entries from an evicted version never come back
+            cache.add(key, int(time.time() * 1000), None)
+            version = cache.get(key)
+        return version
+
+    def invalidate(self, scope=None):
+        """Invalidate all pages or only the pages depending on a scope"""
+        key = PageCache.VERSION_KEY if scope is None else "%s:%s" % (PageCache.VERSION_KEY, scope)
+        try:
+            return cache.incr(key)
+        except ValueError:
+            return self.get_version(scope)
+
+    def get_key(self, request, scopes=()):
+        return "page_cache:%(version)s:%(language)s:%(auth)s:%(path)s" % {
+            "version": "-".join([str(self.get_version())] + [str(self.get_version(scope)) for scope in scopes]),
+            "language": getattr(request, "LANGUAGE_CODE", ""),
+            "auth": "auth" if request.user and request.user.is_authenticated else "anon",
+            "path": hashlib.md5(request.get_full_path().encode("utf-8")).hexdigest()
+        }
+
+    def get(self, key):
+        return cache.get(key)
+
+    def set(self, key, response):
+        return cache.set(key, response, self.__timeout)
@@ -0,0 +1,173 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import json
+import hashlib
+from datetime import timedelta
+
+# Third Party Library
+from django.utils import timezone
+
+# Local Library
+from app.modules.core.page_cache import PageCache
+from app.modules.core.system_status import SystemStatus
+from app.modules.entity.option_entity import OptionEntity
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.component_entity import ComponentEntity
+from app.modules.entity.component_group_entity import ComponentGroupEntity
+
+
+class PublicStatus():
+    """Precomputed JSON Documents of the Public Status API"""
+
+    DOCUMENTS = [
+        "summary",
+        "components",
+        "incidents"
+    ]
+
+    INCIDENTS_DAYS = 30
+
+    # Indicator of the worst component status, statuses not listed are normal
+    INDICATORS = {
+        "maintenance": "low",
+        "degraded_performance": "low",
+        "partial_outage": "medium",
+        "major_outage": "high"
+    }
+
+    SEVERITY = [
+        "normal",
+        "low",
+        "medium",
+        "high"
+    ]
+
+    def __init__(self):
+        self.__page_cache = PageCache()
+        self.__option_entity = OptionEntity()
+        self.__incident_entity = IncidentEntity()
+        self.__component_entity = ComponentEntity()
+        self.__component_group_entity = ComponentGroupEntity()
+
+    def get_document(self, name):
+        """Get document body and etag, rebuilt once public data changed"""
+        key = "public_status:%(version)s:%(name)s" % {
+            "version": self.__page_cache.get_version(),
+            "name": name
+        }
+
+        document = self.__page_cache.get(key) if self.__page_cache.enabled() else None
+
+        if document is None:
+            body = json.dumps(getattr(self, "build_%s" % name)(), sort_keys=True)
+            document = {
+                "body": body,
+                "etag": '"%s"' % hashlib.sha1(body.encode("utf-8")).hexdigest()
+            }
+            if self.__page_cache.enabled():
+                self.__page_cache.set(key, document)
+
+        return document
+
+    def build_summary(self):
+        system_status = SystemStatus().get()
+        components = self.__get_components(system_status)
+
+        return {
+            "page": self.__get_page(),
+            "status": {
+                "indicator": self.__get_indicator(components),
+                "description": system_status["overall_status"]
+            },
+            "components": components["components"],
+            "groups": components["groups"],
+            "incidents": [self.__format_incident(incident) for incident in self.__incident_entity.get_by_status_with_updates("open")]
+        }
+
+    def build_components(self):
+        components = self.__get_components(SystemStatus().get())
+
+        return {
+            "page": self.__get_page(),
+            "components": components["components"],
+            "groups": components["groups"]
+        }
+
+    def build_incidents(self):
+        now = timezone.now()
+        incidents = self.__incident_entity.get_incident_in_range(
+            now - timedelta(days=PublicStatus.INCIDENTS_DAYS),
+            now + timedelta(days=1)
+        )
+
+        return {
+            "page": self.__get_page(),
+            "incidents": [self.__format_incident(incident) for incident in incidents]
+        }
+
+    def __get_components(self, system_status):
+        """Get the components and groups shown on the status page"""
+        option = self.__option_entity.get_one_by_key("builder_components")
+        items = json.loads(option.value) if option else []
+        component_ids = [int(item.replace("c-", "")) for item in items if "c-" in item]
+        group_ids = [int(item.replace("g-", "")) for item in items if "g-" in item]
+
+        components = list(self.__component_entity.get_many_by_ids_or_groups(component_ids, group_ids))
+        groups = sorted(self.__component_group_entity.get_many_by_ids(group_ids), key=lambda group: group.name)
+
+        return {
+            "components": [{
+                "id": component.id,
+                "name": component.name,
+                "description": component.description,
+                "group_id": component.group_id,
+                "status": system_status["affected_components_status"].get(component.name, "operational")
+            } for component in components],
+            "groups": [{
+                "id": group.id,
+                "name": group.name,
+                "description": group.description,
+                "status": system_status["affected_groups_status"].get(group.name, "operational")
+            } for group in groups]
+        }
+
+    def __get_page(self):
+        return {
+            "name": self.__option_entity.get_value_by_key("app_name", ""),
+            "url": self.__option_entity.get_value_by_key("app_url", "")
+        }
+
+    def __get_indicator(self, components):
+        indicators = [
+            PublicStatus.INDICATORS.get(item["status"], "normal")
+            for item in components["components"] + components["groups"]
+        ]
+        return max(indicators, key=PublicStatus.SEVERITY.index, default="normal")
+
+    def __format_incident(self, incident):
+        return {
+            "id": incident.id,
+            "name": incident.name,
+            "uri": incident.uri,
+            "status": incident.status,
+            "datetime": incident.datetime.isoformat(),
+            "updates": [{
+                "id": update.id,
+                "status": update.status,
+                "message": update.message,
+                "datetime": update.datetime.isoformat()
+            } for update in incident.incidentupdate_set.all()]
+        }
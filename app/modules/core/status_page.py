@@ -15,27 +15,27 @@
 # Standard Library
 import os
 import json
-from datetime import datetime
 from datetime import timedelta
 
 # Third Party Library
-from dateutil.parser import parse
 from django.utils import timezone
-from pyumetric import Datetime_Utils
-from pyumetric import NewRelic_Provider
-from django.forms.fields import DateTimeField
 from dateutil.relativedelta import relativedelta
 from django.utils.translation import gettext as _
 
 # Local Library
+from app.modules.util.helpers import Helpers
+from app.modules.util.series import Series
 from app.modules.entity.option_entity import OptionEntity
 from app.modules.entity.metric_entity import MetricEntity
+from app.modules.entity.metric_series_entity import MetricSeriesEntity
 from app.modules.entity.incident_entity import IncidentEntity
 from app.modules.entity.component_entity import ComponentEntity
 from app.modules.entity.component_group_entity import ComponentGroupEntity
 from app.modules.entity.incident_update_entity import IncidentUpdateEntity
 from app.modules.entity.incident_update_component_entity import IncidentUpdateComponentEntity
 from app.modules.core.constants import Constants
+from app.modules.core.uptime import Uptime
+from app.modules.core.system_status import SystemStatus
 
 
 class StatusPage():
@@ -48,44 +48,11 @@ class StatusPage():
         self.__component_group_entity = ComponentGroupEntity()
         self.__component_entity = ComponentEntity()
         self.__metric_entity = MetricEntity()
-        self.__load_system_status()
-
-    def __load_system_status(self):
-        open_incidents = self.__incident_entity.get_by_status("open")
-
-        self.__system_status = {
-            "affected_components_map": {},
-            "affected_components_status": {},
-            "affected_groups_map": {},
-            "affected_groups_status": {},
-            "overall_status": Constants.COMPONENT_STATUSES["operational"],
-        }
-
-        for open_incident in open_incidents:
-            updates = self.__incident_update_entity.get_all(open_incident.id, 0, 1)
-            for update in updates:
-                update_components = self.__incident_update_component_entity.get_all(update.id)
-                for update_component in update_components:
-                    if update_component.component.name not in self.__system_status["affected_components_status"].keys():
-                        self.__system_status["affected_components_status"][update_component.component.name] = update_component.type
-                        if update_component.component.group:
-                            self.__system_status["affected_groups_status"][update_component.component.group.name] = update_component.type
-                    if update_component.component.name not in self.__system_status["affected_components_map"].keys():
-                        self.__system_status["affected_components_map"][update_component.component.name] = update_component.component.id
-                        if update_component.component.group:
-                            self.__system_status["affected_groups_map"][update_component.component.group.name] = update_component.component.group.id
-
-        if "major_outage" in self.__system_status["affected_components_status"].values():
-            self.__system_status["overall_status"] = Constants.COMPONENT_STATUSES["major_outage"]
-
-        elif "partial_outage" in self.__system_status["affected_components_status"].values():
-            self.__system_status["overall_status"] = Constants.COMPONENT_STATUSES["partial_outage"]
-
-        elif "degraded_performance" in self.__system_status["affected_components_status"].values():
-            self.__system_status["overall_status"] = Constants.COMPONENT_STATUSES["degraded_performance"]
-
-        elif "maintenance" in self.__system_status["affected_components_status"].values():
-            self.__system_status["overall_status"] = Constants.COMPONENT_STATUSES["maintenance"]
+        self.__metric_series_entity = MetricSeriesEntity()
+        self.__helpers = Helpers()
+        self.__series = Series()
+        self.__uptime = Uptime()
+        self.__system_status = SystemStatus().get()
 
     def get_system_status(self):
 
@@ -149,8 +116,7 @@ class StatusPage():
 
     def get_incidents_for_period(self, period):
 
-        today = timezone.now()
-        datem = datetime(today.year, today.month, 1)
+        datem = self.__helpers.local_date(timezone.now()).replace(day=1)
 
         from_date = datem - relativedelta(months=+(period - 1) * 3)
         to_date = datem - relativedelta(months=+(period * 3))
@@ -160,29 +126,28 @@ class StatusPage():
             "to": (to_date + relativedelta(months=+1)).strftime("%B %Y")
         }
 
-        from_date = datetime(from_date.year, from_date.month, 1)
-        to_date = datetime(to_date.year, to_date.month, 1)
+        incidents_by_month = {}
+        incidents_list = self.__incident_entity.get_incident_in_range_with_last_update(
+            self.__helpers.day_start(to_date + relativedelta(months=+1)),
+            self.__helpers.day_start(from_date + relativedelta(months=+1))
+        )
+
+        for incident in incidents_list:
+            incident_date = self.__helpers.local_date(incident.datetime)
+            incidents_by_month.setdefault((incident_date.year, incident_date.month), []).append({
+                "uri": incident.uri,
+                "subject": incident.name,
+                "class": "text-danger",
+                "status": incident.status,
+                "final_update": _("This incident has been resolved.") if incident.status == "closed" else _("This incident is still open."),
+                "period": self.__get_incident_period(incident)
+            })
 
         incidents = []
         while from_date > to_date:
-            current_incidents = []
-
-            incidents_list = self.__incident_entity.get_incident_on_month(DateTimeField().clean(from_date))
-
-            for incident in incidents_list:
-                current_incidents.append({
-                    "uri": incident.uri,
-                    "subject": incident.name,
-                    "class": "text-danger",
-                    "status": incident.status,
-                    "final_update": _("This incident has been resolved.") if incident.status == "closed" else _("This incident is still open."),
-                    "period": self.__get_incident_period(incident)
-                })
-
-            current_date = from_date.strftime("%B %Y")
             incidents.append({
-                "date": current_date,
-                "incidents": current_incidents
+                "date": from_date.strftime("%B %Y"),
+                "incidents": incidents_by_month.get((from_date.year, from_date.month), [])
             })
             from_date -= relativedelta(months=+1)
 
@@ -192,12 +157,11 @@ class StatusPage():
         }
 
     def __get_incident_period(self, incident):
-        updates = self.__get_incident_updates(incident.id)
-        if len(updates):
-            return "%(from)s %(tz)s - %(to)s" % {
+        if incident.last_update_datetime:
+            return "%(from)s %(tz)s - %(to)s %(tz)s" % {
                 "from": incident.datetime.strftime("%B %d, %H:%M"),
                 "tz": os.getenv("APP_TIMEZONE", "UTC"),
-                "to": updates[len(updates)-1]["date"]
+                "to": incident.last_update_datetime.strftime("%B %d, %H:%M")
             }
         return "%(from)s %(tz)s" % {
             "from": incident.datetime.strftime("%B %d, %H:%M"),
@@ -205,31 +169,34 @@ class StatusPage():
         }
 
     def get_past_incidents(self, days=7):
-        i = 0
-        past_incidents = []
-        while days > i:
-            date = (datetime.now() - timedelta(days=i))
-            incidents_result = []
-            incidents = self.__incident_entity.get_incident_from_days(i)
-            for incident in incidents:
-                incidents_result.append({
-                    "uri": incident.uri,
-                    "subject": incident.name,
-                    "class": "text-danger",
-                    "status": incident.status,
-                    "updates": self.__get_incident_updates(incident.id)
-                })
+        today = self.__helpers.local_date(timezone.now())
+        from_date = today - timedelta(days=days - 1)
+
+        incidents_by_date = {}
+        incidents = self.__incident_entity.get_incident_in_range(
+            self.__helpers.day_start(from_date),
+            self.__helpers.day_start(today + timedelta(days=1))
+        )
+        for incident in incidents:
+            incidents_by_date.setdefault(self.__helpers.local_date(incident.datetime), []).append({
+                "uri": incident.uri,
+                "subject": incident.name,
+                "class": "text-danger",
+                "status": incident.status,
+                "updates": self.__format_incident_updates(incident.incidentupdate_set.all())
+            })
 
+        past_incidents = []
+        for i in range(days):
+            date = today - timedelta(days=i)
             past_incidents.append({
                 "date": date.strftime("%B %d, %Y"),
-                "incidents": incidents_result
+                "incidents": incidents_by_date.get(date, [])
             })
-            i += 1
         return past_incidents
 
-    def __get_incident_updates(self, incident_id):
+    def __format_incident_updates(self, updates):
         updates_result = []
-        updates = self.__incident_update_entity.get_all(incident_id)
         for update in updates:
             updates_result.append({
                 "type": update.status.title(),
@@ -245,121 +212,93 @@ class StatusPage():
         metrics = []
         option = self.__option_entity.get_one_by_key("builder_metrics")
         if option:
-            items = json.loads(option.value)
-            for item in items:
+            ids = []
+            for item in json.loads(option.value):
                 if "m-" in item:
                     item = int(item.replace("m-", ""))
                     if item:
-                        metric = self.__metric_entity.get_one_by_id(item)
-                        if metric:
-                            metrics.append({
-                                "id": "metric_container_%d" % (metric.id),
-                                "title": metric.title,
-                                "xtitle": metric.x_axis,
-                                "ytitle": metric.y_axis,
-                                "day_data": self.__get_metrics(metric, -1),
-                                "week_data": self.__get_metrics(metric, -7),
-                                "month_data": self.__get_metrics(metric, -30)
-                            })
-        return metrics
-
-    def __get_metrics(self, metric, period):
-        metric_values = []
-        option = self.__option_entity.get_one_by_key("newrelic_api_key")
-
-        if not option:
-            raise Exception("Unable to find option with key newrelic_api_key")
+                        ids.append(item)
 
-        new_relic_client = NewRelic_Provider(option.value)
+            if len(ids) == 0:
+                return metrics
 
-        if metric.source == "newrelic":
-            data = json.loads(metric.data)
-
-            if data["metric"] == "response_time":
-                response = new_relic_client.get_metric(
-                    data["application"],
-                    ["WebTransaction"],
-                    ["average_response_time"],
-                    Datetime_Utils("UTC", period).iso(),
-                    Datetime_Utils("UTC").iso(),
-                    False
+            series = {}
+            for item in self.__metric_series_entity.get_many_by_metrics(ids):
+                series.setdefault(item.metric_id, {})[item.period] = self.__series.to_points(
+                    self.__series.unpack(item.timestamps),
+                    self.__series.unpack(item.values)
                 )
-                if len(response) > 0:
-                    response = json.loads(response)
-
-                    if "metric_data" not in response:
-                        raise Exception(_("Error: Unable to find metric_data on NewRelic response!"))
-
-                    if "WebTransaction" not in response["metric_data"]["metrics_found"]:
-                        raise Exception(_("Error: Unable to find metric WebTransaction on NewRelic response!"))
-
-                    if "metrics" not in response["metric_data"] or len(response["metric_data"]["metrics"]) < 1:
-                        raise Exception(_("Error: Unable to find metric metrics on NewRelic response!"))
-
-                    for item in response["metric_data"]["metrics"][0]["timeslices"]:
-                        metric_values.append({
-                            "timestamp": datetime.timestamp(parse(item["from"])),
-                            "value": item["values"]["average_response_time"]
-                        })
-            elif data["metric"] == "apdex":
-                raise Exception(_("Error: NewRelic apdex metric not implemented yet!"))
-
-            elif data["metric"] == "error_rate":
-                raise Exception(_("Error: NewRelic error_rate metric not implemented yet!"))
-
-            elif data["metric"] == "throughput":
-                raise Exception(_("Error: NewRelic throughput metric not implemented yet!"))
-
-            elif data["metric"] == "errors":
-                raise Exception(_("Error: NewRelic errors metric not implemented yet!"))
-
-            elif data["metric"] == "real_user_response_time":
-                raise Exception(_("Error: NewRelic real_user_response_time metric not implemented yet!"))
-
-            elif data["metric"] == "real_user_apdex":
-                raise Exception(_("Error: NewRelic real_user_apdex metric not implemented yet!"))
 
-        return metric_values
+            found = {metric.id: metric for metric in self.__metric_entity.get_many_by_ids(ids)}
+
+            for id in ids:
+                if id not in found:
+                    continue
+                metric = found[id]
+                metric_series = series.get(metric.id, {})
+                metrics.append({
+                    "id": "metric_container_%d" % (metric.id),
+                    "title": metric.title,
+                    "xtitle": metric.x_axis,
+                    "ytitle": metric.y_axis,
+                    "day_data": metric_series.get("day", []),
+                    "week_data": metric_series.get("week", []),
+                    "month_data": metric_series.get("month", [])
+                })
+        return metrics
 
     def get_services(self):
         services = []
         option = self.__option_entity.get_one_by_key("builder_components")
         if option:
             items = json.loads(option.value)
+            component_ids = [int(item.replace("c-", "")) for item in items if "c-" in item]
+            group_ids = [int(item.replace("g-", "")) for item in items if "g-" in item]
+
+            components = {}
+            sub_components = {}
+            for component in self.__component_entity.get_many_by_ids_or_groups(component_ids, group_ids):
+                components[component.id] = component
+                if component.group_id is not None:
+                    sub_components.setdefault(component.group_id, []).append(component)
+
+            groups = {}
+            if len(group_ids) > 0:
+                for group in self.__component_group_entity.get_many_by_ids(group_ids):
+                    groups[group.id] = group
+
             for item in items:
                 if "c-" in item:
-                    component = self.__component_entity.get_one_by_id(item.replace("c-", ""))
+                    component = components.get(int(item.replace("c-", "")))
                     if component:
+                        services.append(self.__get_component_service(component))
+                elif "g-" in item:
+                    group = groups.get(int(item.replace("g-", "")))
+                    if group:
                         services.append({
-                            "name": component.name,
-                            "description": component.description,
-                            "current_status": self.get_status(component.name, "component"),
-                            "uptime_chart": self.get_uptime_chart(component.id, "component"),
-                            "sub_services": []
+                            "name": group.name,
+                            "description": group.description,
+                            "current_status": self.get_status(group.name, "group"),
+                            "uptime_chart": self.get_uptime_chart(group.id, "group"),
+                            "sub_services": [self.__get_component_service(component) for component in sub_components.get(group.id, [])]
                         })
-                elif "g-" in item:
-                    group = self.__component_group_entity.get_one_by_id(item.replace("g-", ""))
-                    services.append({
-                        "name": group.name,
-                        "description": group.description,
-                        "current_status": self.get_status(group.name, "group"),
-                        "uptime_chart": self.get_uptime_chart(group.id, "group"),
-                        "sub_services": self.get_sub_services(group.id)
-                    })
 
         return services
 
+    def __get_component_service(self, component):
+        return {
+            "name": component.name,
+            "description": component.description,
+            "current_status": self.get_status(component.name, "component"),
+            "uptime_chart": self.get_uptime_chart(component.id, "component"),
+            "sub_services": []
+        }
+
     def get_sub_services(self, group_id):
         services = []
         items = self.__component_entity.get_all_components_by_group(group_id)
         for item in items:
-            services.append({
-                "name": item.name,
-                "description": item.description,
-                "current_status": self.get_status(item.name, "component"),
-                "uptime_chart": self.get_uptime_chart(item.id, "component"),
-                "sub_services": []
-            })
+            services.append(self.__get_component_service(item))
         return services
 
     def get_status(self, name, type):
@@ -372,4 +311,4 @@ class StatusPage():
         return Constants.COMPONENT_STATUSES["operational"]
 
     def get_uptime_chart(self, id, type, period=90):
-        return []
+        return self.__uptime.get_chart(id, type, period)
@@ -63,6 +63,17 @@ class Subscriber():
     def get_iterator(self, status="verified"):
         return self.__subscriber_entity.get_iterator(status)
 
+    def get_ids_without_notification(self, incident_update_id, after_id=0, limit=500, status="verified", to_id=None):
+        return self.__subscriber_entity.get_ids_without_notification(incident_update_id, after_id, limit, status, to_id)
+
+    def get_id_ranges(self, partitions, status="verified"):
+        """Split subscriber IDs into contiguous ranges of about the same width"""
+        min_id, max_id = self.__subscriber_entity.get_id_range(status)
+        if min_id is None:
+            return []
+        width = -(-(max_id - min_id + 1) // max(partitions, 1))
+        return [(start, min(start + width - 1, max_id)) for start in range(min_id, max_id + 1, width)]
+
     def get_all(self, offset=None, limit=None):
         return self.__subscriber_entity.get_all(offset, limit)
 
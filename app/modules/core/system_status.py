@@ -0,0 +1,92 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import json
+
+# Local Library
+from app.modules.core.constants import Constants
+from app.modules.entity.status_snapshot_entity import StatusSnapshotEntity
+from app.modules.entity.incident_update_component_entity import IncidentUpdateComponentEntity
+
+
+class SystemStatus():
+    """Persisted snapshot of the components affected by open incidents"""
+
+    SNAPSHOT_KEY = "system_status"
+
+    # Component statuses ordered from the least to the most severe
+    SEVERITY = [
+        "operational",
+        "maintenance",
+        "degraded_performance",
+        "partial_outage",
+        "major_outage"
+    ]
+
+    def __init__(self):
+        self.__status_snapshot_entity = StatusSnapshotEntity()
+        self.__incident_update_component_entity = IncidentUpdateComponentEntity()
+
+    def get(self):
+        value = self.__status_snapshot_entity.get_value_by_key(SystemStatus.SNAPSHOT_KEY, None)
+
+        if value is None:
+            return self.refresh()
+
+        return json.loads(value)
+
+    def refresh(self):
+        system_status = self.build()
+        self.__status_snapshot_entity.update_value_by_key(SystemStatus.SNAPSHOT_KEY, json.dumps(system_status))
+        return system_status
+
+    def build(self):
+        system_status = {
+            "affected_components_map": {},
+            "affected_components_status": {},
+            "affected_groups_map": {},
+            "affected_groups_status": {},
+            "overall_status": Constants.COMPONENT_STATUSES["operational"],
+        }
+
+        # Components linked to the latest update of each open incident
+        for update_component in self.__incident_update_component_entity.get_all_by_open_incidents():
+            component = update_component.component
+
+            system_status["affected_components_map"][component.name] = component.id
+            system_status["affected_components_status"][component.name] = self.__worst(
+                system_status["affected_components_status"].get(component.name),
+                update_component.type
+            )
+
+            if component.group:
+                system_status["affected_groups_map"][component.group.name] = component.group.id
+                system_status["affected_groups_status"][component.group.name] = self.__worst(
+                    system_status["affected_groups_status"].get(component.group.name),
+                    update_component.type
+                )
+
+        overall_status = self.__worst(None, *system_status["affected_components_status"].values())
+
+        if overall_status is not None:
+            system_status["overall_status"] = Constants.COMPONENT_STATUSES[overall_status]
+
+        return system_status
+
+    def __worst(self, current, *statuses):
+        for status in statuses:
+            if current is None or SystemStatus.SEVERITY.index(status) > SystemStatus.SEVERITY.index(current):
+                current = status
+        return current
@@ -13,17 +13,32 @@
 # limitations under the License.
 
 # Standard Library
+import os
 import json
 import importlib
+import threading
+
+# Third Party Library
+from django.db import connection
 
 # Local Library
 from app.modules.entity.task_entity import TaskEntity
+from app.modules.entity.notification_entity import NotificationEntity
 
 
 class Task():
 
+    # Completed task results waiting to be written, shared by the worker process threads. They are
+    # flushed on worker shutdown, a killed worker loses up to one flush interval and leaves those tasks pending.
+    _results = {}
+    _lock = threading.Lock()
+    _timer = None
+
     def __init__(self):
         self.__task_entity = TaskEntity()
+        self.__notification_entity = NotificationEntity()
+        self.__batch_size = int(os.getenv("TASK_RESULT_BATCH_SIZE", 50))
+        self.__flush_interval = float(os.getenv("TASK_RESULT_FLUSH_INTERVAL", 2))
 
     def get_task_with_uuid(self, uuid):
         return self.__task_entity.get_one_by_uuid(uuid)
@@ -40,6 +55,10 @@ class Task():
 
         task_result = task_object.delay(**parameters)
 
+        if not getattr(task_object, "tracked", True):
+            # Fire-and-forget tasks leave no task row behind
+            return task_result.task_id != ""
+
         if task_result.task_id != "":
 
             return self.create_task({
@@ -58,3 +77,50 @@ class Task():
 
     def delete_old_tasks_by_executor(self, executor, minutes):
         return self.__task_entity.delete_old_tasks_by_executor(executor, minutes)
+
+    def buffer_result(self, uuid, result):
+        """Queue a completed task result, written with others once the batch is full or the interval passed"""
+        with Task._lock:
+            Task._results[uuid] = result
+            flush = len(Task._results) >= self.__batch_size
+            if not flush and Task._timer is None:
+                Task._timer = threading.Timer(self.__flush_interval, self.__flush_later)
+                Task._timer.daemon = True
+                Task._timer.start()
+
+        if flush:
+            self.flush_results()
+
+    def flush_results(self):
+        """Write buffered task results and their notifications"""
+        with Task._lock:
+            results = Task._results
+            Task._results = {}
+            if Task._timer is not None:
+                Task._timer.cancel()
+                Task._timer = None
+
+        if len(results) == 0:
+            return 0
+
+        tasks = self.__task_entity.update_many_results(results)
+
+        notify_types = {}
+        for task in tasks:
+            if "notify_type" in results[task.uuid]:
+                notify_types.setdefault(results[task.uuid]["notify_type"], []).append(task.id)
+
+        for notify_type, task_ids in notify_types.items():
+            self.__notification_entity.update_many_by_task_ids(task_ids, {
+                "type": notify_type,
+                "delivered": False
+            })
+
+        return len(tasks)
+
+    def __flush_later(self):
+        try:
+            self.flush_results()
+        finally:
+            # The timer thread owns its own database connection
+            connection.close()
@@ -0,0 +1,252 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import math
+import time
+from datetime import timedelta
+
+# Third Party Library
+from django.utils import timezone
+from django.core.cache import cache
+from dateutil.parser import parse
+from django.utils.translation import get_language
+from django.utils.translation import gettext as _
+
+# Local Library
+from app.modules.util.helpers import Helpers
+from app.modules.core.constants import Constants
+from app.modules.core.page_cache import PageCache
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.component_entity import ComponentEntity
+from app.modules.entity.uptime_rollup_entity import UptimeRollupEntity
+from app.modules.entity.status_snapshot_entity import StatusSnapshotEntity
+from app.modules.entity.component_group_entity import ComponentGroupEntity
+
+
+class Uptime():
+    """Daily Downtime Rollup and Uptime Charts"""
+
+    DIRTY_KEY = "uptime_dirty_from"
+    ROLLUP_KEY = "uptime_rolled_up_on"
+    VERSION_KEY = "uptime_rolled_up_at"
+
+    # Statuses counted as downtime, ordered from the least to the most severe
+    DOWNTIME_STATUSES = [
+        "maintenance",
+        "degraded_performance",
+        "partial_outage",
+        "major_outage"
+    ]
+
+    COLORS = {
+        "operational": "#5eba00",
+        "maintenance": "#f1c40f",
+        "degraded_performance": "#f1c40f",
+        "partial_outage": "#fd9644",
+        "major_outage": "#cd201f"
+    }
+
+    BAR_WIDTH = 3
+    BAR_HEIGHT = 34
+    BAR_SPACING = 5
+
+    def __init__(self):
+        self.__helpers = Helpers()
+        self.__incident_entity = IncidentEntity()
+        self.__component_entity = ComponentEntity()
+        self.__uptime_rollup_entity = UptimeRollupEntity()
+        self.__status_snapshot_entity = StatusSnapshotEntity()
+        self.__component_group_entity = ComponentGroupEntity()
+        self.__period = int(os.getenv("UPTIME_PERIOD_DAYS", 90))
+        self.__charts = {}
+
+    def mark_dirty(self, value):
+        """Mark rollup rows from the day of value onward as outdated"""
+        day = self.__helpers.local_date(value)
+        dirty_from = self.__status_snapshot_entity.get_value_by_key(Uptime.DIRTY_KEY, None)
+
+        if dirty_from is None or day < parse(dirty_from).date():
+            self.__status_snapshot_entity.update_value_by_key(Uptime.DIRTY_KEY, day.isoformat())
+
+    def rollup(self):
+        """Recompute outdated days and the days that are still in progress"""
+        today = self.__helpers.local_date(timezone.now())
+        from_day = today - timedelta(days=self.__period - 1)
+
+        dirty_from = self.__status_snapshot_entity.get_value_by_key(Uptime.DIRTY_KEY, None)
+        rolled_up_on = self.__status_snapshot_entity.get_value_by_key(Uptime.ROLLUP_KEY, None)
+
+        if rolled_up_on is not None:
+            days = [parse(rolled_up_on).date()]
+            if dirty_from is not None:
+                days.append(parse(dirty_from).date())
+            from_day = max(from_day, min(days))
+
+        changed = self.rollup_days(from_day, today)
+
+        # Keep the marker if a write moved it while the rollup was running
+        if self.__status_snapshot_entity.get_value_by_key(Uptime.DIRTY_KEY, None) == dirty_from:
+            self.__status_snapshot_entity.delete_one_by_key(Uptime.DIRTY_KEY)
+        self.__status_snapshot_entity.update_value_by_key(Uptime.ROLLUP_KEY, today.isoformat())
+
+        # Charts only move when rows changed or a new day started
+        if changed or rolled_up_on != today.isoformat():
+            self.__status_snapshot_entity.update_value_by_key(Uptime.VERSION_KEY, str(int(time.time() * 1000)))
+            PageCache().invalidate()
+
+        return {
+            "from": from_day.isoformat(),
+            "to": today.isoformat(),
+            "changed": changed
+        }
+
+    def rollup_days(self, from_day, to_day):
+        """Recompute the rollup rows between two days (inclusive)"""
+        boundaries = [self.__helpers.day_start(from_day + timedelta(days=i)) for i in range((to_day - from_day).days + 2)]
+        intervals = self.__get_intervals(boundaries[0], boundaries[-1])
+
+        items = []
+        for (type, id), item_intervals in intervals.items():
+            for day, minutes in self.__get_daily_minutes(item_intervals, boundaries).items():
+                item = {"day": day}
+                item["%s_id" % type] = id
+                for status in Uptime.DOWNTIME_STATUSES:
+                    item[status] = int(math.ceil(minutes.get(status, 0)))
+                items.append(item)
+
+        return self.__uptime_rollup_entity.replace_range(from_day, to_day, items)
+
+    def get_chart(self, id, type, period=90):
+        return self.get_charts(period).get("%s-%s" % (type, id), [])
+
+    def get_charts(self, period=90):
+        if period in self.__charts:
+            return self.__charts[period]
+
+        today = self.__helpers.local_date(timezone.now())
+        # The version is read from the database since the rollup runs in the Celery processes
+        key = "uptime_charts:%(version)s:%(day)s:%(language)s:%(period)d" % {
+            "version": self.__status_snapshot_entity.get_value_by_key(Uptime.VERSION_KEY, 0),
+            "day": today.isoformat(),
+            "language": get_language(),
+            "period": period
+        }
+
+        charts = cache.get(key)
+        if charts is None:
+            charts = self.build_charts(today, period)
+            cache.set(key, charts, 86400)
+
+        self.__charts[period] = charts
+        return charts
+
+    def build_charts(self, today, period=90):
+        from_day = today - timedelta(days=period - 1)
+
+        rows = {}
+        for row in self.__uptime_rollup_entity.get_many_in_range(from_day, today):
+            key = "component-%s" % row.component_id if row.component_id else "group-%s" % row.group_id
+            rows.setdefault(key, {})[row.day] = row
+
+        items = ["component-%d" % component.id for component in self.__component_entity.get_many_by_uptime("on")]
+        items.extend(["group-%d" % group.id for group in self.__component_group_entity.get_many_by_uptime("on")])
+
+        charts = {}
+        for item in items:
+            charts[item] = []
+            for i in range(period):
+                day = from_day + timedelta(days=i)
+                status, content = self.__get_bar_status(day, rows.get(item, {}).get(day))
+                charts[item].append({
+                    "height": Uptime.BAR_HEIGHT,
+                    "width": Uptime.BAR_WIDTH,
+                    "x": i * Uptime.BAR_SPACING,
+                    "y": 0,
+                    "fill": Uptime.COLORS[status],
+                    "content": content
+                })
+
+        return charts
+
+    def __get_bar_status(self, day, row):
+        date = day.strftime("%b %d, %Y")
+        details = []
+        status = "operational"
+
+        if row:
+            for item in Uptime.DOWNTIME_STATUSES:
+                minutes = getattr(row, item)
+                if minutes > 0:
+                    status = item
+                    details.insert(0, _("%(status)s %(minutes)d mins") % {
+                        "status": Constants.COMPONENT_STATUSES[item],
+                        "minutes": minutes
+                    })
+
+        if len(details) == 0:
+            return status, _("%(date)s: No downtime recorded") % {"date": date}
+
+        return status, "%(date)s: %(details)s" % {"date": date, "details": ", ".join(details)}
+
+    def __get_intervals(self, from_date, to_date):
+        """Get (start, end, status) intervals per component and group from incident updates"""
+        now = timezone.now()
+        intervals = {}
+
+        for incident in self.__incident_entity.get_incident_overlapping_range(from_date, to_date):
+            updates = list(incident.incidentupdate_set.all())
+
+            for i, update in enumerate(updates):
+                if i + 1 < len(updates):
+                    end = updates[i + 1].datetime
+                elif incident.status == "open":
+                    end = now
+                else:
+                    end = update.datetime
+
+                start = max(update.datetime, from_date)
+                end = min(end, to_date, now)
+
+                if start >= end:
+                    continue
+
+                for item in update.incidentupdatecomponent_set.all():
+                    if item.type not in Uptime.DOWNTIME_STATUSES:
+                        continue
+                    intervals.setdefault(("component", item.component_id), []).append((start, end, item.type))
+                    if item.component.group_id:
+                        intervals.setdefault(("group", item.component.group_id), []).append((start, end, item.type))
+
+        return intervals
+
+    def __get_daily_minutes(self, intervals, boundaries):
+        """Split intervals on day boundaries and count minutes of the worst status per day"""
+        points = set(boundaries)
+        for start, end, status in intervals:
+            points.add(start)
+            points.add(end)
+        points = sorted(point for point in points if boundaries[0] <= point <= boundaries[-1])
+
+        daily_minutes = {}
+        for start, end in zip(points, points[1:]):
+            statuses = [status for item_start, item_end, status in intervals if item_start <= start < item_end]
+            if len(statuses) == 0:
+                continue
+            status = max(statuses, key=Uptime.DOWNTIME_STATUSES.index)
+            minutes = daily_minutes.setdefault(self.__helpers.local_date(start), {})
+            minutes[status] = minutes.get(status, 0) + (end - start).total_seconds() / 60
+
+        return daily_minutes
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Third Party Library
+from django.db.models import Q
+
 # Local Library
 from app.models import Component
 from app.models import ComponentGroup
@@ -82,6 +85,9 @@ class ComponentEntity():
     def count_all(self):
         return Component.objects.count()
 
+    def get_many_by_uptime(self, uptime):
+        return Component.objects.filter(uptime=uptime)
+
     def get_all(self, offset=None, limit=None):
         if offset is None or limit is None:
             return Component.objects.order_by('-created_at')
@@ -91,6 +97,9 @@ class ComponentEntity():
     def get_all_components_by_group(self, group_id):
         return Component.objects.filter(group_id=group_id).order_by('name')
 
+    def get_many_by_ids_or_groups(self, ids, group_ids):
+        return Component.objects.filter(Q(id__in=ids) | Q(group_id__in=group_ids)).order_by('name')
+
     def count(self, group_id=None):
         if group_id is None:
             return Component.objects.count()
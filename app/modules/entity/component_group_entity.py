@@ -75,6 +75,12 @@ class ComponentGroupEntity():
     def count_all(self):
         return ComponentGroup.objects.count()
 
+    def get_many_by_ids(self, ids):
+        return ComponentGroup.objects.filter(id__in=ids)
+
+    def get_many_by_uptime(self, uptime):
+        return ComponentGroup.objects.filter(uptime=uptime)
+
     def get_all(self, offset=None, limit=None):
         if offset is None or limit is None:
             return ComponentGroup.objects.order_by('-created_at')
@@ -13,15 +13,20 @@
 # limitations under the License.
 
 # Standard Library
-import os
 import datetime
 
 # Third Party Library
 from django.utils import timezone
+from django.db.models import Q
+from django.db.models import OuterRef
+from django.db.models import Prefetch
+from django.db.models import Subquery
 from django.db.models.aggregates import Count
 
 # Local Library
 from app.models import Incident
+from app.models import IncidentUpdate
+from app.models import IncidentUpdateComponent
 
 
 class IncidentEntity():
@@ -74,25 +79,43 @@ class IncidentEntity():
 
         return Incident.objects.order_by('-created_at')[offset:limit+offset]
 
-    def get_incident_from_days(self, days=7):
-        convert_tz = True if (os.getenv("CONVERT_TZ", "False") == "True") else False
-        if convert_tz:
-            last_x_days = (timezone.now() - datetime.timedelta(days)).strftime('%Y-%m-%d')
-            return Incident.objects.filter(datetime__date=last_x_days).order_by('-datetime')
-        else:
-            last_x_days = (timezone.now() - datetime.timedelta(days))
-            return Incident.objects.filter(datetime__date_c_eq=last_x_days).order_by('-datetime')
-
-    def get_incident_on_month(self, date):
-        convert_tz = True if (os.getenv("CONVERT_TZ", "False") == "True") else False
-        if convert_tz:
-            return Incident.objects.filter(datetime__month=date.month).filter(datetime__year=date.year).order_by('-datetime')
-        else:
-            return Incident.objects.filter(datetime__month_c_eq=date, datetime__year_c_eq=date).order_by('-datetime')
+    def get_incident_in_range(self, from_date, to_date):
+        return Incident.objects.filter(
+            datetime__gte=from_date,
+            datetime__lt=to_date
+        ).order_by('-datetime').prefetch_related(Prefetch(
+            "incidentupdate_set",
+            queryset=IncidentUpdate.objects.order_by('-created_at')
+        ))
+
+    def get_incident_in_range_with_last_update(self, from_date, to_date):
+        last_update = IncidentUpdate.objects.filter(incident_id=OuterRef("pk")).order_by('-created_at').values("datetime")[:1]
+        return Incident.objects.filter(
+            datetime__gte=from_date,
+            datetime__lt=to_date
+        ).annotate(last_update_datetime=Subquery(last_update)).order_by('-datetime')
+
+    def get_incident_overlapping_range(self, from_date, to_date):
+        return Incident.objects.filter(
+            Q(status="open") | Q(incidentupdate__datetime__gte=from_date),
+            datetime__lt=to_date
+        ).distinct().prefetch_related(
+            Prefetch("incidentupdate_set", queryset=IncidentUpdate.objects.order_by('datetime')),
+            Prefetch(
+                "incidentupdate_set__incidentupdatecomponent_set",
+                queryset=IncidentUpdateComponent.objects.select_related("component")
+            )
+        )
 
     def get_by_status(self, status):
         return Incident.objects.filter(status=status).order_by('-created_at')
 
+    def get_by_status_with_updates(self, status):
+        return self.get_by_status(status).prefetch_related(Prefetch(
+            "incidentupdate_set",
+            queryset=IncidentUpdate.objects.order_by('-created_at')
+        ))
+
     def get_one_by_id(self, incident_id):
         try:
             incident = Incident.objects.get(id=incident_id)
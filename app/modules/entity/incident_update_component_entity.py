@@ -18,9 +18,12 @@ import datetime
 # Third Party Library
 import pytz
 from django.utils import timezone
+from django.db.models import OuterRef
+from django.db.models import Subquery
 from django.db.models.aggregates import Count
 
 # Local Library
+from app.models import Incident
 from app.models import Component
 from app.models import IncidentUpdate
 from app.models import IncidentUpdateComponent
@@ -66,6 +69,16 @@ class IncidentUpdateComponentEntity():
     def get_all(self, incident_update_id):
         return IncidentUpdateComponent.objects.filter(incident_update_id=incident_update_id).order_by('-created_at')
 
+    def get_all_by_open_incidents(self):
+        last_update = IncidentUpdate.objects.filter(incident_id=OuterRef("pk")).order_by('-created_at').values("id")[:1]
+        update_ids = list(Incident.objects.filter(status="open").annotate(
+            last_update_id=Subquery(last_update)
+        ).values_list("last_update_id", flat=True))
+
+        return IncidentUpdateComponent.objects.filter(
+            incident_update_id__in=update_ids
+        ).select_related("component", "component__group").order_by('-created_at')
+
     def get_one_by_id(self, id):
         try:
             item = IncidentUpdateComponent.objects.get(id=id)
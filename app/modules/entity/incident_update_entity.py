@@ -16,6 +16,7 @@
 import datetime
 
 # Third Party Library
+from django.db.models import F
 from django.utils import timezone
 from django.db.models.aggregates import Count
 
@@ -23,10 +24,19 @@ from django.db.models.aggregates import Count
 # Local Library
 from app.models import Incident
 from app.models import IncidentUpdate
+from app.models import IncidentUpdateNotification
 
 
 class IncidentUpdateEntity():
 
+    COUNTERS = {
+        "pending": "pending_notifications",
+        "success": "sent_notifications",
+        "failed": "failed_notifications",
+        "dead": "dead_notifications",
+        "coalesced": "coalesced_notifications"
+    }
+
     def insert_one(self, update):
 
         new_update = IncidentUpdate()
@@ -74,11 +84,58 @@ class IncidentUpdateEntity():
             if "incident_id" in update_data:
                 update.incident = None if update_data["incident_id"] is None else Incident.objects.get(pk=update_data["incident_id"])
 
-            update.save()
+            # Leave the notification counters to the delivery path
+            update.save(update_fields=[
+                "status",
+                "notify_subscribers",
+                "total_suscribers",
+                "datetime",
+                "message",
+                "incident",
+                "updated_at"
+            ])
 
             return True
         return False
 
+    def update_counters(self, update_id, deltas):
+        """Increment Notification Counters of an Incident Update by Status Deltas"""
+        changes = {
+            IncidentUpdateEntity.COUNTERS[status]: F(IncidentUpdateEntity.COUNTERS[status]) + delta
+            for status, delta in deltas.items() if delta != 0 and status in IncidentUpdateEntity.COUNTERS
+        }
+        if len(changes) == 0:
+            return 0
+        return IncidentUpdate.objects.filter(id=update_id).update(**changes)
+
+    def start_fanout(self, update_id, partitions):
+        """Reset Fan-out Progress of an Incident Update"""
+        return IncidentUpdate.objects.filter(id=update_id).update(
+            fanout_partitions=partitions,
+            fanout_partitions_done=0,
+            fanout_started_at=timezone.now(),
+            fanout_finished_at=None
+        )
+
+    def complete_fanout_partition(self, update_id):
+        """Count a Finished Fan-out Partition of an Incident Update"""
+        return IncidentUpdate.objects.filter(id=update_id).update(fanout_partitions_done=F("fanout_partitions_done") + 1)
+
+    def finish_fanout(self, update_id):
+        return IncidentUpdate.objects.filter(id=update_id).update(fanout_finished_at=timezone.now())
+
+    def reconcile_counters(self, update_id):
+        """Recompute Notification Counters of an Incident Update From Its Notifications"""
+        counts = dict.fromkeys(IncidentUpdateEntity.COUNTERS.values(), 0)
+        for row in IncidentUpdateNotification.objects.filter(incident_update_id=update_id).values("status").annotate(count=Count("id")).order_by():
+            if row["status"] in IncidentUpdateEntity.COUNTERS:
+                counts[IncidentUpdateEntity.COUNTERS[row["status"]]] = row["count"]
+        IncidentUpdate.objects.filter(id=update_id).update(**counts)
+        return counts
+
+    def get_ids(self, after_id=0, limit=500):
+        return list(IncidentUpdate.objects.filter(id__gt=after_id).order_by('id').values_list('id', flat=True)[:limit])
+
     def count_all(self, incident_id):
         return IncidentUpdate.objects.filter(incident_id=incident_id).count()
 
@@ -14,9 +14,16 @@
 
 # Standard Library
 import datetime
+import random
+import operator
+from functools import reduce
 
 # Third Party Library
+from django.db.models import Q
 from django.utils import timezone
+from django.db import connection
+from django.db import transaction
+from django.db import IntegrityError
 from django.db.models.aggregates import Count
 
 # Local Library
@@ -42,6 +49,41 @@ class IncidentUpdateNotificationEntity():
         new_item.save()
         return False if new_item.pk is None else new_item
 
+    def insert_many(self, incident_update_id, subscriber_ids, status="pending", next_attempts=None):
+        """Insert Notifications of an Incident Update For Many Subscribers"""
+        next_attempts = {} if next_attempts is None else next_attempts
+
+        while len(subscriber_ids) > 0:
+            try:
+                with transaction.atomic():
+                    IncidentUpdateNotification.objects.bulk_create([IncidentUpdateNotification(
+                        incident_update_id=incident_update_id,
+                        subscriber_id=subscriber_id,
+                        status=status,
+                        next_attempt_at=next_attempts.get(subscriber_id)
+                    ) for subscriber_id in subscriber_ids])
+                return len(subscriber_ids)
+            except IntegrityError:
+                # Another fan-out inserted some of them first, insert only the missing ones
+                existing = set(IncidentUpdateNotification.objects.filter(
+                    incident_update_id=incident_update_id,
+                    subscriber_id__in=subscriber_ids
+                ).values_list('subscriber_id', flat=True))
+                subscriber_ids = [subscriber_id for subscriber_id in subscriber_ids if subscriber_id not in existing]
+
+        return 0
+
+    def get_ids_by_update_status(self, incident_update_id, statuses, after_id=0, limit=500, subscriber_range=None):
+        """Get Next IDs of an Incident Update Notifications Having One of Statuses"""
+        notifications = IncidentUpdateNotification.objects.filter(
+            incident_update_id=incident_update_id,
+            status__in=statuses,
+            id__gt=after_id
+        )
+        if subscriber_range is not None:
+            notifications = notifications.filter(subscriber_id__gte=subscriber_range[0], subscriber_id__lte=subscriber_range[1])
+        return list(notifications.order_by('id').values_list('id', flat=True)[:limit])
+
     def update_one_by_id(self, id, data):
         item = self.get_one_by_id(id)
         if item is not False:
@@ -69,6 +111,124 @@ class IncidentUpdateNotificationEntity():
         except Exception:
             return False
 
+    def get_many_by_ids(self, ids):
+        """Get Many Notifications With Their Subscriber and Incident"""
+        return IncidentUpdateNotification.objects.filter(id__in=ids).select_related(
+            'subscriber',
+            'incident_update__incident'
+        ).order_by('id')
+
+    def claim_many(self, items, statuses):
+        """Claim Notifications Not Changed Since They Were Loaded, Return IDs of the Claimed Ones"""
+        if len(items) == 0:
+            return []
+        # A random offset keeps the claim unique to this worker
+        now = timezone.now() + datetime.timedelta(microseconds=random.randint(0, 999))
+        IncidentUpdateNotification.objects.filter(
+            reduce(operator.or_, [Q(id=item.id, updated_at=item.updated_at) for item in items]),
+            status__in=statuses
+        ).update(updated_at=now)
+        claimed = list(IncidentUpdateNotification.objects.filter(
+            id__in=[item.id for item in items],
+            updated_at=now
+        ).order_by('id').values_list('id', flat=True))
+        for item in items:
+            if item.id in claimed:
+                item.updated_at = now
+        return claimed
+
+    def get_subscriber_types_by_ids(self, ids):
+        """Get Subscriber Type of Many Notifications"""
+        return dict(IncidentUpdateNotification.objects.filter(id__in=ids).values_list('id', 'subscriber__type'))
+
+    def get_history(self, subscriber_ids, incident_ids):
+        """Get Notifications of Many Subscribers For All Updates of Many Incidents"""
+        return IncidentUpdateNotification.objects.filter(
+            subscriber_id__in=subscriber_ids,
+            incident_update__incident_id__in=incident_ids
+        ).order_by('incident_update_id').values(
+            'subscriber_id',
+            'status',
+            'incident_update_id',
+            'incident_update__incident_id',
+            'incident_update__status',
+            'incident_update__datetime'
+        )
+
+    def update_many_status_by_ids(self, ids, status):
+        """Update Status of Many Notifications"""
+        if len(ids) == 0:
+            return 0
+        return IncidentUpdateNotification.objects.filter(id__in=ids).update(status=status, updated_at=timezone.now())
+
+    def update_many_attempts(self, items):
+        """Save Delivery Attempts of Many Notifications"""
+        if len(items) == 0:
+            return 0
+        now = timezone.now()
+        for item in items:
+            item.updated_at = now
+        return IncidentUpdateNotification.objects.bulk_update(
+            items,
+            ["status", "attempts", "last_error", "next_attempt_at", "updated_at"]
+        )
+
+    def get_due_ids(self, status, limit=500):
+        """Get IDs of Notifications Due For Another Attempt"""
+        return list(IncidentUpdateNotification.objects.filter(
+            status=status,
+            next_attempt_at__lte=timezone.now()
+        ).order_by('next_attempt_at', 'id').values_list('id', flat=True)[:limit])
+
+    def __get_claimable(self, statuses, now):
+        return IncidentUpdateNotification.objects.filter(status__in=statuses).filter(
+            Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now)
+        )
+
+    def claim_ids(self, statuses, lease_until, limit=50):
+        """Claim IDs of Notifications Not Leased by Another Worker Until a Lease Time"""
+        now = timezone.now()
+
+        if connection.features.has_select_for_update_skip_locked:
+            with transaction.atomic():
+                ids = list(self.__get_claimable(statuses, now).select_for_update(skip_locked=True).order_by('id').values_list('id', flat=True)[:limit])
+                IncidentUpdateNotification.objects.filter(id__in=ids).update(next_attempt_at=lease_until)
+            return ids
+
+        # Without SKIP LOCKED, workers race on a conditional update and keep the rows carrying their lease
+        ids = list(self.__get_claimable(statuses, now).order_by('id').values_list('id', flat=True)[:limit])
+        self.__get_claimable(statuses, now).filter(id__in=ids).update(next_attempt_at=lease_until)
+        return list(IncidentUpdateNotification.objects.filter(id__in=ids, next_attempt_at=lease_until).order_by('id').values_list('id', flat=True))
+
+    def count_claimable(self, statuses):
+        return self.__get_claimable(statuses, timezone.now()).count()
+
+    def update_many_next_attempt_by_ids(self, ids, next_attempt_at):
+        """Update Next Attempt Time of Many Notifications"""
+        if len(ids) == 0:
+            return 0
+        return IncidentUpdateNotification.objects.filter(id__in=ids).update(next_attempt_at=next_attempt_at, updated_at=timezone.now())
+
+    def reset_many_by_ids(self, ids, from_status, to_status, next_attempt_at=None):
+        """Reset Attempts of Many Notifications Having a Status"""
+        if len(ids) == 0:
+            return 0
+        return IncidentUpdateNotification.objects.filter(id__in=ids, status=from_status).update(
+            status=to_status,
+            attempts=0,
+            next_attempt_at=next_attempt_at,
+            updated_at=timezone.now()
+        )
+
+    def get_coalesced_before(self, subscriber_id, incident_id, incident_update_id):
+        """Get Coalesced Notifications of a Subscriber For Earlier Updates of an Incident"""
+        return IncidentUpdateNotification.objects.filter(
+            subscriber_id=subscriber_id,
+            incident_update__incident_id=incident_id,
+            incident_update_id__lt=incident_update_id,
+            status="coalesced"
+        ).values('id', 'incident_update_id')
+
     def count_by_update_status(self, update_id, status):
         return IncidentUpdateNotification.objects.filter(status=status, incident_update_id=update_id).count()
 
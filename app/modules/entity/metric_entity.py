@@ -85,6 +85,9 @@ class MetricEntity():
         except Exception:
             return False
 
+    def get_many_by_ids(self, ids):
+        return Metric.objects.filter(id__in=ids)
+
     def get_one_by_title(self, title):
         try:
             metric = Metric.objects.get(title=title)
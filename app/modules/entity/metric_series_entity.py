@@ -0,0 +1,43 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Local Library
+from app.models import MetricSeries
+
+
+class MetricSeriesEntity():
+
+    def get_many_by_metrics(self, metric_ids):
+        """Get Stored Series For Many Metrics"""
+        return MetricSeries.objects.filter(metric_id__in=metric_ids)
+
+    def update_one_by_metric(self, metric_id, period, timestamps, values):
+        """Insert or Update Metric Series By Period"""
+        series, created = MetricSeries.objects.update_or_create(
+            metric_id=metric_id,
+            period=period,
+            defaults={"timestamps": timestamps, "values": values}
+        )
+        return False if series.pk is None else series
+
+    def delete_many_by_metric(self, metric_id):
+        """Delete Stored Series of a Metric"""
+        count, deleted = MetricSeries.objects.filter(metric_id=metric_id).delete()
+        return True if count > 0 else False
+
+    def count_all(self):
+        return MetricSeries.objects.count()
+
+    def truncate(self):
+        return MetricSeries.objects.all().delete()
@@ -13,6 +13,7 @@
 # limitations under the License.
 
 # Third Party Library
+from django.utils import timezone
 from django.contrib.auth.models import User
 
 # Local Library
@@ -95,6 +96,12 @@ class NotificationEntity():
             return True
         return False
 
+    def update_many_by_task_ids(self, task_ids, new_data):
+        """Update Notifications of Many Tasks"""
+        if len(task_ids) == 0:
+            return 0
+        return Notification.objects.filter(task_id__in=task_ids).update(updated_at=timezone.now(), **new_data)
+
     def update_one_by_task_id(self, task_id, new_data):
         notification = self.get_one_by_task_id(task_id)
 
@@ -12,12 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Standard Library
+import copy
+import time
+
+# Third Party Library
+from django.conf import settings
+from django.db import connection
+from django.core.cache import cache
+
 # Local Library
 from app.models import Option
 
 
 class OptionEntity():
 
+    VERSION_KEY = "option_cache_version"
+
+    # Options loaded by this process and the shared version they were loaded at
+    _options = {"version": None, "items": {}}
+
     def insert_one(self, option):
         """Insert a New Option"""
         if self.get_one_by_key(option["key"]) is not False:
@@ -30,6 +44,7 @@ class OptionEntity():
         )
 
         option.save()
+        self.__bump_version()
         return False if option.pk is None else option
 
     def insert_many(self, options):
@@ -49,6 +64,11 @@ class OptionEntity():
 
     def get_one_by_key(self, key):
         """Get Option By Key"""
+        options = self.__get_cached_options()
+
+        if options is not None:
+            return copy.copy(options[key]) if key in options else False
+
         try:
             option = Option.objects.get(key=key)
             return False if option.pk is None else option
@@ -57,6 +77,11 @@ class OptionEntity():
 
     def get_value_by_key(self, key, default=""):
         """Get Option Value By Key"""
+        options = self.__get_cached_options()
+
+        if options is not None:
+            return options[key].value if key in options else default
+
         try:
             option = Option.objects.get(key=key)
             return default if option.pk is None else option.value
@@ -65,13 +90,21 @@ class OptionEntity():
 
     def get_many_by_autoload(self, autoload):
         """Get Many Options By Autoload"""
-        options = Option.objects.filter(autoload=autoload)
-        return options
+        options = self.__get_cached_options()
+
+        if options is not None:
+            return [copy.copy(option) for option in options.values() if option.autoload == autoload]
+
+        return list(Option.objects.filter(autoload=autoload).order_by("id"))
 
     def get_many_by_keys(self, keys):
         """Get Many Options By Keys"""
-        options = Option.objects.filter(key__in=keys)
-        return options
+        options = self.__get_cached_options()
+
+        if options is not None:
+            return [copy.copy(option) for option in options.values() if option.key in keys]
+
+        return list(Option.objects.filter(key__in=keys).order_by("id"))
 
     def update_value_by_id(self, id, value):
         """Update Option Value By ID"""
@@ -79,6 +112,7 @@ class OptionEntity():
         if option is not False:
             option.value = value
             option.save()
+            self.__bump_version()
             return True
         return False
 
@@ -88,6 +122,7 @@ class OptionEntity():
         if option is not False:
             option.value = value
             option.save()
+            self.__bump_version()
             return True
         else:
             return self.insert_one({
@@ -105,6 +140,7 @@ class OptionEntity():
         option = self.get_one_by_id(id)
         if option is not False:
             count, deleted = option.delete()
+            self.__bump_version()
             return True if count > 0 else False
         return False
 
@@ -113,8 +149,41 @@ class OptionEntity():
         option = self.get_one_by_key(key)
         if option is not False:
             count, deleted = option.delete()
+            self.__bump_version()
             return True if count > 0 else False
         return False
 
     def truncate(self):
-        return Option.objects.all().delete()
+        result = Option.objects.all().delete()
+        self.__bump_version()
+        return result
+
+    def __get_cached_options(self):
+        """Get all options from the process cache, reloading them once another worker changed one"""
+        if not settings.CACHE_SHARED:
+            # Other processes would never see the version bumped by a write
+            return None
+
+        if connection.in_atomic_block:
+            # Transactions read their own writes and never fill the cache with uncommitted values
+            return None
+
+        version = cache.get(OptionEntity.VERSION_KEY)
+        if version is None:
+            cache.add(OptionEntity.VERSION_KEY, int(time.time() * 1000), None)
+            version = cache.get(OptionEntity.VERSION_KEY)
+
+        if OptionEntity._options["version"] != version:
+            OptionEntity._options = {
+                "version": version,
+                "items": {option.key: option for option in Option.objects.order_by("id")}
+            }
+
+        return OptionEntity._options["items"]
+
+    def __bump_version(self):
+        OptionEntity._options = {"version": None, "items": {}}
+        try:
+            cache.incr(OptionEntity.VERSION_KEY)
+        except ValueError:
+            cache.set(OptionEntity.VERSION_KEY, int(time.time() * 1000), None)
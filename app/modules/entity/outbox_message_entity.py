@@ -0,0 +1,79 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third Party Library
+from django.utils import timezone
+from django.db.models import F
+from django.db.models import Q
+
+# Local Library
+from app.models import OutboxMessage
+
+
+class OutboxMessageEntity():
+
+    def insert_one(self, message):
+        """Insert Outbox Message"""
+        new_message = OutboxMessage(
+            uuid=message["uuid"],
+            task=message["task"],
+            parameters=message["parameters"],
+            dedup_key=message["dedup_key"] if "dedup_key" in message else ""
+        )
+
+        new_message.save()
+        return False if new_message.pk is None else new_message
+
+    def get_one_pending_by_dedup_key(self, dedup_key):
+        """Get Not Yet Published Outbox Message By Deduplication Key"""
+        return OutboxMessage.objects.filter(dedup_key=dedup_key, status="pending").order_by('id').first() or False
+
+    def get_many_pending_for_update(self, limit=100):
+        """Get and Lock Oldest Pending Outbox Messages Due For an Attempt, Must Run Inside a Transaction"""
+        return list(OutboxMessage.objects.select_for_update().filter(status="pending").filter(
+            Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=timezone.now())
+        ).order_by('id')[:limit])
+
+    def mark_many_published(self, ids):
+        """Mark Many Outbox Messages Published"""
+        if len(ids) == 0:
+            return 0
+        now = timezone.now()
+        return OutboxMessage.objects.filter(id__in=ids).update(
+            status="published",
+            attempts=F('attempts') + 1,
+            published_at=now,
+            updated_at=now
+        )
+
+    def record_failure(self, id, error, status="pending", next_attempt_at=None):
+        """Record a Failed Publish Attempt"""
+        return OutboxMessage.objects.filter(id=id).update(
+            status=status,
+            attempts=F('attempts') + 1,
+            last_error=error,
+            next_attempt_at=next_attempt_at,
+            updated_at=timezone.now()
+        )
+
+    def count_by_status(self, status):
+        return OutboxMessage.objects.filter(status=status).count()
+
+    def get_oldest_pending(self):
+        return OutboxMessage.objects.filter(status="pending").order_by('id').first() or False
+
+    def delete_published_before(self, before):
+        """Delete Outbox Messages Published Before a Datetime"""
+        count, deleted = OutboxMessage.objects.filter(status="published", published_at__lt=before).delete()
+        return count
@@ -0,0 +1,45 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Local Library
+from app.models import StatusSnapshot
+
+
+class StatusSnapshotEntity():
+
+    def get_one_by_key(self, key):
+        """Get Snapshot By Key"""
+        try:
+            snapshot = StatusSnapshot.objects.get(key=key)
+            return False if snapshot.pk is None else snapshot
+        except Exception:
+            return False
+
+    def get_value_by_key(self, key, default=""):
+        """Get Snapshot Value By Key"""
+        snapshot = self.get_one_by_key(key)
+        return default if snapshot is False else snapshot.value
+
+    def update_value_by_key(self, key, value):
+        """Insert or Update Snapshot Value By Key"""
+        snapshot, created = StatusSnapshot.objects.update_or_create(key=key, defaults={"value": value})
+        return False if snapshot.pk is None else snapshot
+
+    def delete_one_by_key(self, key):
+        """Delete Snapshot By Key"""
+        count, deleted = StatusSnapshot.objects.filter(key=key).delete()
+        return True if count > 0 else False
+
+    def truncate(self):
+        return StatusSnapshot.objects.all().delete()
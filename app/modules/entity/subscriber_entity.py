@@ -16,11 +16,16 @@
 import datetime
 
 # Third Party Library
+from django.db.models import Exists
+from django.db.models import OuterRef
+from django.db.models.aggregates import Max
+from django.db.models.aggregates import Min
 from django.db.models.aggregates import Count
 from django.utils import timezone
 
 # Local Library
 from app.models import Subscriber
+from app.models import IncidentUpdateNotification
 
 
 class SubscriberEntity():
@@ -98,6 +103,32 @@ class SubscriberEntity():
     def get_iterator(self, status="verified"):
         return Subscriber.objects.filter(status=status).iterator()
 
+    def get_ids_without_notification(self, incident_update_id, after_id=0, limit=500, status="verified", to_id=None):
+        """Get Next IDs of Subscribers Not Having a Notification For an Incident Update"""
+        notification = IncidentUpdateNotification.objects.filter(
+            incident_update_id=incident_update_id,
+            subscriber_id=OuterRef("pk")
+        )
+        subscribers = Subscriber.objects.annotate(
+            notified=Exists(notification)
+        ).filter(
+            status=status,
+            notified=False,
+            id__gt=after_id
+        )
+        if to_id is not None:
+            subscribers = subscribers.filter(id__lte=to_id)
+        return list(subscribers.order_by('id').values_list('id', flat=True)[:limit])
+
+    def get_types_by_ids(self, ids):
+        """Get Type of Many Subscribers"""
+        return dict(Subscriber.objects.filter(id__in=ids).values_list('id', 'type'))
+
+    def get_id_range(self, status="verified"):
+        """Get Lowest and Highest IDs of Subscribers Having a Status"""
+        result = Subscriber.objects.filter(status=status).aggregate(min_id=Min("id"), max_id=Max("id"))
+        return result["min_id"], result["max_id"]
+
     def get_one_by_id(self, subscriber_id):
         try:
             subscriber = Subscriber.objects.get(id=subscriber_id)
@@ -72,6 +72,15 @@ class TaskEntity():
         tasks = Task.objects.filter(executor=executor).order_by('-id')
         return tasks
 
+    def update_many_results(self, results):
+        """Update Status and Result of Many Tasks By UUID"""
+        tasks = list(Task.objects.filter(uuid__in=results.keys()))
+        for task in tasks:
+            task.status = results[task.uuid]["status"]
+            task.result = results[task.uuid]["result"]
+        Task.objects.bulk_update(tasks, ["status", "result"])
+        return tasks
+
     def update_one_by_id(self, id, new_data):
         """Update Task By ID"""
         task = self.get_one_by_id(id)
@@ -0,0 +1,63 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third Party Library
+from django.db import transaction
+
+# Local Library
+from app.models import UptimeRollup
+
+
+class UptimeRollupEntity():
+
+    def get_many_in_range(self, from_day, to_day):
+        """Get Rollup Rows Between Two Days (Inclusive)"""
+        return UptimeRollup.objects.filter(day__gte=from_day, day__lte=to_day).order_by('day')
+
+    def replace_range(self, from_day, to_day, items):
+        """Replace Rollup Rows Between Two Days (Inclusive), Return Whether Any Row Changed"""
+        rows = [UptimeRollup(
+            component_id=item["component_id"] if "component_id" in item else None,
+            group_id=item["group_id"] if "group_id" in item else None,
+            day=item["day"],
+            major_outage=item["major_outage"],
+            partial_outage=item["partial_outage"],
+            degraded_performance=item["degraded_performance"],
+            maintenance=item["maintenance"]
+        ) for item in items]
+
+        with transaction.atomic():
+            existing = UptimeRollup.objects.filter(day__gte=from_day, day__lte=to_day)
+            if {self.__get_values(row) for row in existing} == {self.__get_values(row) for row in rows} and existing.count() == len(rows):
+                return False
+            existing.delete()
+            UptimeRollup.objects.bulk_create(rows)
+        return True
+
+    def count_all(self):
+        return UptimeRollup.objects.count()
+
+    def truncate(self):
+        return UptimeRollup.objects.all().delete()
+
+    def __get_values(self, row):
+        return (
+            row.component_id,
+            row.group_id,
+            row.day,
+            row.major_outage,
+            row.partial_outage,
+            row.degraded_performance,
+            row.maintenance
+        )
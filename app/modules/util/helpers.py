@@ -20,6 +20,8 @@ import random
 import string
 import uuid
 from pprint import pprint
+from datetime import time
+from datetime import datetime
 from datetime import timedelta
 
 # Third Party Library
@@ -99,3 +101,13 @@ class Helpers():
     def tz_aware_datetime(self, dt_str):
         dt = parse_datetime(dt_str)
         return pytz.timezone(os.getenv("APP_TIMEZONE", "UTC")).localize(dt, is_dst=None)
+
+    def local_date(self, value):
+        if os.getenv("CONVERT_TZ", "False") == "True":
+            return timezone.localtime(value).date()
+        return value.astimezone(timezone.utc).date()
+
+    def day_start(self, date):
+        if os.getenv("CONVERT_TZ", "False") == "True":
+            return timezone.make_aware(datetime.combine(date, time.min))
+        return datetime.combine(date, time.min).replace(tzinfo=timezone.utc)
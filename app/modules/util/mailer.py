@@ -0,0 +1,86 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import smtplib
+
+# Third Party Library
+from django.core.mail import get_connection
+
+# Local Library
+from app.modules.util.helpers import Helpers
+from app.modules.util.rate_limiter import RateLimiter
+
+
+class Mailer():
+    """Send many emails over one connection of the configured email backend"""
+
+    def __init__(self, retries=1):
+        self.__retries = retries
+        self.__connection = None
+        self.__limiter = RateLimiter("email", os.getenv("EMAIL_RATE_LIMIT", 0), os.getenv("EMAIL_RATE_BURST", 0))
+        self.__logger = Helpers().get_logger(__name__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def open(self):
+        if self.__connection is None:
+            connection = get_connection(fail_silently=False)
+            connection.open()
+            self.__connection = connection
+        return self.__connection
+
+    def close(self):
+        if self.__connection is not None:
+            try:
+                self.__connection.close()
+            except Exception:
+                pass
+            self.__connection = None
+
+    def send(self, message):
+        return self.deliver(message) is None
+
+    def deliver(self, message):
+        """Send one message, reconnect once the connection got dropped and get the error if it failed"""
+        self.__limiter.acquire()
+        error = "Email not sent"
+
+        for attempt in range(self.__retries + 1):
+            try:
+                if self.open().send_messages([message]) == 1:
+                    return None
+                return error
+            except smtplib.SMTPServerDisconnected as e:
+                error = "Email connection lost: %s" % str(e)
+                self.__logger.warning("%s, reconnecting" % error)
+                self.close()
+            except smtplib.SMTPException as e:
+                # Rejected by the server, the connection is still usable
+                self.__logger.error("Email to %s rejected: %s" % (", ".join(message.to), str(e)))
+                return "Email rejected: %s" % str(e)
+            except OSError as e:
+                error = "Email connection failed: %s" % str(e)
+                self.__logger.warning("%s, reconnecting" % error)
+                self.close()
+            except Exception as e:
+                self.__logger.error("Error while sending email to %s: %s" % (", ".join(message.to), str(e)))
+                return "Error while sending email: %s" % str(e)
+
+        return error
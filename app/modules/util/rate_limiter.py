@@ -0,0 +1,150 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import time
+import threading
+
+
+class RateLimiter():
+    """Token bucket shared by all workers through Redis, or by the process threads otherwise"""
+
+    PREFIX = "silverback:rate_limit:"
+    REGISTRY = "silverback:rate_limits"
+
+    # Refill the bucket by the time elapsed on the Redis clock then take the tokens if available.
+    # Returns the seconds to wait until enough tokens are available, zero when they were taken.
+    TAKE_SCRIPT = """
+if redis.replicate_commands then redis.replicate_commands() end
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local requested = tonumber(ARGV[3])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(state[1]) or burst
+local updated_at = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated_at) * rate)
+local wait = 0
+if tokens >= requested then
+    tokens = tokens - requested
+else
+    wait = (requested - tokens) / rate
+end
+redis.call('HMSET', KEYS[1], 'tokens', tostring(tokens), 'updated_at', tostring(now), 'rate', tostring(rate), 'burst', tostring(burst))
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 60)
+redis.call('SADD', KEYS[2], ARGV[4])
+return tostring(wait)
+"""
+
+    _buckets = {}
+    _lock = threading.Lock()
+    _script = None
+
+    def __init__(self, name, rate=0, burst=0):
+        self.__name = name
+        self.__rate = float(rate)
+        # Without an explicit burst the bucket holds one second of deliveries
+        self.__burst = float(burst) if float(burst) > 0 else max(self.__rate, 1.0)
+
+    @staticmethod
+    def get_redis():
+        if os.getenv("CACHE_DRIVER", "locmem") != "redis":
+            return None
+        # Third Party Library
+        from django_redis import get_redis_connection
+        return get_redis_connection("default")
+
+    def acquire(self, tokens=1):
+        """Block until the tokens are taken and return the seconds spent waiting"""
+        if self.__rate <= 0:
+            return 0
+
+        tokens = min(float(tokens), self.__burst)
+        waited = 0
+
+        while True:
+            wait = self.__take(tokens)
+            if wait <= 0:
+                return waited
+            time.sleep(wait)
+            waited += wait
+
+    def __take(self, tokens):
+        redis = RateLimiter.get_redis()
+
+        if redis is not None:
+            with RateLimiter._lock:
+                if RateLimiter._script is None:
+                    RateLimiter._script = redis.register_script(RateLimiter.TAKE_SCRIPT)
+            return float(RateLimiter._script(
+                keys=[RateLimiter.PREFIX + self.__name, RateLimiter.REGISTRY],
+                args=[self.__rate, self.__burst, tokens, self.__name],
+                client=redis
+            ))
+
+        with RateLimiter._lock:
+            now = time.monotonic()
+            bucket = RateLimiter._buckets.get(self.__name, {"tokens": self.__burst, "updated_at": now})
+            bucket.update({
+                "tokens": min(self.__burst, bucket["tokens"] + (now - bucket["updated_at"]) * self.__rate),
+                "updated_at": now,
+                "rate": self.__rate,
+                "burst": self.__burst
+            })
+            RateLimiter._buckets[self.__name] = bucket
+
+            if bucket["tokens"] >= tokens:
+                bucket["tokens"] -= tokens
+                return 0
+
+            return (tokens - bucket["tokens"]) / self.__rate
+
+    @staticmethod
+    def get_levels():
+        """Get the current fill level of every known bucket"""
+        levels = {}
+        redis = RateLimiter.get_redis()
+
+        if redis is not None:
+            seconds, microseconds = redis.time()
+            now = seconds + microseconds / 1000000
+            for name in sorted(redis.smembers(RateLimiter.REGISTRY)):
+                name = name.decode("utf-8")
+                state = redis.hgetall(RateLimiter.PREFIX + name)
+                if not state:
+                    # Expired buckets are full again
+                    redis.srem(RateLimiter.REGISTRY, name)
+                    continue
+                state = {key.decode("utf-8"): float(value) for key, value in state.items()}
+                levels[name] = RateLimiter.__level(state, now)
+            return levels
+
+        with RateLimiter._lock:
+            now = time.monotonic()
+            for name, state in sorted(RateLimiter._buckets.items()):
+                levels[name] = RateLimiter.__level(state, now)
+
+        return levels
+
+    @staticmethod
+    def __level(state, now):
+        tokens = min(state["burst"], state["tokens"] + max(0, now - state["updated_at"]) * state["rate"])
+        return {
+            "tokens": round(tokens, 2),
+            "burst": state["burst"],
+            "rate": state["rate"],
+            "fill": round(tokens / state["burst"], 4)
+        }
@@ -0,0 +1,79 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import sys
+from array import array
+
+
+class Series():
+    """Metric series kept as parallel arrays of doubles"""
+
+    TYPECODE = "d"
+
+    def pack(self, values):
+        data = array(Series.TYPECODE, values)
+        if sys.byteorder != "little":
+            data.byteswap()
+        return data.tobytes()
+
+    def unpack(self, blob):
+        data = array(Series.TYPECODE)
+        data.frombytes(bytes(blob))
+        if sys.byteorder != "little":
+            data.byteswap()
+        return data
+
+    def to_points(self, timestamps, values):
+        return [{"timestamp": timestamp, "value": value} for timestamp, value in zip(timestamps, values)]
+
+    def downsample(self, timestamps, values, threshold):
+        """Keep at most threshold points using largest triangle three buckets"""
+        size = len(values)
+
+        if threshold >= size or threshold < 3:
+            return timestamps, values
+
+        sampled_timestamps = array(Series.TYPECODE, [timestamps[0]])
+        sampled_values = array(Series.TYPECODE, [values[0]])
+        every = (size - 2) / (threshold - 2)
+        selected = 0
+
+        for i in range(threshold - 2):
+            # Average point of the next bucket
+            next_start = int((i + 1) * every) + 1
+            next_end = min(int((i + 2) * every) + 1, size)
+            average_timestamp = sum(timestamps[next_start:next_end]) / (next_end - next_start)
+            average_value = sum(values[next_start:next_end]) / (next_end - next_start)
+
+            # Point of the current bucket that forms the largest triangle
+            max_area = -1
+            candidate = int(i * every) + 1
+            for j in range(int(i * every) + 1, next_start):
+                area = abs(
+                    (timestamps[selected] - average_timestamp) * (values[j] - values[selected]) -
+                    (timestamps[selected] - timestamps[j]) * (average_value - values[selected])
+                )
+                if area > max_area:
+                    max_area = area
+                    candidate = j
+
+            sampled_timestamps.append(timestamps[candidate])
+            sampled_values.append(values[candidate])
+            selected = candidate
+
+        sampled_timestamps.append(timestamps[size - 1])
+        sampled_values.append(values[size - 1])
+
+        return sampled_timestamps, sampled_values
@@ -0,0 +1,110 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import zlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Third Party Library
+from twilio.rest import Client
+from requests.adapters import HTTPAdapter
+from twilio.http.http_client import TwilioHttpClient
+
+# Local Library
+from app.modules.util.helpers import Helpers
+from app.modules.util.rate_limiter import RateLimiter
+
+
+class TwilioDriver():
+    """Send text messages with a process wide Twilio client"""
+
+    # Twilio API calls of all drivers reuse the pooled HTTPS connections of this client
+    _client = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.__messaging_service_sid = os.getenv("TWILIO_MESSAGING_SERVICE_SID", "")
+        self.__from_numbers = [number.strip() for number in os.getenv("TWILIO_FROM_NUMBERS", "").split(",") if number.strip()]
+        self.__logger = Helpers().get_logger(__name__)
+
+    def get_client(self):
+        with TwilioDriver._lock:
+            if TwilioDriver._client is None:
+                http_client = TwilioHttpClient(pool_connections=True, timeout=float(os.getenv("TWILIO_TIMEOUT", 10)))
+                http_client.session.mount("https://", HTTPAdapter(pool_maxsize=int(os.getenv("SMS_CONCURRENCY", 10))))
+                TwilioDriver._client = Client(
+                    os.getenv("TWILIO_ACCOUNT_SID"),
+                    os.getenv("TWILIO_AUTH_TOKEN"),
+                    http_client=http_client
+                )
+        return TwilioDriver._client
+
+    def send(self, phone_number, body, sender):
+        sender_kwargs = {"from_": sender}
+
+        if self.__messaging_service_sid:
+            sender_kwargs = {"messaging_service_sid": self.__messaging_service_sid}
+        elif self.__from_numbers:
+            # Keep each recipient on the same number of the pool
+            sender_kwargs = {"from_": self.__from_numbers[zlib.crc32(phone_number.encode("utf-8")) % len(self.__from_numbers)]}
+
+        try:
+            message = self.get_client().messages.create(to=phone_number, body=body, **sender_kwargs)
+            return None if message.sid else "SMS not accepted"
+        except Exception as e:
+            self.__logger.error("Error while sending SMS to %s: %s" % (phone_number, str(e)))
+            return "Error while sending SMS: %s" % str(e)
+
+
+class LocmemDriver():
+    """Keep text messages in SMS.outbox instead of sending them"""
+
+    def send(self, phone_number, body, sender):
+        SMS.outbox.append({"to": phone_number, "body": body, "from": sender})
+        return None
+
+
+class SMS():
+    """Send text messages through the configured TEXT_MESSAGING_DRIVER"""
+
+    DRIVERS = {
+        "twilio": TwilioDriver,
+        "locmem": LocmemDriver
+    }
+
+    outbox = []
+
+    def __init__(self, sender=""):
+        self.__sender = sender
+        self.__concurrency = int(os.getenv("SMS_CONCURRENCY", 10))
+        self.__limiter = RateLimiter("phone", os.getenv("SMS_RATE_LIMIT", 0), os.getenv("SMS_RATE_BURST", 0))
+        driver = os.getenv("TEXT_MESSAGING_DRIVER", "twilio")
+        self.__driver = SMS.DRIVERS[driver]() if driver in SMS.DRIVERS else None
+
+    def deliver(self, phone_number, body):
+        """Send one message and get the error if it failed"""
+        if self.__driver is None:
+            return "No active SMS driver"
+        self.__limiter.acquire()
+        return self.__driver.send(phone_number, body, self.__sender)
+
+    def deliver_many(self, messages):
+        """Send (phone_number, body) messages and get their errors in the same order"""
+        if len(messages) <= 1 or self.__driver is None:
+            return [self.deliver(*message) for message in messages]
+
+        with ThreadPoolExecutor(max_workers=min(self.__concurrency, len(messages))) as executor:
+            return list(executor.map(lambda message: self.deliver(*message), messages))
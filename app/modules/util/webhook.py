@@ -0,0 +1,93 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import threading
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Third Party Library
+import requests
+from requests.adapters import HTTPAdapter
+
+# Local Library
+from app.modules.util.helpers import Helpers
+from app.modules.util.rate_limiter import RateLimiter
+
+
+class Webhook():
+    """Deliver webhooks concurrently over pooled keep-alive connections"""
+
+    # One session per process, created lazily so forked workers never share sockets
+    _session = None
+    _lock = threading.Lock()
+
+    def __init__(self):
+        self.__connect_timeout = float(os.getenv("WEBHOOK_CONNECT_TIMEOUT", 3))
+        self.__read_timeout = float(os.getenv("WEBHOOK_READ_TIMEOUT", 10))
+        self.__concurrency = int(os.getenv("WEBHOOK_CONCURRENCY", 50))
+        self.__connections_per_host = int(os.getenv("WEBHOOK_CONNECTIONS_PER_HOST", 4))
+        self.__limiter = RateLimiter("endpoint", os.getenv("WEBHOOK_RATE_LIMIT", 0), os.getenv("WEBHOOK_RATE_BURST", 0))
+        self.__host_rate = os.getenv("WEBHOOK_HOST_RATE_LIMIT", 0)
+        self.__host_burst = os.getenv("WEBHOOK_HOST_RATE_BURST", 0)
+        self.__logger = Helpers().get_logger(__name__)
+
+    def get_session(self):
+        with Webhook._lock:
+            if Webhook._session is None:
+                # Blocking pools cap the open connections per host, extra deliveries wait for a free one
+                adapter = HTTPAdapter(
+                    pool_connections=100,
+                    pool_maxsize=self.__connections_per_host,
+                    pool_block=True,
+                    max_retries=0
+                )
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                Webhook._session = session
+        return Webhook._session
+
+    def deliver(self, endpoint, auth_token, payload):
+        """Post one delivery and get the error if it failed"""
+        self.__limiter.acquire()
+        RateLimiter("endpoint:%s" % (urlparse(endpoint).hostname or ""), self.__host_rate, self.__host_burst).acquire()
+
+        try:
+            response = self.get_session().post(
+                endpoint,
+                headers={
+                    "X-AUTH-TOKEN": auth_token,
+                    "Content-Type": "application/json"
+                },
+                data=payload,
+                timeout=(self.__connect_timeout, self.__read_timeout)
+            )
+            if 200 <= response.status_code < 300:
+                return None
+            error = "Webhook responded with status %d" % response.status_code
+        except requests.RequestException as e:
+            error = "Webhook failed: %s" % str(e)
+
+        self.__logger.error("Webhook %s: %s" % (endpoint, error))
+        return error
+
+    def deliver_many(self, deliveries):
+        """Post (endpoint, auth_token, payload) deliveries and get their errors in the same order"""
+        if len(deliveries) <= 1:
+            return [self.deliver(*delivery) for delivery in deliveries]
+
+        with ThreadPoolExecutor(max_workers=min(self.__concurrency, len(deliveries))) as executor:
+            return list(executor.map(lambda delivery: self.deliver(*delivery), deliveries))
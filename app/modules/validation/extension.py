@@ -18,7 +18,6 @@ import os
 import datetime
 
 # Third Party Library
-from twilio.rest import Client
 from pyvalitron.validator import Validator
 from twilio.base.exceptions import TwilioRestException
 from django.core.signing import Signer
@@ -29,6 +28,9 @@ from django.core.validators import validate_ipv4_address
 from django.core.validators import validate_ipv6_address
 from django.core.validators import validate_ipv46_address
 
+# Local Library
+from app.modules.util.sms import TwilioDriver
+
 
 class ExtraRules(Validator):
 
@@ -124,7 +126,7 @@ class ExtraRules(Validator):
 
     def sv_phone(self):
         if os.getenv("TEXT_MESSAGING_DRIVER", "twilio") == "twilio" and os.getenv("TWILIO_ACCOUNT_SID") and os.getenv("TWILIO_AUTH_TOKEN"):
-            client = Client(os.getenv("TWILIO_ACCOUNT_SID"), os.getenv("TWILIO_AUTH_TOKEN"))
+            client = TwilioDriver().get_client()
             try:
                 client.lookups.phone_numbers(self._input).fetch(type="carrier")
                 return True
@@ -16,6 +16,7 @@ import os.path
 from urllib.parse import urlparse
 
 # Third Party Library
+from kombu import Queue
 from dotenv import load_dotenv
 from django.utils.translation import ugettext_lazy as _
 
@@ -299,6 +300,81 @@ LOCALE_PATHS = [
 CELERY_BROKER_URL = os.getenv("CELERY_BROKER_URL")
 CELERY_RESULT_BACKEND = os.getenv("CELERY_RESULT_BACKEND")
 
+# Higher runs first within a queue (RabbitMQ priorities)
+TASK_QUEUE_PRIORITIES = {
+    "system": int(os.getenv("TASK_PRIORITY_SYSTEM", 9)),
+    "fanout": int(os.getenv("TASK_PRIORITY_FANOUT", 5)),
+    "email": int(os.getenv("TASK_PRIORITY_EMAIL", 5)),
+    "sms": int(os.getenv("TASK_PRIORITY_SMS", 5)),
+    "webhook": int(os.getenv("TASK_PRIORITY_WEBHOOK", 5)),
+}
+
+CELERY_TASK_DEFAULT_QUEUE = "celery"
+
+CELERY_TASK_QUEUES = [Queue("celery")] + [
+    Queue(name, routing_key=name, queue_arguments={"x-max-priority": 10}) for name in TASK_QUEUE_PRIORITIES.keys()
+]
+
+CELERY_TASK_ROUTES = {
+    'app.tasks.ping.ping': "system",
+    'app.tasks.forgot_password.forgot_password_email': "system",
+    'app.tasks.register_request.register_request_email': "system",
+    'app.tasks.verify_subscription.*': "system",
+    'app.tasks.uptime.uptime_rollup': "system",
+    'app.tasks.metric.collect_metrics': "system",
+    'app.tasks.outbox.relay_outbox': "system",
+    'app.tasks.retry_notifications.retry_notifications': "system",
+    'app.tasks.incident_update.*': "fanout",
+    'app.tasks.retry_notifications.redrive_notifications': "fanout",
+    # Deliveries are sent to the queue of their channel, see app.tasks.notify_subscriber.queue_notifications
+    'app.tasks.notify_subscriber.*': "email",
+}
+
+CELERY_TASK_ROUTES = {
+    task: {"queue": queue, "priority": TASK_QUEUE_PRIORITIES[queue]} for task, queue in CELERY_TASK_ROUTES.items()
+}
+
+CELERY_BEAT_SCHEDULE = {
+    'uptime_rollup': {
+        'task': 'app.tasks.uptime.uptime_rollup',
+        'schedule': float(os.getenv("UPTIME_ROLLUP_INTERVAL", 300)),
+    },
+    'collect_metrics': {
+        'task': 'app.tasks.metric.collect_metrics',
+        'schedule': float(os.getenv("METRICS_COLLECT_INTERVAL", 300)),
+    },
+    'retry_notifications': {
+        'task': 'app.tasks.retry_notifications.retry_notifications',
+        'schedule': float(os.getenv("NOTIFICATION_RETRY_INTERVAL", 30)),
+    },
+    'relay_outbox': {
+        'task': 'app.tasks.outbox.relay_outbox',
+        'schedule': float(os.getenv("OUTBOX_RELAY_INTERVAL", 1)),
+    },
+}
+
+if os.getenv("CACHE_DRIVER", "locmem") == "redis":
+    CACHES = {
+        'default': {
+            'BACKEND': 'django_redis.cache.RedisCache',
+            'LOCATION': os.getenv("CACHE_REDIS_URL", "redis://127.0.0.1:6379/1"),
+            'KEY_PREFIX': 'silverback',
+            'OPTIONS': {
+                'CLIENT_CLASS': 'django_redis.client.DefaultClient',
+            }
+        }
+    }
+    CACHE_SHARED = True
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'silverback',
+        }
+    }
+    # Each process has its own cache, versions bumped by one process never reach the others
+    CACHE_SHARED = False
+
 # Security Configs
 SECURE_CONTENT_TYPE_NOSNIFF = True
 SECURE_BROWSER_XSS_FILTER = True
@@ -0,0 +1,134 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third Party Library
+from django.db import transaction
+from django.dispatch import receiver
+from django.db.models.signals import pre_save
+from django.db.models.signals import post_save
+from django.db.models.signals import post_delete
+
+# Local Library
+from app.models import Metric
+from app.models import Option
+from app.models import Incident
+from app.models import Component
+from app.models import ComponentGroup
+from app.models import IncidentUpdate
+from app.models import IncidentUpdateComponent
+from app.modules.core.uptime import Uptime
+from app.modules.core.page_cache import PageCache
+from app.modules.core.system_status import SystemStatus
+from app.modules.entity.metric_series_entity import MetricSeriesEntity
+
+
+def on_commit_once(name, func, *values):
+    """Run func once after the current transaction commits with the values of all the rows it wrote"""
+    connection = transaction.get_connection()
+    pending = connection.__dict__.setdefault("pending_refreshes", {})
+    item = pending.get(name)
+
+    # A rolled back transaction drops its callbacks, queue a new one then
+    if item is not None and item["callback"] in [callback[1] for callback in connection.run_on_commit]:
+        item["values"].extend(values)
+        return
+
+    item = {"values": list(values)}
+
+    def callback():
+        if pending.get(name) is item:
+            del pending[name]
+        func(item["values"])
+
+    item["callback"] = callback
+    pending[name] = item
+    transaction.on_commit(callback)
+
+
+def mark_uptime_dirty_from(datetimes):
+    Uptime().mark_dirty(min(datetimes))
+
+
+def mark_updates_uptime_dirty(update_ids):
+    datetimes = list(IncidentUpdate.objects.filter(pk__in=update_ids).values_list("datetime", flat=True))
+    if len(datetimes) > 0:
+        Uptime().mark_dirty(min(datetimes))
+
+
+@receiver(post_save, sender=Incident)
+@receiver(post_delete, sender=Incident)
+@receiver(post_save, sender=IncidentUpdate)
+@receiver(post_delete, sender=IncidentUpdate)
+@receiver(post_save, sender=IncidentUpdateComponent)
+@receiver(post_delete, sender=IncidentUpdateComponent)
+@receiver(post_save, sender=Component)
+@receiver(post_delete, sender=Component)
+@receiver(post_save, sender=ComponentGroup)
+@receiver(post_delete, sender=ComponentGroup)
+def refresh_system_status(sender, **kwargs):
+    if kwargs.get("raw", False):
+        return
+    on_commit_once("system_status", lambda values: SystemStatus().refresh())
+
+
+@receiver(post_save, sender=Incident)
+@receiver(post_delete, sender=Incident)
+@receiver(post_save, sender=IncidentUpdate)
+@receiver(post_delete, sender=IncidentUpdate)
+@receiver(post_save, sender=IncidentUpdateComponent)
+@receiver(post_delete, sender=IncidentUpdateComponent)
+@receiver(post_save, sender=Component)
+@receiver(post_delete, sender=Component)
+@receiver(post_save, sender=ComponentGroup)
+@receiver(post_delete, sender=ComponentGroup)
+@receiver(post_save, sender=Metric)
+@receiver(post_delete, sender=Metric)
+@receiver(post_save, sender=Option)
+@receiver(post_delete, sender=Option)
+def invalidate_page_cache(sender, **kwargs):
+    on_commit_once("page_cache", lambda values: PageCache().invalidate())
+
+
+@receiver(pre_save, sender=Incident)
+@receiver(pre_save, sender=IncidentUpdate)
+def mark_previous_uptime_dirty(sender, instance, **kwargs):
+    if kwargs.get("raw", False) or instance.pk is None:
+        return
+    previous = sender.objects.filter(pk=instance.pk).values_list("datetime", flat=True).first()
+    if previous is not None:
+        on_commit_once("uptime", mark_uptime_dirty_from, previous)
+
+
+@receiver(post_save, sender=Incident)
+@receiver(post_delete, sender=Incident)
+@receiver(post_save, sender=IncidentUpdate)
+@receiver(post_delete, sender=IncidentUpdate)
+@receiver(post_save, sender=IncidentUpdateComponent)
+@receiver(post_delete, sender=IncidentUpdateComponent)
+def mark_uptime_dirty(sender, instance, **kwargs):
+    if kwargs.get("raw", False):
+        return
+    # Components are resolved to their update datetime once the transaction commits
+    if sender == IncidentUpdateComponent:
+        on_commit_once("uptime_updates", mark_updates_uptime_dirty, instance.incident_update_id)
+    else:
+        on_commit_once("uptime", mark_uptime_dirty_from, instance.datetime)
+
+
+@receiver(post_save, sender=Metric)
+def drop_metric_series(sender, instance, created, **kwargs):
+    if kwargs.get("raw", False) or created:
+        return
+    # Series of the old source settings stay out until the next collect
+    MetricSeriesEntity().delete_many_by_metric(instance.id)
@@ -16,5 +16,9 @@ from .forgot_password import *         # noqa: F401 F403
 from .register_request import *        # noqa: F401 F403
 from .incident_update import *         # noqa: F401 F403
 from .notify_subscriber import *       # noqa: F401 F403
+from .retry_notifications import *     # noqa: F401 F403
 from .verify_subscription import *     # noqa: F401 F403
 from .ping import *                    # noqa: F401 F403
+from .uptime import *                  # noqa: F401 F403
+from .metric import *                  # noqa: F401 F403
+from .outbox import *                  # noqa: F401 F403
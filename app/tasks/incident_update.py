@@ -12,48 +12,126 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+# Standard Library
+import os
+import json
+
 # Third Party Library
+from celery import chord
 from celery import shared_task
 
 # Local Library
+from app.tasks.notify_subscriber import queue_notifications
 from app.modules.core.task import Task as TaskModule
 from app.modules.core.subscriber import Subscriber as SubscriberModule
+from app.modules.core.incident_update import IncidentUpdate as IncidentUpdateModule
 from app.modules.core.incident_update_notification import IncidentUpdateNotification as IncidentUpdateNotificationModule
 
 
-@shared_task
-def incident_update(incident_update_id, user_id):
+@shared_task(bind=True)
+def incident_update(self, incident_update_id, user_id):
+
+    incident_update_module = IncidentUpdateModule()
+    ranges = SubscriberModule().get_id_ranges(int(os.getenv("NOTIFICATION_FANOUT_PARTITIONS", 4)))
+
+    incident_update_module.start_fanout(incident_update_id, len(ranges))
+
+    if len(ranges) == 0:
+        incident_update_module.finish_fanout(incident_update_id)
+        return {
+            "status": "passed",
+            "result": json.dumps({"created": 0, "queued": 0}),
+            "notify_type": "passed"
+        }
+
+    # Subscriber ID ranges fan out in parallel, the callback completes this task once all of them finished
+    callback = finish_fan_out.s(incident_update_id, self.request.id)
+    callback.link_error(fail_fan_out.si(incident_update_id=incident_update_id, task_uuid=self.request.id))
+    chord(
+        fan_out_range.s(incident_update_id, from_id, to_id) for from_id, to_id in ranges
+    )(callback)
+
+    # Without a status the task row is left pending for the callback to complete
+    return {
+        "result": json.dumps({"partitions": len(ranges)})
+    }
+
+
+@shared_task(tracked=False)
+def fan_out_range(incident_update_id, from_id, to_id):
 
     incident_update_notification_module = IncidentUpdateNotificationModule()
     subscriber_module = SubscriberModule()
-    task_module = TaskModule()
 
-    for subscriber in subscriber_module.get_iterator():
-        notification = incident_update_notification_module.is_subscriber_notified(
+    chunk_size = int(os.getenv("NOTIFICATION_CHUNK_SIZE", 500))
+    progress = {"created": 0, "queued": 0}
+
+    # Create missing notifications with one anti-join and one bulk insert per chunk
+    after_id = from_id - 1
+    while True:
+        subscriber_ids = subscriber_module.get_ids_without_notification(incident_update_id, after_id, chunk_size, to_id=to_id)
+        if len(subscriber_ids) == 0:
+            break
+
+        progress["created"] += incident_update_notification_module.insert_many(incident_update_id, subscriber_ids)
+        after_id = subscriber_ids[-1]
+
+    # Delivery workers claim the pending notifications straight from the database
+    after_id = 0
+    while not incident_update_notification_module.is_database_queue():
+        # Send pending and failed notifications of the range to their channel queues
+        notification_ids = incident_update_notification_module.get_ids_by_update_status(
             incident_update_id,
-            subscriber.id
+            [IncidentUpdateNotificationModule.PENDING, IncidentUpdateNotificationModule.FAILED],
+            after_id,
+            chunk_size,
+            (from_id, to_id)
         )
-        if notification:
-            # Send notification.id to the queue again
-            task_module.delay("notify_subscriber", {
-                "notification_id": notification.id
-            }, user_id)
-
-        else:
-            # Create new notification and send to queue
-            new_notification = incident_update_notification_module.insert_one({
-                "status": "pending",
-                "incident_update_id": incident_update_id,
-                "subscriber_id": subscriber.id
-            })
-            if new_notification:
-                # Send new_notification.id to the Queue
-                task_module.delay("notify_subscriber", {
-                    "notification_id": new_notification.id
-                }, user_id)
+        if len(notification_ids) == 0:
+            break
 
-    return {
+        progress["queued"] += queue_notifications(notification_ids, hold=True)
+        after_id = notification_ids[-1]
+
+    IncidentUpdateModule().complete_fanout_partition(incident_update_id)
+
+    return progress
+
+
+@shared_task(tracked=False)
+def finish_fan_out(results, incident_update_id, task_uuid):
+
+    IncidentUpdateModule().finish_fanout(incident_update_id)
+
+    progress = {
+        "created": sum(result["created"] for result in results),
+        "queued": sum(result["queued"] for result in results)
+    }
+
+    # Complete the incident_update task row and its notification
+    task_module = TaskModule()
+    task_module.buffer_result(task_uuid, {
         "status": "passed",
-        "result": "{}",
+        "result": json.dumps(progress),
         "notify_type": "passed"
-    }
+    })
+    task_module.flush_results()
+
+    return progress
+
+
+@shared_task(tracked=False)
+def fail_fan_out(*args, incident_update_id, task_uuid):
+    """Complete the fan-out when a partition failed, errback arguments differ between Celery versions and are ignored"""
+    IncidentUpdateModule().finish_fanout(incident_update_id)
+
+    # Notifications are unique per subscriber, delivering the update again completes the missing partitions
+    task_module = TaskModule()
+    task_module.buffer_result(task_uuid, {
+        "status": "failed",
+        "result": json.dumps({"error": "A fan-out partition failed"}),
+        "notify_type": "failed"
+    })
+    task_module.flush_results()
+
+    return False
@@ -14,25 +14,68 @@
 
 # Standard Library
 import os
+import json
+import hashlib
 
 # Third Party Library
-import requests
 import markdown2
-from twilio.rest import Client
 from celery import shared_task
 from django.urls import reverse
-from django.core.mail import send_mail
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.html import strip_tags
+from django.core.mail import EmailMultiAlternatives
+from django.utils.translation import get_language
 from django.utils.translation import gettext as _
 from django.template.loader import render_to_string
 
 # Local Library
+from app.modules.util.sms import SMS
+from app.modules.util.mailer import Mailer
+from app.modules.util.webhook import Webhook
 from app.modules.entity.option_entity import OptionEntity
 from app.modules.core.subscriber import Subscriber as SubscriberModule
 from app.modules.core.incident_update_notification import IncidentUpdateNotification as IncidentUpdateNotificationModule
 
 
-@shared_task
+CHANNEL_QUEUES = {
+    SubscriberModule.EMAIL: "email",
+    SubscriberModule.PHONE: "sms",
+    SubscriberModule.ENDPOINT: "webhook"
+}
+
+
+def queue_notifications(notification_ids, hold=False):
+    """Send notifications to the queue of their channel, one message per batch, held for the channel coalescing window"""
+    incident_update_notification_module = IncidentUpdateNotificationModule()
+    batch_size = int(os.getenv("NOTIFICATION_BATCH_SIZE", 50))
+    types = incident_update_notification_module.get_subscriber_types_by_ids(notification_ids)
+    channels = {}
+
+    for notification_id in notification_ids:
+        channels.setdefault(types.get(notification_id, ""), []).append(notification_id)
+
+    for subscriber_type, ids in channels.items():
+        queue = CHANNEL_QUEUES.get(subscriber_type, "email")
+        countdown = incident_update_notification_module.get_coalesce_window(subscriber_type) if hold and subscriber_type else 0
+        for i in range(0, len(ids), batch_size):
+            notify_subscribers.apply_async(
+                args=[ids[i:i + batch_size]],
+                queue=queue,
+                priority=settings.TASK_QUEUE_PRIORITIES[queue],
+                countdown=countdown
+            )
+
+    return len(notification_ids)
+
+
+@shared_task(tracked=False)
 def notify_subscriber(notification_id):
+    return notify_subscribers([notification_id])
+
+
+@shared_task(tracked=False)
+def notify_subscribers(notification_ids):
 
     option_entity = OptionEntity()
     incident_update_notification_module = IncidentUpdateNotificationModule()
@@ -41,143 +84,152 @@ def notify_subscriber(notification_id):
     app_email = option_entity.get_value_by_key("app_email")
     app_url = option_entity.get_value_by_key("app_url")
 
-    notification = incident_update_notification_module.get_one_by_id(notification_id)
-    incident_update = notification["incident_update"]
-    incident = notification["incident_update"].incident
-    subscriber = notification["subscriber"]
-
-    data = {}
-    data["incident_uri"] = incident.uri
-    data["incident_update_time"] = incident_update.datetime.strftime("%b %d %Y %H:%M:%S")
-    data["incident_type"] = incident_update.status.title()
-    data["incident_update"] = markdown2.markdown(incident_update.message)
-
-    if notification["status"] == "pending":
-        # send the notification for the first time
-        if subscriber.type == SubscriberModule.EMAIL:
-            status = __deliver_email(
-                app_name,
-                app_email,
-                app_url,
-                [subscriber.email],
-                _("%(app_name)s Incident Update: %(incident_name)s") % {"app_name": app_name, "incident_name": incident.name},
-                "mails/incident_update.html",
-                data,
-                False
-            )
-        elif subscriber.type == SubscriberModule.PHONE:
-            status = __deliver_sms(
-                app_name,
-                subscriber.phone,
-                "%s%s" % (app_url.strip("/"), reverse("app.web.incidents", kwargs={'uri': incident.uri}))
-            )
-        elif subscriber.type == SubscriberModule.ENDPOINT:
-            status = __deliver_webhook(
-                subscriber.endpoint,
-                subscriber.auth_token,
-                '{}' % ()
-            )
-
-        if status:
-            # message sent
-            incident_update_notification_module.update_one_by_id(notification["id"], {
-                "status": "success"
-            })
-
-        else:
-            # message failed
-            incident_update_notification_module.update_one_by_id(notification["id"], {
-                "status": "failed"
-            })
-
-    elif notification["status"] == "failed":
-        # Retry to send the notification
-        if subscriber.type == SubscriberModule.EMAIL:
-            status = __deliver_email(
-                app_name,
-                app_email,
-                app_url,
-                [subscriber.email],
-                _("%(app_name)s Incident Update: %(incident_name)s") % {"app_name": app_name, "incident_name": incident.name},
-                "mails/incident_update.html",
-                data,
-                False
-            )
-        elif subscriber.type == SubscriberModule.PHONE:
-            status = __deliver_sms(
-                app_name,
-                subscriber.phone,
-                "%s%s" % (app_url.strip("/"), reverse("app.web.incidents", kwargs={'uri': incident.uri}))
-            )
-        elif subscriber.type == SubscriberModule.ENDPOINT:
-            status = __deliver_webhook(
-                subscriber.endpoint,
-                subscriber.auth_token,
-                '{}' % ()
-            )
-        if status:
-            # message sent again
-            incident_update_notification_module.update_one_by_id(notification["id"], {
-                "status": "success"
-            })
-    else:
-        print("skip subscriber#%s!" % subscriber.id)
+    messages = {}
+    attempts = []
+    webhooks = []
+    texts = []
+
+    # Skip notifications that were already delivered, dead-lettered or coalesced
+    notifications = [notification for notification in incident_update_notification_module.get_many_by_ids(notification_ids) if notification.status in [
+        IncidentUpdateNotificationModule.PENDING,
+        IncidentUpdateNotificationModule.FAILED
+    ]]
+
+    # Messages are published at least once, only the batch claiming the notifications delivers them
+    notifications = incident_update_notification_module.claim_many(notifications)
+
+    # Subscribers of coalescing channels only get the latest update of an incident with a log of the ones they missed
+    superseded, changes = incident_update_notification_module.get_changes(notifications)
+    coalesced = incident_update_notification_module.coalesce_many(superseded)
+
+    # Emails of the whole batch share one backend connection
+    with Mailer() as mailer:
+        for notification in notifications:
+            if notification in coalesced:
+                continue
+
+            # Messages are rendered once per incident update and change log and shared by their subscribers
+            notification_changes = changes.get(notification.id, [])
+            message_key = (notification.incident_update_id, tuple(change["id"] for change in notification_changes))
+            if message_key not in messages:
+                messages[message_key] = __get_message(app_name, app_url, notification.incident_update, notification_changes)
+
+            message = messages[message_key]
+            subscriber = notification.subscriber
+
+            # Text messages and webhooks of the batch are sent concurrently below
+            if subscriber.type == SubscriberModule.EMAIL:
+                attempts.append((notification, __deliver_email(mailer, app_email, [subscriber.email], message)))
+            elif subscriber.type == SubscriberModule.PHONE:
+                texts.append((notification, (subscriber.phone, message["sms"])))
+            elif subscriber.type == SubscriberModule.ENDPOINT:
+                webhooks.append((notification, (subscriber.endpoint, subscriber.auth_token, message["webhook"])))
+            else:
+                attempts.append((notification, "Unknown subscriber type %s" % subscriber.type))
+
+    attempts.extend(zip(
+        [notification for notification, delivery in texts],
+        SMS(app_name).deliver_many([delivery for notification, delivery in texts])
+    ))
+    attempts.extend(zip(
+        [notification for notification, delivery in webhooks],
+        Webhook().deliver_many([delivery for notification, delivery in webhooks])
+    ))
+
+    # Failures are scheduled for a retry with backoff until they run out of attempts
+    notifications = incident_update_notification_module.record_attempts(attempts)
+
+    result = {"success": 0, "failed": 0, "dead": 0, "coalesced": 0}
+    for notification in notifications + coalesced:
+        result[notification.status] += 1
 
     return {
         "status": "passed",
-        "result": "{}",
+        "result": json.dumps(result),
         "notify_type": "passed"
     }
 
 
-def __deliver_email(app_name, app_email, app_url, recipients, subject, template, data={}, fail_silently=False):
-    try:
-        send_mail(
-            subject,
-            "",
-            app_email,
-            recipients,
-            fail_silently=fail_silently,
-            html_message=render_to_string(template, {
-                "app_url": app_url,
-                "app_name": app_name,
-                "subject": subject,
-                "incident_type": data["incident_type"],
-                "incident_update": data["incident_update"],
-                "incident_update_time": data["incident_update_time"],
-                "incident_uri": data["incident_uri"]
-            })
-        )
-        return True
-    except Exception:
-        return False
-
-
-def __deliver_sms(app_name, phone_number, body):
-    if os.getenv("TEXT_MESSAGING_DRIVER", "twilio") == "twilio":
-        try:
-            client = Client(
-                os.getenv("TWILIO_ACCOUNT_SID"),
-                os.getenv("TWILIO_AUTH_TOKEN")
-            )
-            message = client.messages.create(
-                to=phone_number,
-                from_=app_name,
-                body=body
-            )
-            return True if message.sid else False
-        except Exception:
-            return False
-    # No Active SMS Driver
-    return False
-
-
-def __deliver_webhook(endpoint, auth_token, payload):
-    try:
-        headers = {
-            "X-AUTH-TOKEN": auth_token
-        }
-        requests.post(endpoint, headers=headers, data=payload)
-        return True
-    except Exception:
-        return False
+def __get_message(app_name, app_url, incident_update, changes):
+    key = "incident_update_message:%(id)d:%(changes)s:%(updated_at)s:%(incident_updated_at)s:%(language)s:%(app)s" % {
+        "id": incident_update.id,
+        "changes": "-".join(str(change["id"]) for change in changes),
+        "updated_at": incident_update.updated_at.timestamp(),
+        "incident_updated_at": incident_update.incident.updated_at.timestamp(),
+        "language": get_language(),
+        "app": hashlib.md5(("%s:%s" % (app_name, app_url)).encode("utf-8")).hexdigest()
+    }
+
+    message = cache.get(key)
+
+    if message is None:
+        message = __render_message(app_name, app_url, incident_update, changes)
+        cache.set(key, message, int(os.getenv("NOTIFICATION_MESSAGE_CACHE_TIMEOUT", 86400)))
+
+    return message
+
+
+def __render_message(app_name, app_url, incident_update, changes):
+    incident = incident_update.incident
+    subject = _("%(app_name)s Incident Update: %(incident_name)s") % {"app_name": app_name, "incident_name": incident.name}
+    url = "%s%s" % (app_url.strip("/"), reverse("app.web.status_page_single", kwargs={'uri': incident.uri}))
+    incident_update_time = incident_update.datetime.strftime("%b %d %Y %H:%M:%S")
+    incident_update_html = markdown2.markdown(incident_update.message)
+    incident_changes = [{
+        "id": change["id"],
+        "status": change["status"],
+        "type": change["status"].title(),
+        "time": change["datetime"].strftime("%b %d %Y %H:%M:%S"),
+        "datetime": change["datetime"].isoformat()
+    } for change in changes]
+
+    return {
+        "subject": subject,
+        "html": render_to_string("mails/incident_update.html", {
+            "app_url": app_url,
+            "app_name": app_name,
+            "subject": subject,
+            "incident_type": incident_update.status.title(),
+            "incident_update": incident_update_html,
+            "incident_update_time": incident_update_time,
+            "incident_changes": incident_changes,
+            "incident_uri": incident.uri
+        }),
+        "text": "%(type)s - %(time)s\n\n%(update)s\n\n%(changes)s%(url)s" % {
+            "type": incident_update.status.title(),
+            "time": incident_update_time,
+            "update": strip_tags(incident_update_html).strip(),
+            "changes": "%s\n%s\n\n" % (_("Earlier updates:"), "\n".join(
+                "- %(type)s - %(time)s" % change for change in incident_changes
+            )) if len(incident_changes) > 0 else "",
+            "url": url
+        },
+        "sms": url,
+        "webhook": json.dumps({
+            "type": "incident_update",
+            "incident": {
+                "id": incident.id,
+                "name": incident.name,
+                "uri": incident.uri,
+                "status": incident.status,
+                "url": url
+            },
+            "update": {
+                "id": incident_update.id,
+                "status": incident_update.status,
+                "message": incident_update.message,
+                "datetime": incident_update.datetime.isoformat()
+            },
+            "changes": [{
+                "id": change["id"],
+                "status": change["status"],
+                "datetime": change["datetime"]
+            } for change in incident_changes]
+        })
+    }
+
+
+def __deliver_email(mailer, app_email, recipients, message):
+    email = EmailMultiAlternatives(message["subject"], message["text"], app_email, recipients)
+    email.attach_alternative(message["html"], "text/html")
+    return mailer.deliver(email)
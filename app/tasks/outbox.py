@@ -0,0 +1,41 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import json
+
+# Third Party Library
+from celery import shared_task
+
+# Local Library
+from app.modules.core.outbox import Outbox
+
+
+@shared_task(tracked=False)
+def relay_outbox():
+
+    outbox = Outbox()
+    published = 0
+
+    while True:
+        count = outbox.relay()
+        if count == 0:
+            break
+        published += count
+
+    return {
+        "status": "passed",
+        "result": json.dumps({"published": published, "deleted": outbox.delete_published()}),
+        "notify_type": "passed"
+    }
@@ -0,0 +1,80 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import json
+
+# Third Party Library
+from celery import shared_task
+
+# Local Library
+from app.tasks.notify_subscriber import queue_notifications
+from app.modules.core.incident_update_notification import IncidentUpdateNotification as IncidentUpdateNotificationModule
+
+
+@shared_task(tracked=False)
+def retry_notifications():
+
+    incident_update_notification_module = IncidentUpdateNotificationModule()
+
+    chunk_size = int(os.getenv("NOTIFICATION_CHUNK_SIZE", 500))
+    queued = 0
+
+    # Claimed notifications leave the due set, so this stops once every due retry is queued.
+    # Delivery workers pick due retries themselves when they claim from the database.
+    while not incident_update_notification_module.is_database_queue():
+        notification_ids = incident_update_notification_module.claim_due_ids(chunk_size)
+        if len(notification_ids) == 0:
+            break
+
+        queued += queue_notifications(notification_ids)
+
+    return {
+        "status": "passed",
+        "result": json.dumps({"queued": queued}),
+        "notify_type": "passed"
+    }
+
+
+@shared_task
+def redrive_notifications(incident_update_id, user_id=None):
+
+    incident_update_notification_module = IncidentUpdateNotificationModule()
+
+    chunk_size = int(os.getenv("NOTIFICATION_CHUNK_SIZE", 500))
+    queued = 0
+
+    after_id = 0
+    while True:
+        notification_ids = incident_update_notification_module.get_ids_by_update_status(
+            incident_update_id,
+            [IncidentUpdateNotificationModule.DEAD],
+            after_id,
+            chunk_size
+        )
+        if len(notification_ids) == 0:
+            break
+
+        incident_update_notification_module.redrive_many_by_ids(incident_update_id, notification_ids)
+        if not incident_update_notification_module.is_database_queue():
+            queue_notifications(notification_ids)
+        queued += len(notification_ids)
+        after_id = notification_ids[-1]
+
+    return {
+        "status": "passed",
+        "result": json.dumps({"queued": queued}),
+        "notify_type": "passed"
+    }
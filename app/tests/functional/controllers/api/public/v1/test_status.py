@@ -0,0 +1,107 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import json
+
+# Third Party Library
+from django.test import TransactionTestCase
+from django.utils import timezone
+from django.shortcuts import reverse
+
+# Local Library
+from app.tests.testing_base import TestingBase
+from app.modules.entity.option_entity import OptionEntity
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.component_entity import ComponentEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
+from app.modules.entity.incident_update_component_entity import IncidentUpdateComponentEntity
+
+
+class TestStatus(TransactionTestCase):
+
+    def setUp(self):
+        tb = TestingBase()
+        tb.uninstall()
+        tb.install({
+            "app_name": "Silverback",
+            "app_email": "hello@silverback.com",
+            "app_url": "http://silverback.com",
+            "admin_username": "admin",
+            "admin_email": "admin@silverback.com",
+            "admin_password": "$h12345678H$"
+        })
+        self.component = ComponentEntity().insert_one({"name": "Website", "description": "Website"})
+        OptionEntity().insert_one({"key": "builder_components", "value": json.dumps(["c-%d" % self.component.id])})
+
+    def tearDown(self):
+        tb = TestingBase()
+        tb.uninstall()
+
+    def test_summary(self):
+        response = self.client.get(reverse("app.api.public.v1.summary.endpoint"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        response_body = json.loads(response.content)
+        self.assertEqual(response_body["page"]["name"], "Silverback")
+        self.assertEqual(response_body["status"]["indicator"], "normal")
+        self.assertEqual(response_body["components"][0]["status"], "operational")
+        self.assertEqual(response_body["incidents"], [])
+
+        incident = IncidentEntity().insert_one({
+            "name": "Website Down",
+            "uri": "website-down",
+            "status": "open",
+            "datetime": timezone.now()
+        })
+        update = IncidentUpdateEntity().insert_one({
+            "status": "investigating",
+            "datetime": timezone.now(),
+            "message": "Investigating",
+            "incident_id": incident.id
+        })
+        IncidentUpdateComponentEntity().insert_one({
+            "type": "major_outage",
+            "incident_update_id": update.id,
+            "component_id": self.component.id
+        })
+
+        response_body = json.loads(self.client.get(reverse("app.api.public.v1.summary.endpoint")).content)
+        self.assertEqual(response_body["status"]["indicator"], "high")
+        self.assertEqual(response_body["components"][0]["status"], "major_outage")
+        self.assertEqual([item["uri"] for item in response_body["incidents"]], ["website-down"])
+
+        response_body = json.loads(self.client.get(reverse("app.api.public.v1.incidents.endpoint")).content)
+        self.assertEqual(response_body["incidents"][0]["updates"][0]["message"], "Investigating")
+
+    def test_etag(self):
+        response = self.client.get(reverse("app.api.public.v1.components.endpoint"))
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        response = self.client.get(reverse("app.api.public.v1.components.endpoint"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+
+        ComponentEntity().update_one_by_id(self.component.id, {"description": "Public Website"})
+
+        response = self.client.get(reverse("app.api.public.v1.components.endpoint"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+        self.assertEqual(json.loads(response.content)["components"][0]["description"], "Public Website")
+
+    def test_not_installed(self):
+        TestingBase().uninstall()
+        response = self.client.get(reverse("app.api.public.v1.summary.endpoint"))
+        self.assertEqual(response.status_code, 302)
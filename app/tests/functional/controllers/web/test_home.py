@@ -13,14 +13,16 @@
 # limitations under the License.
 
 # Third Party Library
-from django.test import TestCase
+from django.test import TransactionTestCase
+from django.utils import timezone
 from django.shortcuts import reverse
 
 # Local Library
 from app.tests.testing_base import TestingBase
+from app.modules.entity.incident_entity import IncidentEntity
 
 
-class TestHome(TestCase):
+class TestHome(TransactionTestCase):
 
     def setUp(self):
         tb = TestingBase()
@@ -41,3 +43,17 @@ class TestHome(TestCase):
     def test_get(self):
         response = self.client.get(reverse("app.web.status_page_index"))
         self.assertEqual(response.status_code, 200)
+
+    def test_get_after_update(self):
+        response = self.client.get(reverse("app.web.status_page_index"))
+        self.assertNotContains(response, "Database Maintenance")
+
+        IncidentEntity().insert_one({
+            "name": "Database Maintenance",
+            "uri": "db-maintenance",
+            "status": "open",
+            "datetime": timezone.now()
+        })
+
+        response = self.client.get(reverse("app.web.status_page_index"))
+        self.assertContains(response, "Database Maintenance")
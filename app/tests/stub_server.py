@@ -0,0 +1,67 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import time
+import threading
+from http.server import HTTPServer
+from socketserver import ThreadingMixIn
+from http.server import BaseHTTPRequestHandler
+
+
+class StubHandler(BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.requests.append({
+            "path": self.path,
+            "headers": dict(self.headers),
+            "body": body.decode("utf-8")
+        })
+
+        if self.path.startswith("/slow"):
+            time.sleep(self.server.delay)
+
+        status = 500 if self.path.startswith("/fail") else 200
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer(ThreadingMixIn, HTTPServer):
+    """Local HTTP server recording the requests it receives"""
+
+    daemon_threads = True
+
+    def __init__(self, delay=1):
+        super().__init__(("127.0.0.1", 0), StubHandler)
+        self.requests = []
+        self.delay = delay
+        self.__thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    def get_url(self, path="/"):
+        return "http://127.0.0.1:%d%s" % (self.server_address[1], path)
+
+    def start(self):
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,63 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import json
+from unittest import mock
+
+# Third Party Library
+from django.test import TestCase
+
+# Local Library
+from app.modules.core.metric import Metric
+from app.modules.core.page_cache import PageCache
+from app.modules.entity.metric_entity import MetricEntity
+from app.modules.entity.metric_series_entity import MetricSeriesEntity
+
+
+class Test_Metric(TestCase):
+
+    def setUp(self):
+        self.metric = MetricEntity().insert_one({
+            "title": "Response Time",
+            "description": "Response Time",
+            "source": "newrelic",
+            "data": json.dumps({"metric": "response_time", "application": "1"}),
+            "x_axis": "Time",
+            "y_axis": "ms"
+        })
+        self.version = PageCache().get_version()
+        self.metrics_version = PageCache().get_version(PageCache.METRICS)
+
+    def test_collect(self):
+        points = [{"timestamp": 1500000000 + i * 60, "value": i} for i in range(3)] + [{"timestamp": 1500000180, "value": None}]
+
+        with mock.patch.object(Metric, "get_metric_points", return_value=points):
+            result = Metric().collect()
+
+        self.assertEqual(result, {"collected": 3, "failed": 0})
+        self.assertEqual(MetricSeriesEntity().count_all(), 3)
+
+        # Only the pages showing metrics are invalidated
+        self.assertEqual(PageCache().get_version(), self.version)
+        self.assertNotEqual(PageCache().get_version(PageCache.METRICS), self.metrics_version)
+
+    def test_collect_failed(self):
+        # Without a NewRelic API key nothing can be collected
+        result = Metric().collect()
+
+        self.assertEqual(result, {"collected": 0, "failed": 3})
+        self.assertEqual(MetricSeriesEntity().count_all(), 0)
+        self.assertEqual(PageCache().get_version(), self.version)
+        self.assertEqual(PageCache().get_version(PageCache.METRICS), self.metrics_version)
@@ -0,0 +1,118 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import json
+from unittest import mock
+from datetime import timedelta
+
+# Third Party Library
+from django.test import TestCase
+from django.utils import timezone
+from django.contrib.auth.models import User
+from kombu.exceptions import OperationalError
+
+# Local Library
+from app.models import OutboxMessage
+from app.modules.core.outbox import Outbox
+from app.tasks.incident_update import incident_update
+from app.modules.entity.notification_entity import NotificationEntity
+
+
+class Test_Outbox(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user("joe", "joe@silverback.com", "password")
+
+    def __enqueue(self, update_id):
+        return Outbox().enqueue("incident_update", {
+            "incident_update_id": update_id,
+            "user_id": self.user.id
+        }, self.user.id, "incident_update:%d" % update_id, {
+            "highlight": "Incident Update",
+            "notification": "notifying subscribers with the incident update",
+            "url": "#",
+            "type": "pending",
+            "delivered": False,
+            "user_id": self.user.id
+        })
+
+    @mock.patch("app.modules.core.outbox.current_app")
+    def test_enqueue_and_relay(self, current_app):
+        task = self.__enqueue(1)
+
+        # Repeated requests before the relay run reuse the pending message
+        self.assertEqual(self.__enqueue(1).id, task.id)
+        self.assertNotEqual(self.__enqueue(2).id, task.id)
+        self.assertEqual(OutboxMessage.objects.count(), 2)
+        self.assertEqual(NotificationEntity().get_one_by_task_id(task.id).notification, "notifying subscribers with the incident update")
+        self.assertEqual(Outbox().get_stats()["pending"], 2)
+
+        with mock.patch.object(incident_update, "apply_async") as apply_async:
+            self.assertEqual(Outbox().relay(), 2)
+            self.assertEqual(Outbox().relay(), 0)
+
+        self.assertEqual(apply_async.call_count, 2)
+        self.assertEqual(apply_async.call_args_list[0][1]["task_id"], task.uuid)
+        self.assertEqual(apply_async.call_args_list[0][1]["kwargs"], {"incident_update_id": 1, "user_id": self.user.id})
+        self.assertEqual(Outbox().get_stats(), {"pending": 0, "failed": 0, "lag": 0})
+
+        # Published messages no longer deduplicate
+        self.assertNotEqual(self.__enqueue(1).id, task.id)
+
+    @mock.patch("app.modules.core.outbox.current_app")
+    def test_relay_broker_down(self, current_app):
+        self.__enqueue(1)
+        self.__enqueue(2)
+
+        with mock.patch.object(incident_update, "apply_async", side_effect=OperationalError("Connection refused")) as apply_async:
+            self.assertEqual(Outbox().relay(), 0)
+
+        # The batch stops at the first broker error and is kept for the next run
+        self.assertEqual(apply_async.call_count, 1)
+        message = OutboxMessage.objects.order_by('id').first()
+        self.assertEqual(message.status, "pending")
+        self.assertEqual(message.attempts, 1)
+        self.assertEqual(message.last_error, "Connection refused")
+        self.assertEqual(Outbox().get_stats()["pending"], 2)
+        self.assertEqual(json.loads(message.parameters)["incident_update_id"], 1)
+
+    @mock.patch.dict(os.environ, {"OUTBOX_MAX_ATTEMPTS": "2", "OUTBOX_BATCH_SIZE": "1"})
+    @mock.patch("app.modules.core.outbox.current_app")
+    def test_relay_poison_message(self, current_app):
+        self.__enqueue(1)
+        self.__enqueue(2)
+        poison = OutboxMessage.objects.order_by('id').first()
+
+        with mock.patch.object(incident_update, "apply_async", side_effect=[ValueError("Bad parameters"), None]) as apply_async:
+            self.assertEqual(Outbox().relay(), 0)
+            # The failed message backs off and the next one is published
+            self.assertEqual(Outbox().relay(), 1)
+
+        self.assertEqual(apply_async.call_args_list[1][1]["kwargs"]["incident_update_id"], 2)
+        poison = OutboxMessage.objects.get(id=poison.id)
+        self.assertEqual(poison.status, "pending")
+        self.assertEqual(poison.attempts, 1)
+        self.assertGreater(poison.next_attempt_at, timezone.now())
+
+        # Once out of attempts it is no longer relayed
+        OutboxMessage.objects.filter(id=poison.id).update(next_attempt_at=timezone.now() - timedelta(seconds=1))
+        with mock.patch.object(incident_update, "apply_async", side_effect=ValueError("Bad parameters")):
+            self.assertEqual(Outbox().relay(), 0)
+
+        poison = OutboxMessage.objects.get(id=poison.id)
+        self.assertEqual(poison.status, "failed")
+        self.assertEqual(poison.attempts, 2)
+        self.assertEqual(Outbox().get_stats(), {"pending": 0, "failed": 1, "lag": 0})
@@ -0,0 +1,39 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+from unittest import mock
+
+# Third Party Library
+from django.test import TestCase
+from django.test import override_settings
+
+# Local Library
+from app.modules.core.page_cache import PageCache
+
+
+class Test_Page_Cache(TestCase):
+
+    @override_settings(CACHE_SHARED=True)
+    def test_enabled(self):
+        self.assertTrue(PageCache().enabled())
+
+        with mock.patch.dict(os.environ, {"PAGE_CACHE_TIMEOUT": "0"}):
+            self.assertFalse(PageCache().enabled())
+
+    @override_settings(CACHE_SHARED=False)
+    def test_enabled_not_shared(self):
+        # Pages would stay stale until they expire as invalidations never reach this process
+        self.assertFalse(PageCache().enabled())
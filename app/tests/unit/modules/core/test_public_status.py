@@ -0,0 +1,76 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import json
+
+# Third Party Library
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+# Local Library
+from app.modules.core.public_status import PublicStatus
+from app.modules.entity.option_entity import OptionEntity
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.component_entity import ComponentEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
+from app.modules.entity.incident_update_component_entity import IncidentUpdateComponentEntity
+
+
+class Test_Public_Status(TransactionTestCase):
+
+    def setUp(self):
+        self.components = [ComponentEntity().insert_one({"name": name, "description": name}) for name in ["API", "Search", "Internal"]]
+        OptionEntity().insert_one({
+            "key": "builder_components",
+            "value": json.dumps(["c-%d" % self.components[0].id, "c-%d" % self.components[1].id])
+        })
+        incident = IncidentEntity().insert_one({
+            "name": "Outage",
+            "uri": "outage",
+            "status": "open",
+            "datetime": timezone.now()
+        })
+        self.update = IncidentUpdateEntity().insert_one({
+            "status": "investigating",
+            "datetime": timezone.now(),
+            "message": "Investigating",
+            "incident_id": incident.id
+        })
+
+    def __affect(self, component, type):
+        IncidentUpdateComponentEntity().insert_one({
+            "type": type,
+            "incident_update_id": self.update.id,
+            "component_id": component.id
+        })
+
+    def test_build_summary(self):
+        self.__affect(self.components[0], "major_outage")
+        self.__affect(self.components[2], "major_outage")
+
+        summary = PublicStatus().build_summary()
+
+        # A single component in major outage is the worst case
+        self.assertEqual(summary["status"]["indicator"], "high")
+        self.assertEqual([component["name"] for component in summary["components"]], ["API", "Search"])
+        self.assertEqual([component["status"] for component in summary["components"]], ["major_outage", "operational"])
+
+    def test_build_summary_degraded(self):
+        self.assertEqual(PublicStatus().build_summary()["status"]["indicator"], "normal")
+
+        for component in self.components:
+            self.__affect(component, "degraded_performance")
+
+        self.assertEqual(PublicStatus().build_summary()["status"]["indicator"], "low")
@@ -0,0 +1,152 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+from datetime import timedelta
+
+# Third Party Library
+from django.test import TestCase
+from django.utils import timezone
+from dateutil.relativedelta import relativedelta
+
+# Local Library
+from app.modules.util.series import Series
+from app.modules.core.status_page import StatusPage
+from app.modules.entity.option_entity import OptionEntity
+from app.modules.entity.metric_entity import MetricEntity
+from app.modules.entity.metric_series_entity import MetricSeriesEntity
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.component_entity import ComponentEntity
+from app.modules.entity.component_group_entity import ComponentGroupEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
+
+
+class Test_Status_Page(TestCase):
+
+    def __add_incident(self, uri, datetime, updates=1):
+        incident = IncidentEntity().insert_one({
+            "name": "Incident %s" % uri,
+            "uri": uri,
+            "status": "closed",
+            "datetime": datetime
+        })
+        for i in range(updates):
+            IncidentUpdateEntity().insert_one({
+                "status": "resolved",
+                "datetime": datetime,
+                "message": "Update %d" % i,
+                "incident_id": incident.id
+            })
+        return incident
+
+    def test_get_past_incidents(self):
+        now = timezone.now()
+        self.__add_incident("today", now, 2)
+        self.__add_incident("two-days-ago", now - timedelta(days=2))
+        self.__add_incident("too-old", now - timedelta(days=10))
+
+        past_incidents = StatusPage().get_past_incidents(7)
+
+        self.assertEqual(len(past_incidents), 7)
+        self.assertEqual(past_incidents[0]["date"], now.strftime("%B %d, %Y"))
+        self.assertEqual([item["uri"] for item in past_incidents[0]["incidents"]], ["today"])
+        self.assertEqual(len(past_incidents[0]["incidents"][0]["updates"]), 2)
+        self.assertEqual(past_incidents[1]["incidents"], [])
+        self.assertEqual([item["uri"] for item in past_incidents[2]["incidents"]], ["two-days-ago"])
+        self.assertEqual(sum(len(item["incidents"]) for item in past_incidents), 2)
+
+    def test_get_past_incidents_query_count(self):
+        now = timezone.now()
+        for i in range(14):
+            self.__add_incident("incident-%d" % i, now - timedelta(days=i % 7), 3)
+
+        status_page = StatusPage()
+
+        with self.assertNumQueries(2):
+            past_incidents = status_page.get_past_incidents(7)
+
+        self.assertEqual(sum(len(item["incidents"]) for item in past_incidents), 14)
+
+    def test_get_incidents_for_period(self):
+        now = timezone.now()
+        self.__add_incident("this-month", now.replace(day=1, hour=0), 3)
+        self.__add_incident("last-month", now.replace(day=1) - relativedelta(months=+1))
+        self.__add_incident("last-quarter", now.replace(day=1) - relativedelta(months=+3))
+
+        status_page = StatusPage()
+
+        with self.assertNumQueries(1):
+            history = status_page.get_incidents_for_period(1)
+
+        self.assertEqual([item["date"] for item in history["incidents"]], [
+            (now - relativedelta(months=+i)).strftime("%B %Y") for i in range(3)
+        ])
+        self.assertEqual([item["uri"] for item in history["incidents"][0]["incidents"]], ["this-month"])
+        self.assertEqual([item["uri"] for item in history["incidents"][1]["incidents"]], ["last-month"])
+        self.assertEqual(history["incidents"][2]["incidents"], [])
+        self.assertIn(" - ", history["incidents"][0]["incidents"][0]["period"])
+        self.assertEqual(
+            [item["uri"] for item in status_page.get_incidents_for_period(2)["incidents"][0]["incidents"]],
+            ["last-quarter"]
+        )
+
+    def test_get_services(self):
+        group1 = ComponentGroupEntity().insert_one({"name": "API", "description": "API"})
+        group2 = ComponentGroupEntity().insert_one({"name": "Empty", "description": "Empty"})
+        component1 = ComponentEntity().insert_one({"name": "Website", "description": "Website"})
+        ComponentEntity().insert_one({"name": "Search", "description": "Search", "group_id": group1.id})
+        ComponentEntity().insert_one({"name": "Auth", "description": "Auth", "group_id": group1.id})
+        OptionEntity().insert_one({
+            "key": "builder_components",
+            "value": '["g-%d", "c-%d", "g-%d", "c-1000"]' % (group1.id, component1.id, group2.id)
+        })
+
+        status_page = StatusPage()
+        # Warm up the uptime charts, they are built once and cached
+        status_page.get_services()
+
+        with self.assertNumQueries(3):
+            services = status_page.get_services()
+
+        self.assertEqual([service["name"] for service in services], ["API", "Website", "Empty"])
+        self.assertEqual([service["name"] for service in services[0]["sub_services"]], ["Auth", "Search"])
+        self.assertEqual(services[0]["sub_services"], status_page.get_sub_services(group1.id))
+        self.assertEqual(services[1]["sub_services"], [])
+        self.assertEqual(services[2]["sub_services"], [])
+
+    def test_get_system_metrics(self):
+        metric = MetricEntity().insert_one({
+            "title": "Response Time",
+            "description": "Response Time",
+            "source": "newrelic",
+            "data": '{"application": "1", "metric": "response_time"}',
+            "x_axis": "Time",
+            "y_axis": "ms"
+        })
+        MetricSeriesEntity().update_one_by_metric(metric.id, "day", Series().pack([1577836800]), Series().pack([0.25]))
+        OptionEntity().insert_one({
+            "key": "builder_metrics",
+            "value": '["m-%d", "m-1000"]' % metric.id
+        })
+
+        status_page = StatusPage()
+
+        with self.assertNumQueries(3):
+            metrics = status_page.get_system_metrics()
+
+        self.assertEqual(len(metrics), 1)
+        self.assertEqual(metrics[0]["title"], "Response Time")
+        self.assertEqual(metrics[0]["day_data"], [{"timestamp": 1577836800, "value": 0.25}])
+        self.assertEqual(metrics[0]["week_data"], [])
+        self.assertEqual(metrics[0]["month_data"], [])
@@ -0,0 +1,94 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+from unittest import mock
+
+# Third Party Library
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+# Local Library
+from app.modules.core.system_status import SystemStatus
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.component_entity import ComponentEntity
+from app.modules.entity.component_group_entity import ComponentGroupEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
+from app.modules.entity.incident_update_component_entity import IncidentUpdateComponentEntity
+
+
+class Test_System_Status(TransactionTestCase):
+
+    def setUp(self):
+        self.group = ComponentGroupEntity().insert_one({"name": "API", "description": "API"})
+        self.component1 = ComponentEntity().insert_one({"name": "Auth", "description": "Auth", "group_id": self.group.id})
+        self.component2 = ComponentEntity().insert_one({"name": "Search", "description": "Search", "group_id": self.group.id})
+
+    def __add_update(self, incident, components):
+        update = IncidentUpdateEntity().insert_one({
+            "status": "investigating",
+            "datetime": timezone.now(),
+            "message": "Investigating",
+            "incident_id": incident.id
+        })
+        for component, type in components:
+            IncidentUpdateComponentEntity().insert_one({
+                "type": type,
+                "component_id": component.id,
+                "incident_update_id": update.id
+            })
+        return update
+
+    def test_operational_without_incidents(self):
+        system_status = SystemStatus().get()
+        self.assertEqual(system_status["affected_components_map"], {})
+        self.assertEqual(system_status["overall_status"], "Operational")
+
+    def test_refresh_on_write(self):
+        incident1 = IncidentEntity().insert_one({"name": "Incident 1", "uri": "inc1", "status": "open", "datetime": timezone.now()})
+        incident2 = IncidentEntity().insert_one({"name": "Incident 2", "uri": "inc2", "status": "open", "datetime": timezone.now()})
+        self.__add_update(incident1, [(self.component1, "degraded_performance")])
+        self.__add_update(incident2, [(self.component1, "major_outage"), (self.component2, "maintenance")])
+
+        system_status = SystemStatus().get()
+        self.assertEqual(system_status["affected_components_status"], {"Auth": "major_outage", "Search": "maintenance"})
+        self.assertEqual(system_status["affected_groups_status"], {"API": "major_outage"})
+        self.assertEqual(system_status["affected_groups_map"], {"API": self.group.id})
+        self.assertEqual(system_status["overall_status"], "Major Outage")
+
+        IncidentEntity().update_one_by_id(incident2.id, {"status": "closed"})
+
+        system_status = SystemStatus().get()
+        self.assertEqual(system_status["affected_components_status"], {"Auth": "degraded_performance"})
+        self.assertEqual(system_status["overall_status"], "Degraded Performance")
+
+        IncidentEntity().delete_one_by_id(incident1.id)
+
+        self.assertEqual(SystemStatus().get()["affected_components_map"], {})
+
+    def test_refresh_once_per_transaction(self):
+        incident = IncidentEntity().insert_one({"name": "Incident", "uri": "inc", "status": "open", "datetime": timezone.now()})
+        self.__add_update(incident, [(self.component1, "major_outage"), (self.component2, "maintenance")])
+        self.__add_update(incident, [(self.component1, "degraded_performance")])
+
+        # Rows deleted by the cascade rebuild the snapshot once on commit
+        with mock.patch.object(SystemStatus, "refresh") as refresh:
+            IncidentEntity().delete_one_by_id(incident.id)
+
+        self.assertEqual(refresh.call_count, 1)
+
+    def test_get_reads_snapshot(self):
+        SystemStatus().refresh()
+        with self.assertNumQueries(1):
+            SystemStatus().get()
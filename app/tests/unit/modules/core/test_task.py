@@ -0,0 +1,92 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import json
+from unittest import mock
+
+# Third Party Library
+from django.test import TestCase
+from django.contrib.auth.models import User
+
+# Local Library
+from app.celery import after_task
+from app.celery import flush_task_results
+from app.modules.core.task import Task
+from app.tasks.notify_subscriber import notify_subscribers
+from app.modules.entity.task_entity import TaskEntity
+from app.modules.entity.notification_entity import NotificationEntity
+
+
+class Test_Task(TestCase):
+
+    def setUp(self):
+        Task._results = {}
+        user = User.objects.create_user("joe", "joe@silverback.com", "password")
+        self.tasks = []
+        for i in range(3):
+            task = TaskEntity().insert_one({
+                "uuid": "uuid-%d" % i,
+                "status": "pending",
+                "executor": "app.tasks.incident_update.incident_update",
+                "parameters": "{}",
+                "result": "{}",
+                "user_id": user.id
+            })
+            NotificationEntity().insert_one({
+                "highlight": "Incident Update",
+                "notification": "notifying subscribers",
+                "url": "#",
+                "type": "pending",
+                "delivered": False,
+                "user_id": user.id,
+                "task_id": task.id
+            })
+            self.tasks.append(task)
+
+    @mock.patch.dict(os.environ, {"TASK_RESULT_BATCH_SIZE": "2", "TASK_RESULT_FLUSH_INTERVAL": "60"})
+    def test_buffer_result(self):
+        result = {"status": "passed", "result": json.dumps({"queued": 1}), "notify_type": "passed"}
+
+        Task().buffer_result("uuid-0", result)
+        self.assertEqual(TaskEntity().get_one_by_uuid("uuid-0").status, "pending")
+
+        # A full batch is written with a handful of queries whatever its size
+        with self.assertNumQueries(3):
+            Task().buffer_result("uuid-1", result)
+
+        for task in self.tasks[:2]:
+            self.assertEqual(TaskEntity().get_one_by_uuid(task.uuid).status, "passed")
+            self.assertEqual(TaskEntity().get_one_by_uuid(task.uuid).result, json.dumps({"queued": 1}))
+            self.assertEqual(NotificationEntity().get_one_by_task_id(task.id).type, "passed")
+        self.assertEqual(NotificationEntity().get_one_by_task_id(self.tasks[2].id).type, "pending")
+        self.assertIsNone(Task._timer)
+
+    @mock.patch.dict(os.environ, {"TASK_RESULT_BATCH_SIZE": "50", "TASK_RESULT_FLUSH_INTERVAL": "60"})
+    def test_flush_on_shutdown(self):
+        Task().buffer_result("uuid-0", {"status": "passed", "result": "{}", "notify_type": "passed"})
+        self.assertEqual(TaskEntity().get_one_by_uuid("uuid-0").status, "pending")
+
+        # Worker shutdown writes what is left in the buffer
+        flush_task_results()
+
+        self.assertEqual(TaskEntity().get_one_by_uuid("uuid-0").status, "passed")
+        self.assertIsNone(Task._timer)
+
+    def test_after_untracked_task(self):
+        self.assertFalse(notify_subscribers.tracked)
+        after_task(sender=notify_subscribers, result={"status": "passed", "result": "{}"})
+        self.assertEqual(Task._results, {})
+        self.assertEqual(Task().flush_results(), 0)
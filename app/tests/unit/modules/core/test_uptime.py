@@ -0,0 +1,118 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+from datetime import timedelta
+
+# Third Party Library
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+# Local Library
+from app.modules.core.uptime import Uptime
+from app.modules.util.helpers import Helpers
+from app.modules.core.page_cache import PageCache
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.component_entity import ComponentEntity
+from app.modules.entity.uptime_rollup_entity import UptimeRollupEntity
+from app.modules.entity.component_group_entity import ComponentGroupEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
+from app.modules.entity.incident_update_component_entity import IncidentUpdateComponentEntity
+
+
+class Test_Uptime(TransactionTestCase):
+
+    def setUp(self):
+        self.group = ComponentGroupEntity().insert_one({"name": "API", "description": "API", "uptime": "on"})
+        self.component = ComponentEntity().insert_one({
+            "name": "Search",
+            "description": "Search",
+            "uptime": "on",
+            "group_id": self.group.id
+        })
+        self.day = Helpers().local_date(timezone.now()) - timedelta(days=2)
+        self.start = Helpers().day_start(self.day) + timedelta(hours=10)
+
+    def __add_outage(self, start, minutes):
+        incident = IncidentEntity().insert_one({
+            "name": "Outage",
+            "uri": "outage-%s" % start.timestamp(),
+            "status": "closed",
+            "datetime": start
+        })
+        update = IncidentUpdateEntity().insert_one({
+            "status": "investigating",
+            "datetime": start,
+            "message": "Investigating",
+            "incident_id": incident.id
+        })
+        IncidentUpdateComponentEntity().insert_one({
+            "type": "major_outage",
+            "incident_update_id": update.id,
+            "component_id": self.component.id
+        })
+        IncidentUpdateEntity().insert_one({
+            "status": "resolved",
+            "datetime": start + timedelta(minutes=minutes),
+            "message": "Resolved",
+            "incident_id": incident.id
+        })
+
+    def test_rollup(self):
+        self.__add_outage(self.start, 30)
+        Uptime().rollup()
+
+        rows = UptimeRollupEntity().get_many_in_range(self.day, self.day)
+        self.assertEqual(len(rows), 2)
+        self.assertEqual([row.major_outage for row in rows], [30, 30])
+
+        # A later write only marks its own day as outdated
+        self.__add_outage(self.start + timedelta(hours=2), 15)
+        Uptime().rollup()
+
+        rows = UptimeRollupEntity().get_many_in_range(self.day, self.day)
+        self.assertEqual([row.major_outage for row in rows], [45, 45])
+
+    def test_rollup_unchanged(self):
+        self.__add_outage(self.start, 30)
+        self.assertTrue(Uptime().rollup()["changed"])
+        version = PageCache().get_version()
+
+        # Nothing new to roll up keeps the cached pages
+        self.assertFalse(Uptime().rollup()["changed"])
+        self.assertEqual(PageCache().get_version(), version)
+
+        self.__add_outage(self.start + timedelta(hours=2), 15)
+        self.assertTrue(Uptime().rollup()["changed"])
+        self.assertNotEqual(PageCache().get_version(), version)
+
+    def test_get_chart(self):
+        self.__add_outage(self.start, 30)
+        Uptime().rollup()
+
+        chart = Uptime().get_chart(self.component.id, "component", 90)
+        self.assertEqual(len(chart), 90)
+        self.assertEqual(chart[-3]["fill"], Uptime.COLORS["major_outage"])
+        self.assertIn("30 mins", chart[-3]["content"])
+        self.assertEqual(chart[-1]["fill"], Uptime.COLORS["operational"])
+        self.assertEqual(Uptime().get_chart(self.group.id, "group", 90)[-3]["fill"], Uptime.COLORS["major_outage"])
+
+    def test_get_chart_after_rollup(self):
+        Uptime().rollup()
+        self.assertEqual(Uptime().get_chart(self.component.id, "component", 90)[-3]["fill"], Uptime.COLORS["operational"])
+
+        # Cached charts move to the version the rollup wrote to the database
+        self.__add_outage(self.start, 30)
+        Uptime().rollup()
+        self.assertEqual(Uptime().get_chart(self.component.id, "component", 90)[-3]["fill"], Uptime.COLORS["major_outage"])
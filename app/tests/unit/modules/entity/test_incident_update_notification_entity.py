@@ -0,0 +1,123 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+from unittest import mock
+from datetime import timedelta
+
+# Third Party Library
+from django.test import TestCase
+from django.utils import timezone
+from django.db import connection
+
+# Local Library
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.subscriber_entity import SubscriberEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
+from app.modules.entity.incident_update_notification_entity import IncidentUpdateNotificationEntity
+
+
+class Test_Incident_Update_Notification_Entity(TestCase):
+
+    def setUp(self):
+        incident = IncidentEntity().insert_one({
+            "name": "Incident",
+            "uri": "incident",
+            "status": "open",
+            "datetime": timezone.now()
+        })
+        self.update = IncidentUpdateEntity().insert_one({
+            "status": "investigating",
+            "datetime": timezone.now(),
+            "message": "Investigating",
+            "incident_id": incident.id
+        })
+        self.subscribers = [SubscriberEntity().insert_one({
+            "type": "email",
+            "email": "joe%d@silverback.com" % i,
+            "status": "unverified" if i == 4 else "verified",
+            "external_id": "external-%d" % i
+        }) for i in range(5)]
+
+    def test_insert_many(self):
+        subscriber_entity = SubscriberEntity()
+        notification_entity = IncidentUpdateNotificationEntity()
+        notification_entity.insert_one({
+            "status": "success",
+            "incident_update_id": self.update.id,
+            "subscriber_id": self.subscribers[0].id
+        })
+
+        with self.assertNumQueries(1):
+            subscriber_ids = subscriber_entity.get_ids_without_notification(self.update.id, 0, 2)
+
+        self.assertEqual(subscriber_ids, [self.subscribers[1].id, self.subscribers[2].id])
+        self.assertEqual(
+            subscriber_entity.get_ids_without_notification(self.update.id, subscriber_ids[-1], 2),
+            [self.subscribers[3].id]
+        )
+
+        # One insert, wrapped in a savepoint inside the test transaction
+        with self.assertNumQueries(3):
+            self.assertEqual(notification_entity.insert_many(self.update.id, subscriber_ids), 2)
+
+        self.assertEqual(subscriber_entity.get_ids_without_notification(self.update.id), [self.subscribers[3].id])
+        self.assertEqual(len(notification_entity.get_ids_by_update_status(self.update.id, ["pending", "failed"])), 2)
+        self.assertEqual(len(notification_entity.get_ids_by_update_status(self.update.id, ["success"])), 1)
+        self.assertEqual(notification_entity.count_by_update_status(self.update.id, "pending"), 2)
+
+    def test_insert_many_conflict(self):
+        notification_entity = IncidentUpdateNotificationEntity()
+        notification_entity.insert_many(self.update.id, [self.subscribers[0].id, self.subscribers[1].id])
+
+        # A repeated fan-out only inserts the subscribers without a notification
+        self.assertEqual(notification_entity.insert_many(self.update.id, [subscriber.id for subscriber in self.subscribers[:3]]), 1)
+        self.assertEqual(notification_entity.insert_many(self.update.id, [self.subscribers[0].id]), 0)
+        self.assertEqual(notification_entity.count_by_update_status(self.update.id, "pending"), 3)
+
+    def test_claim_many(self):
+        notification_entity = IncidentUpdateNotificationEntity()
+        notification_entity.insert_many(self.update.id, [subscriber.id for subscriber in self.subscribers[:3]])
+        ids = notification_entity.get_ids_by_update_status(self.update.id, ["pending"])
+
+        first = list(notification_entity.get_many_by_ids(ids))
+        duplicate = list(notification_entity.get_many_by_ids(ids))
+
+        # A duplicate message loaded the same rows, only the first claim gets them
+        self.assertEqual(notification_entity.claim_many(first, ["pending", "failed"]), ids)
+        self.assertEqual(notification_entity.claim_many(duplicate, ["pending", "failed"]), [])
+
+    def __assert_claims(self):
+        notification_entity = IncidentUpdateNotificationEntity()
+        notification_entity.insert_many(self.update.id, [subscriber.id for subscriber in self.subscribers[:4]])
+        ids = notification_entity.get_ids_by_update_status(self.update.id, ["pending"])
+        lease_until = timezone.now() + timedelta(seconds=60)
+
+        self.assertEqual(notification_entity.claim_ids(["pending", "failed"], lease_until, 3), ids[:3])
+        self.assertEqual(notification_entity.claim_ids(["pending", "failed"], lease_until + timedelta(microseconds=1), 3), ids[3:])
+        self.assertEqual(notification_entity.claim_ids(["pending", "failed"], lease_until, 3), [])
+        self.assertEqual(notification_entity.count_claimable(["pending", "failed"]), 0)
+
+        # Leases of crashed workers expire
+        notification_entity.update_many_next_attempt_by_ids(ids[:1], timezone.now() - timedelta(seconds=1))
+        self.assertEqual(notification_entity.count_claimable(["pending", "failed"]), 1)
+        self.assertEqual(notification_entity.claim_ids(["pending", "failed"], lease_until, 3), ids[:1])
+
+    def test_claim_ids(self):
+        with mock.patch.object(connection.features, "has_select_for_update_skip_locked", False):
+            self.__assert_claims()
+
+    def test_claim_ids_skip_locked(self):
+        with mock.patch.object(connection.features, "has_select_for_update_skip_locked", True):
+            self.__assert_claims()
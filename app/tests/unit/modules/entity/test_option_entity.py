@@ -13,6 +13,9 @@
 # limitations under the License.
 
 from django.test import TestCase
+from django.test import TransactionTestCase
+from django.test import override_settings
+from app.models import Option
 from app.modules.entity.option_entity import OptionEntity
 
 
@@ -69,8 +72,8 @@ class Test_Option_Entity(TestCase):
             {"key": "key4", "value": "value4", "autoload": True},
             {"key": "key5", "value": "value5", "autoload": True}
         ]))
-        self.assertEqual(option_entity.get_many_by_autoload(True).count(), 2)
-        self.assertEqual(option_entity.get_many_by_autoload(False).count(), 2)
+        self.assertEqual(len(option_entity.get_many_by_autoload(True)), 2)
+        self.assertEqual(len(option_entity.get_many_by_autoload(False)), 2)
 
     def test_update_value_by_id(self):
         option_entity = OptionEntity()
@@ -111,3 +114,43 @@ class Test_Option_Entity(TestCase):
         })
         self.assertTrue(option_entity.delete_one_by_key("key11"), 1)
         self.assertFalse(option_entity.delete_one_by_key("key12"))
+
+
+@override_settings(CACHE_SHARED=True)
+class Test_Option_Entity_Cache(TransactionTestCase):
+
+    def test_get_one_by_key(self):
+        option_entity = OptionEntity()
+        option_entity.insert_many([
+            {"key": "key13", "value": "value13", "autoload": True},
+            {"key": "key14", "value": "value14"}
+        ])
+
+        with self.assertNumQueries(1):
+            self.assertEqual(option_entity.get_one_by_key("key13").value, "value13")
+            self.assertEqual(option_entity.get_value_by_key("key14"), "value14")
+            self.assertEqual(option_entity.get_value_by_key("not_found_key", "default"), "default")
+            self.assertEqual([option.key for option in option_entity.get_many_by_autoload(True)], ["key13"])
+            self.assertEqual([option.key for option in option_entity.get_many_by_keys(["key13", "key14"])], ["key13", "key14"])
+
+        # Returned options are copies, changing them does not leak into the cache
+        option_entity.get_one_by_key("key13").value = "changed"
+        self.assertEqual(option_entity.get_value_by_key("key13"), "value13")
+
+        # Writes from any entity instance bump the shared version
+        self.assertTrue(OptionEntity().update_value_by_key("key13", "new_value13"))
+        self.assertEqual(option_entity.get_value_by_key("key13"), "new_value13")
+        self.assertTrue(OptionEntity().delete_one_by_key("key14"))
+        self.assertFalse(option_entity.get_one_by_key("key14"))
+
+        option_entity.truncate()
+
+    @override_settings(CACHE_SHARED=False)
+    def test_get_one_by_key_not_shared(self):
+        option_entity = OptionEntity()
+        option_entity.insert_one({"key": "key15", "value": "value15"})
+        self.assertEqual(option_entity.get_value_by_key("key15"), "value15")
+
+        # Without a shared cache a write from another process is read right away
+        Option.objects.filter(key="key15").update(value="new_value15")
+        self.assertEqual(option_entity.get_value_by_key("key15"), "new_value15")
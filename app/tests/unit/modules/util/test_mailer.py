@@ -0,0 +1,66 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import smtplib
+
+# Third Party Library
+from django.test import TestCase
+from django.test import override_settings
+from django.core.mail import EmailMessage
+from django.core.mail.backends.locmem import EmailBackend
+
+# Local Library
+from app.modules.util.mailer import Mailer
+
+
+class FlakyEmailBackend(EmailBackend):
+    """Drops the connection on the first message to drop@silverback.com"""
+
+    opened = 0
+    dropped = False
+
+    def open(self):
+        FlakyEmailBackend.opened += 1
+        return True
+
+    def send_messages(self, messages):
+        if messages[0].to == ["drop@silverback.com"] and not FlakyEmailBackend.dropped:
+            FlakyEmailBackend.dropped = True
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        if messages[0].to == ["refused@silverback.com"]:
+            raise smtplib.SMTPRecipientsRefused({"refused@silverback.com": (550, b"No such user")})
+        return super().send_messages(messages)
+
+
+@override_settings(EMAIL_BACKEND="app.tests.unit.modules.util.test_mailer.FlakyEmailBackend")
+class Test_Mailer(TestCase):
+
+    def test_send(self):
+        FlakyEmailBackend.opened = 0
+        FlakyEmailBackend.dropped = False
+
+        with Mailer() as mailer:
+            self.assertTrue(mailer.send(EmailMessage("Subject", "Body", "hello@silverback.com", ["joe@silverback.com"])))
+            self.assertTrue(mailer.send(EmailMessage("Subject", "Body", "hello@silverback.com", ["doe@silverback.com"])))
+            self.assertEqual(FlakyEmailBackend.opened, 1)
+
+            # Reconnects and sends again when the connection drops
+            self.assertTrue(mailer.send(EmailMessage("Subject", "Body", "hello@silverback.com", ["drop@silverback.com"])))
+            self.assertEqual(FlakyEmailBackend.opened, 2)
+
+            # A refused recipient fails alone and keeps the connection
+            self.assertFalse(mailer.send(EmailMessage("Subject", "Body", "hello@silverback.com", ["refused@silverback.com"])))
+            self.assertTrue(mailer.send(EmailMessage("Subject", "Body", "hello@silverback.com", ["joe@silverback.com"])))
+            self.assertEqual(FlakyEmailBackend.opened, 2)
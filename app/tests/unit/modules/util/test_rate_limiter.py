@@ -0,0 +1,70 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import time
+import threading
+
+# Third Party Library
+from django.test import TestCase
+
+# Local Library
+from app.modules.util.rate_limiter import RateLimiter
+
+
+class Test_Rate_Limiter(TestCase):
+
+    def setUp(self):
+        RateLimiter._buckets = {}
+
+    def test_unlimited(self):
+        limiter = RateLimiter("email")
+        for i in range(100):
+            self.assertEqual(limiter.acquire(), 0)
+        self.assertEqual(RateLimiter.get_levels(), {})
+
+    def test_acquire(self):
+        limiter = RateLimiter("phone", rate=20, burst=5)
+
+        start = time.time()
+        for i in range(5):
+            self.assertEqual(limiter.acquire(), 0)
+        self.assertLess(time.time() - start, 0.05)
+
+        # The burst is spent, next tokens come at the refill rate
+        start = time.time()
+        for i in range(4):
+            limiter.acquire()
+        self.assertGreater(time.time() - start, 0.15)
+
+    def test_acquire_shared_by_threads(self):
+        limiter = RateLimiter("endpoint:example.com", rate=50, burst=1)
+        threads = [threading.Thread(target=limiter.acquire) for i in range(10)]
+
+        start = time.time()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertGreater(time.time() - start, 0.15)
+
+    def test_get_levels(self):
+        RateLimiter("email", rate=1, burst=10).acquire(4)
+        level = RateLimiter.get_levels()["email"]
+
+        self.assertEqual(level["burst"], 10)
+        self.assertEqual(level["rate"], 1)
+        self.assertGreaterEqual(level["tokens"], 6)
+        self.assertLess(level["tokens"], 7)
+        self.assertAlmostEqual(level["fill"], level["tokens"] / 10, places=2)
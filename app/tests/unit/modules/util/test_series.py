@@ -0,0 +1,46 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Third Party Library
+from django.test import TestCase
+
+# Local Library
+from app.modules.util.series import Series
+
+
+class Test_Series(TestCase):
+
+    def test_pack(self):
+        series = Series()
+        blob = series.pack([1.5, 2.25, -3])
+        self.assertEqual(len(blob), 24)
+        self.assertEqual(list(series.unpack(blob)), [1.5, 2.25, -3.0])
+        self.assertEqual(list(series.unpack(series.pack([]))), [])
+
+    def test_downsample(self):
+        series = Series()
+        timestamps = [float(i) for i in range(1000)]
+        values = [0.0] * 1000
+        values[500] = 10.0
+
+        sampled_timestamps, sampled_values = series.downsample(timestamps, values, 50)
+
+        self.assertEqual(len(sampled_timestamps), 50)
+        self.assertEqual(len(sampled_values), 50)
+        self.assertEqual(sampled_timestamps[0], 0.0)
+        self.assertEqual(sampled_timestamps[-1], 999.0)
+        self.assertEqual(list(sampled_timestamps), sorted(sampled_timestamps))
+        # The spike survives downsampling
+        self.assertIn(10.0, sampled_values)
+        self.assertEqual(series.downsample(timestamps[:10], values[:10], 50), (timestamps[:10], values[:10]))
@@ -0,0 +1,66 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+from unittest import mock
+
+# Third Party Library
+from django.test import TestCase
+
+# Local Library
+from app.modules.util.sms import SMS
+from app.modules.util.sms import TwilioDriver
+
+
+class Test_SMS(TestCase):
+
+    def setUp(self):
+        SMS.outbox = []
+
+    @mock.patch.dict(os.environ, {"TEXT_MESSAGING_DRIVER": "locmem"})
+    def test_deliver_many(self):
+        messages = [("+1555000%04d" % i, "Update %d" % i) for i in range(20)]
+
+        self.assertEqual(SMS("Silverback").deliver_many(messages), [None] * 20)
+        self.assertEqual(len(SMS.outbox), 20)
+        self.assertEqual(SMS.outbox[0]["from"], "Silverback")
+
+    @mock.patch.dict(os.environ, {"TEXT_MESSAGING_DRIVER": "none"})
+    def test_deliver_without_driver(self):
+        self.assertEqual(SMS("Silverback").deliver_many([("+15550000000", "Update")]), ["No active SMS driver"])
+
+    @mock.patch.dict(os.environ, {"TEXT_MESSAGING_DRIVER": "twilio", "TWILIO_FROM_NUMBERS": "+15551110000, +15552220000"})
+    def test_twilio_sender(self):
+        client = mock.MagicMock()
+        with mock.patch.object(TwilioDriver, "_client", client):
+            sms = SMS("Silverback")
+            self.assertIsNone(sms.deliver("+15550000001", "Update"))
+            self.assertIsNone(sms.deliver("+15550000001", "Update"))
+
+            senders = [call[1]["from_"] for call in client.messages.create.call_args_list]
+            self.assertIn(senders[0], ["+15551110000", "+15552220000"])
+            self.assertEqual(senders[0], senders[1])
+
+            with mock.patch.dict(os.environ, {"TWILIO_MESSAGING_SERVICE_SID": "MG123"}):
+                self.assertIsNone(SMS("Silverback").deliver("+15550000001", "Update"))
+            self.assertEqual(client.messages.create.call_args[1]["messaging_service_sid"], "MG123")
+
+            client.messages.create.side_effect = Exception("Unreachable")
+            self.assertEqual(sms.deliver("+15550000001", "Update"), "Error while sending SMS: Unreachable")
+
+    @mock.patch.dict(os.environ, {"TWILIO_ACCOUNT_SID": "AC123", "TWILIO_AUTH_TOKEN": "token"})
+    def test_twilio_client_is_shared(self):
+        with mock.patch.object(TwilioDriver, "_client", None):
+            self.assertIs(TwilioDriver().get_client(), TwilioDriver().get_client())
@@ -0,0 +1,68 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import json
+import time
+from unittest import mock
+
+# Third Party Library
+from django.test import TestCase
+
+# Local Library
+from app.tests.stub_server import StubServer
+from app.modules.util.webhook import Webhook
+
+
+class Test_Webhook(TestCase):
+
+    def setUp(self):
+        # Pools are sized when the session is created
+        Webhook._session = None
+        self.server = StubServer(delay=1).start()
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_deliver(self):
+        webhook = Webhook()
+        payload = json.dumps({"type": "incident_update"})
+
+        self.assertIsNone(webhook.deliver(self.server.get_url("/ok"), "token", payload))
+        self.assertEqual(webhook.deliver(self.server.get_url("/fail"), "token", payload), "Webhook responded with status 500")
+        self.assertEqual(self.server.requests[0]["headers"]["X-AUTH-TOKEN"], "token")
+        self.assertEqual(self.server.requests[0]["headers"]["Content-Type"], "application/json")
+        self.assertEqual(json.loads(self.server.requests[0]["body"]), {"type": "incident_update"})
+
+    @mock.patch.dict(os.environ, {"WEBHOOK_READ_TIMEOUT": "0.2"})
+    def test_deliver_timeout(self):
+        start = time.time()
+        self.assertIn("Webhook failed", Webhook().deliver(self.server.get_url("/slow"), "token", "{}"))
+        self.assertLess(time.time() - start, 1)
+
+    @mock.patch.dict(os.environ, {"WEBHOOK_CONCURRENCY": "10", "WEBHOOK_CONNECTIONS_PER_HOST": "10"})
+    def test_deliver_many(self):
+        self.server.delay = 0.3
+        deliveries = [(self.server.get_url("/slow/%d" % i), "token", "{}") for i in range(10)]
+        deliveries.append((self.server.get_url("/fail"), "token", "{}"))
+
+        start = time.time()
+        errors = Webhook().deliver_many(deliveries)
+
+        # Deliveries are in flight together instead of one after another
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(errors[:10], [None] * 10)
+        self.assertIsNotNone(errors[10])
+        self.assertEqual(len(self.server.requests), 11)
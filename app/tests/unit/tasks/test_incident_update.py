@@ -0,0 +1,147 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import sys
+import json
+from unittest import mock
+
+# Third Party Library
+from django.test import TestCase
+from django.utils import timezone
+
+# Local Library
+from app.modules.core.task import Task
+from app.tasks.incident_update import incident_update
+from app.tasks.incident_update import fan_out_range
+from app.tasks.incident_update import finish_fan_out
+from app.tasks.incident_update import fail_fan_out
+from app.tasks.notify_subscriber import notify_subscribers
+from app.modules.core.subscriber import Subscriber
+from app.modules.entity.task_entity import TaskEntity
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.subscriber_entity import SubscriberEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
+from app.modules.entity.incident_update_notification_entity import IncidentUpdateNotificationEntity
+
+
+class Test_Incident_Update(TestCase):
+
+    def setUp(self):
+        Task._results = {}
+        incident = IncidentEntity().insert_one({
+            "name": "Website Down",
+            "uri": "website-down",
+            "status": "open",
+            "datetime": timezone.now()
+        })
+        self.update = IncidentUpdateEntity().insert_one({
+            "status": "investigating",
+            "datetime": timezone.now(),
+            "message": "We are investigating the issue.",
+            "incident_id": incident.id
+        })
+        self.subscribers = [SubscriberEntity().insert_one({
+            "type": "email",
+            "email": "joe%d@silverback.com" % i,
+            "status": "verified",
+            "external_id": "joe%d" % i
+        }) for i in range(10)]
+
+    def test_get_id_ranges(self):
+        first = self.subscribers[0].id
+        self.assertEqual(Subscriber().get_id_ranges(3), [(first, first + 3), (first + 4, first + 7), (first + 8, first + 9)])
+        self.assertEqual(Subscriber().get_id_ranges(20)[-1], (first + 9, first + 9))
+        self.assertEqual(Subscriber().get_id_ranges(2, "unverified"), [])
+
+    @mock.patch.dict(os.environ, {"NOTIFICATION_FANOUT_PARTITIONS": "3"})
+    @mock.patch.object(sys.modules["app.tasks.incident_update"], "chord")
+    def test_incident_update(self, chord):
+        incident_update.apply(args=(self.update.id, None), task_id="uuid")
+
+        partitions = list(chord.call_args[0][0])
+        self.assertEqual(len(partitions), 3)
+        self.assertEqual(partitions[0].args, (self.update.id, self.subscribers[0].id, self.subscribers[3].id))
+        callback = chord.return_value.call_args[0][0]
+        self.assertEqual(callback.args, (self.update.id, "uuid"))
+        self.assertEqual(callback.options["link_error"][0]["task"], fail_fan_out.name)
+        self.assertEqual(IncidentUpdateEntity().get_one_by_id(self.update.id).fanout_partitions, 3)
+
+    @mock.patch.dict(os.environ, {"NOTIFICATION_BATCH_SIZE": "2"})
+    @mock.patch.object(notify_subscribers, "apply_async")
+    def test_fan_out(self, apply_async):
+        TaskEntity().insert_one({
+            "uuid": "uuid",
+            "status": "pending",
+            "executor": "app.tasks.incident_update.incident_update",
+            "parameters": "{}",
+            "result": "{}",
+            "user_id": None
+        })
+        IncidentUpdateEntity().start_fanout(self.update.id, 2)
+
+        results = [
+            fan_out_range(self.update.id, self.subscribers[0].id, self.subscribers[4].id),
+            fan_out_range(self.update.id, self.subscribers[5].id, self.subscribers[9].id)
+        ]
+        self.assertEqual(results, [{"created": 5, "queued": 5}] * 2)
+        self.assertEqual(apply_async.call_count, 6)
+        self.assertEqual(apply_async.call_args[1]["queue"], "email")
+
+        # Partitions only cover their own subscribers
+        self.assertEqual(fan_out_range(self.update.id, self.subscribers[0].id, self.subscribers[4].id)["created"], 0)
+
+        finish_fan_out(results, self.update.id, "uuid")
+
+        update = IncidentUpdateEntity().get_one_by_id(self.update.id)
+        self.assertEqual(update.pending_notifications, 10)
+        self.assertEqual(update.fanout_partitions_done, 3)
+        self.assertIsNotNone(update.fanout_finished_at)
+        self.assertEqual(TaskEntity().get_one_by_uuid("uuid").status, "passed")
+        self.assertEqual(json.loads(TaskEntity().get_one_by_uuid("uuid").result), {"created": 10, "queued": 10})
+
+    def test_fail_fan_out(self):
+        TaskEntity().insert_one({
+            "uuid": "uuid",
+            "status": "pending",
+            "executor": "app.tasks.incident_update.incident_update",
+            "parameters": "{}",
+            "result": "{}",
+            "user_id": None
+        })
+        IncidentUpdateEntity().start_fanout(self.update.id, 2)
+
+        # Called as the chord errback with the failed callback ID
+        fail_fan_out("callback-id", incident_update_id=self.update.id, task_uuid="uuid")
+
+        self.assertIsNotNone(IncidentUpdateEntity().get_one_by_id(self.update.id).fanout_finished_at)
+        self.assertEqual(TaskEntity().get_one_by_uuid("uuid").status, "failed")
+
+    @mock.patch.object(notify_subscribers, "apply_async")
+    def test_fan_out_channel_queues(self, apply_async):
+        SubscriberEntity().update_one_by_id(self.subscribers[0].id, {"type": "phone", "phone": "+15550000000"})
+        SubscriberEntity().update_one_by_id(self.subscribers[1].id, {"type": "endpoint", "endpoint": "http://example.com/hook"})
+
+        fan_out_range(self.update.id, self.subscribers[0].id, self.subscribers[2].id)
+
+        queues = {
+            call[1]["queue"]: [IncidentUpdateNotificationEntity().get_one_by_id(id).subscriber_id for id in call[1]["args"][0]]
+            for call in apply_async.call_args_list
+        }
+        self.assertEqual(queues, {
+            "sms": [self.subscribers[0].id],
+            "webhook": [self.subscribers[1].id],
+            "email": [self.subscribers[2].id]
+        })
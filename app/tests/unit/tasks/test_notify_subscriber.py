@@ -0,0 +1,251 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+import json
+from io import StringIO
+from unittest import mock
+
+# Third Party Library
+from django.core import mail
+from django.test import TestCase
+from django.core.management import call_command
+from django.utils import timezone
+
+# Local Library
+from app.tests.stub_server import StubServer
+from app.tasks.notify_subscriber import notify_subscribers
+from app.modules.entity.option_entity import OptionEntity
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.subscriber_entity import SubscriberEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
+from app.modules.entity.incident_update_notification_entity import IncidentUpdateNotificationEntity
+from app.modules.core.incident_update_notification import IncidentUpdateNotification as IncidentUpdateNotificationModule
+
+
+class Test_Notify_Subscriber(TestCase):
+
+    def setUp(self):
+        OptionEntity().insert_many([
+            {"key": "app_name", "value": "Silverback"},
+            {"key": "app_email", "value": "hello@silverback.com"},
+            {"key": "app_url", "value": "http://silverback.com"}
+        ])
+        incident = IncidentEntity().insert_one({
+            "name": "Website Down",
+            "uri": "website-down",
+            "status": "open",
+            "datetime": timezone.now()
+        })
+        self.update = IncidentUpdateEntity().insert_one({
+            "status": "investigating",
+            "datetime": timezone.now(),
+            "message": "We are **investigating** the issue.",
+            "incident_id": incident.id
+        })
+
+    def __add_notification(self, email, status, endpoint=""):
+        subscriber = SubscriberEntity().insert_one({
+            "type": "endpoint" if endpoint else "email",
+            "email": email,
+            "endpoint": endpoint,
+            "auth_token": "token" if endpoint else "",
+            "status": "verified",
+            "external_id": email
+        })
+        return IncidentUpdateNotificationEntity().insert_one({
+            "status": status,
+            "incident_update_id": self.update.id,
+            "subscriber_id": subscriber.id
+        })
+
+    def test_notify_subscribers(self):
+        notifications = [
+            self.__add_notification("joe1@silverback.com", "pending"),
+            self.__add_notification("joe2@silverback.com", "failed"),
+            self.__add_notification("joe3@silverback.com", "success")
+        ]
+
+        result = notify_subscribers([notification.id for notification in notifications])
+
+        self.assertEqual(result["status"], "passed")
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertEqual(mail.outbox[0].to, ["joe1@silverback.com"])
+        self.assertEqual(mail.outbox[0].subject, "Silverback Incident Update: Website Down")
+        self.assertIn("<strong>investigating</strong>", mail.outbox[0].alternatives[0][0])
+        self.assertIn("We are investigating the issue.", mail.outbox[0].body)
+        self.assertIn("http://silverback.com/incidents/website-down", mail.outbox[0].body)
+        self.assertEqual(mail.outbox[0].body, mail.outbox[1].body)
+
+        notification_entity = IncidentUpdateNotificationEntity()
+        self.assertEqual(notification_entity.count_by_update_status(self.update.id, "success"), 3)
+        self.assertEqual(notification_entity.count_by_update_status(self.update.id, "pending"), 0)
+
+    def test_notify_subscribers_after_edit(self):
+        notification = self.__add_notification("joe1@silverback.com", "pending")
+        notify_subscribers([notification.id])
+
+        IncidentUpdateEntity().update_one_by_id(self.update.id, {"message": "Issue resolved."})
+        notification = self.__add_notification("joe2@silverback.com", "pending")
+        notify_subscribers([notification.id])
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn("Issue resolved.", mail.outbox[1].body)
+
+    def test_notify_subscribers_webhooks(self):
+        server = StubServer().start()
+        notifications = [
+            self.__add_notification("joe1@silverback.com", "pending", server.get_url("/hook")),
+            self.__add_notification("joe2@silverback.com", "pending", server.get_url("/fail")),
+            self.__add_notification("joe3@silverback.com", "pending")
+        ]
+
+        notify_subscribers([notification.id for notification in notifications])
+        server.stop()
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(len(server.requests), 2)
+        payload = json.loads(server.requests[0]["body"])
+        self.assertEqual(payload["incident"]["uri"], "website-down")
+        self.assertEqual(payload["update"]["message"], "We are **investigating** the issue.")
+        self.assertEqual(server.requests[0]["body"], server.requests[1]["body"])
+
+        notification_entity = IncidentUpdateNotificationEntity()
+        self.assertEqual(notification_entity.count_by_update_status(self.update.id, "success"), 2)
+        self.assertEqual(notification_entity.count_by_update_status(self.update.id, "failed"), 1)
+
+    def test_notify_subscribers_counters(self):
+        server = StubServer().start()
+        subscriber_ids = [SubscriberEntity().insert_one({
+            "type": "endpoint",
+            "endpoint": server.get_url(path),
+            "auth_token": "token",
+            "status": "verified",
+            "external_id": path
+        }).id for path in ["/hook1", "/hook2", "/fail"]]
+
+        IncidentUpdateNotificationModule().insert_many(self.update.id, subscriber_ids)
+        update = IncidentUpdateEntity().get_one_by_id(self.update.id)
+        self.assertEqual(update.pending_notifications, 3)
+
+        notify_subscribers(IncidentUpdateNotificationEntity().get_ids_by_update_status(self.update.id, ["pending"]))
+        server.stop()
+
+        update = IncidentUpdateEntity().get_one_by_id(self.update.id)
+        self.assertEqual(update.pending_notifications, 0)
+        self.assertEqual(update.sent_notifications, 2)
+        self.assertEqual(update.failed_notifications, 1)
+
+        IncidentUpdateEntity().update_counters(self.update.id, {"success": 5, "dead": 1})
+        call_command("notifications", "reconcile", stdout=StringIO())
+
+        update = IncidentUpdateEntity().get_one_by_id(self.update.id)
+        self.assertEqual(update.sent_notifications, 2)
+        self.assertEqual(update.failed_notifications, 1)
+        self.assertEqual(update.dead_notifications, 0)
+
+    @mock.patch.dict(os.environ, {"NOTIFICATION_DELIVERY_MODE": "database", "NOTIFICATION_BATCH_SIZE": "2"})
+    def test_delivery_workers(self):
+        subscriber_ids = [SubscriberEntity().insert_one({
+            "type": "email",
+            "email": "joe%d@silverback.com" % i,
+            "status": "verified",
+            "external_id": "joe%d" % i
+        }).id for i in range(3)]
+        IncidentUpdateNotificationModule().insert_many(self.update.id, subscriber_ids)
+        self.assertEqual(IncidentUpdateNotificationModule().count_claimable(), 3)
+
+        call_command("notifications", "work", "--once", stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(IncidentUpdateNotificationModule().count_claimable(), 0)
+        self.assertEqual(IncidentUpdateEntity().get_one_by_id(self.update.id).sent_notifications, 3)
+
+    @mock.patch.dict(os.environ, {"NOTIFICATION_COALESCE_WINDOW_EMAIL": "60"})
+    def test_coalesce_notifications(self):
+        subscriber = SubscriberEntity().insert_one({
+            "type": "email",
+            "email": "joe1@silverback.com",
+            "status": "verified",
+            "external_id": "joe1"
+        })
+        later_update = IncidentUpdateEntity().insert_one({
+            "status": "identified",
+            "datetime": timezone.now(),
+            "message": "The issue is **identified**.",
+            "incident_id": self.update.incident_id
+        })
+        module = IncidentUpdateNotificationModule()
+        module.insert_many(self.update.id, [subscriber.id])
+        module.insert_many(later_update.id, [subscriber.id])
+
+        # Notifications are held for the coalescing window
+        self.assertEqual(module.count_claimable(), 0)
+
+        result = notify_subscribers(
+            IncidentUpdateNotificationEntity().get_ids_by_update_status(self.update.id, ["pending"]) +
+            IncidentUpdateNotificationEntity().get_ids_by_update_status(later_update.id, ["pending"])
+        )
+
+        self.assertEqual(json.loads(result["result"]), {"success": 1, "failed": 0, "dead": 0, "coalesced": 1})
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn("The issue is identified.", mail.outbox[0].body)
+        self.assertIn("Earlier updates:\n- Investigating - ", mail.outbox[0].body)
+        self.assertEqual(IncidentUpdateEntity().get_one_by_id(self.update.id).coalesced_notifications, 1)
+        self.assertEqual(IncidentUpdateEntity().get_one_by_id(self.update.id).pending_notifications, 0)
+        self.assertEqual(IncidentUpdateEntity().get_one_by_id(later_update.id).sent_notifications, 1)
+
+        # A late delivery of the earlier update is dropped as well
+        notify_subscribers(IncidentUpdateNotificationEntity().get_ids_by_update_status(self.update.id, ["coalesced"]))
+        self.assertEqual(len(mail.outbox), 1)
+
+    @mock.patch.dict(os.environ, {"NOTIFICATION_COALESCE_WINDOW_EMAIL": "60", "NOTIFICATION_MAX_ATTEMPTS": "1"})
+    def test_reopen_coalesced_notifications(self):
+        subscriber = SubscriberEntity().insert_one({
+            "type": "email",
+            "email": "joe1@silverback.com",
+            "status": "verified",
+            "external_id": "joe1"
+        })
+        later_update = IncidentUpdateEntity().insert_one({
+            "status": "identified",
+            "datetime": timezone.now(),
+            "message": "The issue is **identified**.",
+            "incident_id": self.update.incident_id
+        })
+        module = IncidentUpdateNotificationModule()
+        module.insert_many(self.update.id, [subscriber.id])
+        module.insert_many(later_update.id, [subscriber.id])
+        earlier_id = IncidentUpdateNotificationEntity().get_ids_by_update_status(self.update.id, ["pending"])[0]
+        later = IncidentUpdateNotificationEntity().get_many_by_ids(
+            IncidentUpdateNotificationEntity().get_ids_by_update_status(later_update.id, ["pending"])
+        )
+
+        # A failed later notification does not supersede the earlier one
+        IncidentUpdateNotificationEntity().update_one_by_id(later[0].id, {"status": "failed"})
+        superseded, changes = module.get_changes(IncidentUpdateNotificationEntity().get_many_by_ids([earlier_id]))
+        self.assertEqual(superseded, [])
+
+        # Earlier updates coalesced into a dead-lettered notification are retried
+        IncidentUpdateNotificationEntity().update_one_by_id(later[0].id, {"status": "pending"})
+        module.coalesce_many(IncidentUpdateNotificationEntity().get_many_by_ids([earlier_id]))
+        module.record_attempts([(later[0], "Connection refused")])
+
+        earlier = IncidentUpdateNotificationEntity().get_one_by_id(earlier_id)
+        self.assertEqual(earlier.status, "failed")
+        self.assertIsNotNone(earlier.next_attempt_at)
+        self.assertEqual(IncidentUpdateEntity().get_one_by_id(later_update.id).dead_notifications, 1)
+        self.assertEqual(IncidentUpdateEntity().get_one_by_id(self.update.id).failed_notifications, 1)
+        self.assertEqual(IncidentUpdateEntity().get_one_by_id(self.update.id).coalesced_notifications, 0)
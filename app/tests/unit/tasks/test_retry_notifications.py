@@ -0,0 +1,113 @@
+# Copyright 2019 Silverbackhq
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Standard Library
+import os
+from unittest import mock
+from datetime import timedelta
+
+# Third Party Library
+from django.test import TestCase
+from django.utils import timezone
+
+# Local Library
+from app.tests.stub_server import StubServer
+from app.tasks.notify_subscriber import notify_subscribers
+from app.tasks.retry_notifications import retry_notifications
+from app.tasks.retry_notifications import redrive_notifications
+from app.modules.entity.option_entity import OptionEntity
+from app.modules.entity.incident_entity import IncidentEntity
+from app.modules.entity.subscriber_entity import SubscriberEntity
+from app.modules.entity.incident_update_entity import IncidentUpdateEntity
+from app.modules.entity.incident_update_notification_entity import IncidentUpdateNotificationEntity
+
+
+class Test_Retry_Notifications(TestCase):
+
+    def setUp(self):
+        OptionEntity().insert_many([
+            {"key": "app_name", "value": "Silverback"},
+            {"key": "app_email", "value": "hello@silverback.com"},
+            {"key": "app_url", "value": "http://silverback.com"}
+        ])
+        incident = IncidentEntity().insert_one({
+            "name": "Website Down",
+            "uri": "website-down",
+            "status": "open",
+            "datetime": timezone.now()
+        })
+        self.update = IncidentUpdateEntity().insert_one({
+            "status": "investigating",
+            "datetime": timezone.now(),
+            "message": "We are investigating the issue.",
+            "incident_id": incident.id
+        })
+        self.server = StubServer().start()
+        subscriber = SubscriberEntity().insert_one({
+            "type": "endpoint",
+            "email": "",
+            "endpoint": self.server.get_url("/fail"),
+            "auth_token": "token",
+            "status": "verified",
+            "external_id": "hook"
+        })
+        self.notification = IncidentUpdateNotificationEntity().insert_one({
+            "status": "pending",
+            "incident_update_id": self.update.id,
+            "subscriber_id": subscriber.id
+        })
+
+    def tearDown(self):
+        self.server.stop()
+
+    @mock.patch.dict(os.environ, {"NOTIFICATION_MAX_ATTEMPTS": "2", "NOTIFICATION_RETRY_DELAY": "60"})
+    @mock.patch.object(notify_subscribers, "apply_async")
+    def test_retry_until_dead(self, apply_async):
+        notification_entity = IncidentUpdateNotificationEntity()
+
+        notify_subscribers([self.notification.id])
+        notification = notification_entity.get_one_by_id(self.notification.id)
+        self.assertEqual(notification.status, "failed")
+        self.assertEqual(notification.attempts, 1)
+        self.assertEqual(notification.last_error, "Webhook responded with status 500")
+        self.assertGreater(notification.next_attempt_at, timezone.now() + timedelta(seconds=29))
+        self.assertLess(notification.next_attempt_at, timezone.now() + timedelta(seconds=61))
+
+        # Not due yet
+        retry_notifications()
+        apply_async.assert_not_called()
+
+        notification_entity.update_many_next_attempt_by_ids([notification.id], timezone.now() - timedelta(seconds=1))
+        retry_notifications()
+        apply_async.assert_called_once_with(args=[[notification.id]], queue="webhook", priority=5, countdown=0)
+
+        # Claimed retries are not queued twice
+        retry_notifications()
+        self.assertEqual(apply_async.call_count, 1)
+
+        notify_subscribers([self.notification.id])
+        notification = notification_entity.get_one_by_id(self.notification.id)
+        self.assertEqual(notification.status, "dead")
+        self.assertEqual(notification.attempts, 2)
+        self.assertIsNone(notification.next_attempt_at)
+
+        # Dead-lettered notifications are left alone until re-driven
+        notify_subscribers([self.notification.id])
+        self.assertEqual(len(self.server.requests), 2)
+
+        redrive_notifications(self.update.id)
+        apply_async.assert_called_with(args=[[notification.id]], queue="webhook", priority=5, countdown=0)
+        notification = notification_entity.get_one_by_id(self.notification.id)
+        self.assertEqual(notification.status, "pending")
+        self.assertEqual(notification.attempts, 0)
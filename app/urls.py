@@ -80,6 +80,7 @@ from app.controllers.api.private.v1.admin.incident import Incidents as Incidents
 from app.controllers.api.private.v1.admin.incident_update import IncidentUpdate as IncidentUpdateAdminV1EndpointPrivate
 from app.controllers.api.private.v1.admin.incident_update import IncidentUpdates as IncidentUpdatesAdminV1EndpointPrivate
 from app.controllers.api.private.v1.admin.incident_update import IncidentUpdatesNotify as IncidentUpdatesNotifyAdminV1EndpointPrivate
+from app.controllers.api.private.v1.admin.incident_update import IncidentUpdatesRedrive as IncidentUpdatesRedriveAdminV1EndpointPrivate
 from app.controllers.api.private.v1.admin.incident_update import IncidentUpdatesComponents as IncidentUpdatesComponentsAdminV1EndpointPrivate
 from app.controllers.api.private.v1.admin.incident_update import IncidentUpdatesComponent as IncidentUpdatesComponentAdminV1EndpointPrivate
 from app.controllers.api.private.v1.admin.metric import Metric as MetricAdminV1EndpointPrivate
@@ -91,6 +92,9 @@ from app.controllers.api.private.v1.admin.activity import Activities as Activiti
 from app.controllers.api.private.v1.admin.builder import BuilderSettings as BuilderSettingsAdminV1EndpointPrivate
 from app.controllers.api.private.v1.admin.builder import BuilderComponents as BuilderComponentsAdminV1EndpointPrivate
 from app.controllers.api.private.v1.admin.builder import BuilderSystemMetrics as BuilderSystemMetricsAdminV1EndpointPrivate
+from app.controllers.api.public.v1.status import Summary as SummaryV1EndpointPublic
+from app.controllers.api.public.v1.status import Components as ComponentsV1EndpointPublic
+from app.controllers.api.public.v1.status import Incidents as IncidentsV1EndpointPublic
 
 
 urlpatterns = [
@@ -235,6 +239,11 @@ urlpatterns = [
                 IncidentUpdatesNotifyAdminV1EndpointPrivate.as_view(),
                 name='app.api.private.v1.admin.incident_update.notify.endpoint'
             ),
+            path(
+                'incident-update/<int:incident_id>/<int:update_id>/redrive',
+                IncidentUpdatesRedriveAdminV1EndpointPrivate.as_view(),
+                name='app.api.private.v1.admin.incident_update.redrive.endpoint'
+            ),
             path(
                 'incident-update/<int:incident_id>/<int:update_id>/components',
                 IncidentUpdatesComponentsAdminV1EndpointPrivate.as_view(),
@@ -306,7 +315,9 @@ urlpatterns = [
 
     # Public API V1 Endpoints
     path('api/public/v1/', include([
-
+        path('summary.json', SummaryV1EndpointPublic.as_view(), name='app.api.public.v1.summary.endpoint'),
+        path('components.json', ComponentsV1EndpointPublic.as_view(), name='app.api.public.v1.components.endpoint'),
+        path('incidents.json', IncidentsV1EndpointPublic.as_view(), name='app.api.public.v1.incidents.endpoint'),
     ]))
 ]
 